@@ -0,0 +1,3 @@
+from Bench_Marker.core.suite import main
+
+main()
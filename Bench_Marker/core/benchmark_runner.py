@@ -1,86 +1,238 @@
-import time
 import json
 import os
-import psutil
+import platform
 from statistics import mean
 from datetime import datetime
 
+from Bench_Marker.core.measurement import (
+    HOOKS, warmup as run_warmup, calibrate, collect_samples, cold_call, run_setup, run_teardown
+)
+from Bench_Marker.core.isolation import run_isolated, ISOLATION_MODES
+from Bench_Marker.core.memory import profile_memory
+from Bench_Marker.core.stats import summarize, remove_outliers, pick_winner
+from Bench_Marker.core.history import record_run, current_commit
 
-process = psutil.Process()
 
+MEMORY_MODES = ("rss", "tracemalloc")
 
-def benchmark_methods(task_name, methods, data=None, runs=10):
+# Below this CPU-time / wall-time ratio a method spends most of its time
+# waiting (network, disk, locks) rather than computing.
+CPU_BOUND_RATIO = 0.5
+
+
+def benchmark_methods(task_name, methods, data=None, runs=10, warmup=3,
+                      min_sample_time=0.005, confidence=0.95, alpha=0.05,
+                      isolation=None, cpus=None, memory="tracemalloc", memory_runs=3,
+                      history=True, save=True, verbose=True):
     """
     Benchmark a list of methods performing the same task.
 
+    Each method is warmed up, then the number of calls per sample is
+    calibrated so one sample lasts at least `min_sample_time` seconds.
+    `runs` samples are collected and outliers (Tukey fences) are dropped
+    before computing statistics.
+
     Measures:
-      - Execution time
-      - CPU usage
-      - Memory usage
+      - Execution time (per call: mean, median, stddev, MAD, percentiles,
+        bootstrap confidence interval of the median)
+      - CPU time: user/system/thread CPU seconds per call, CPU-time to
+        wall-time ratio and context switches (see summarize_cpu)
+      - Memory usage: RSS delta per sample, plus (memory="tracemalloc") a
+        separate tracemalloc pass reporting peak and net allocated bytes,
+        allocated block count and the top allocating source lines
+
+    The fastest method is only declared when its timings are significantly
+    lower (Mann-Whitney U, p < alpha) than every other method.
+
+    Isolation:
+      - isolation=None     : everything runs in this process (default)
+      - isolation="method" : each method runs in its own fresh process
+      - isolation="run"    : each repetition runs in its own fresh process
+      cpus, if given, is a list of CPU ids; workers are pinned to them
+      round-robin so every method gets a dedicated core.
+
+    Hooks:
+      methods may be (name, func, hooks) where hooks is a dict with any of
+      setup(data) -> state, teardown(state), before_each(state) and
+      after_each(state) (see measurement.HOOKS). With a setup hook func is
+      called with its state instead of data. Hook time is never part of the
+      timings; each entry reports it under "cold" (setup, the first call on
+      its own and teardown) and "hook_time" (per-iteration hooks, per call),
+      next to the steady-state median. The first call is timed on its own
+      whenever warmup > 0, hooks or not.
 
-    Prints best method for each metric based on averages.
+    With save=True results are written to results/<task_name>/ and, with
+    history=True, also recorded in the history store (see
+    Bench_Marker.core.history) together with the git commit and host.
     """
 
+    if isolation not in ISOLATION_MODES:
+        raise ValueError(f"isolation must be one of {ISOLATION_MODES}")
+    if memory not in MEMORY_MODES:
+        raise ValueError(f"memory must be one of {MEMORY_MODES}")
+    traced_runs = memory_runs if memory == "tracemalloc" else 0
+
     results = {
         "task": task_name,
         "runs": runs,
+        "warmup": warmup,
+        "isolation": isolation,
+        "memory": memory,
         "timestamp": datetime.utcnow().isoformat(),
+        "git_commit": current_commit(),
+        "host": platform.node(),
+        "python": platform.python_version(),
         "results": []
     }
 
-    for name, func in methods:
-        timings = []
-        cpu_usages = []
-        memory_usages = []
-
-        for _ in range(runs):
-            # CPU baseline
-            process.cpu_percent(interval=None)
+    clean_timings = {}
 
-            mem_before = process.memory_info().rss
-            start = time.perf_counter()
+    for index, method in enumerate(methods):
+        name, func = method[0], method[1]
+        hooks = method[2] if len(method) > 2 else {}
+        unknown = set(hooks) - set(HOOKS)
+        if unknown:
+            raise ValueError(f"{name}: unknown hooks {sorted(unknown)}; expected {HOOKS}")
+        each = {"before_each": hooks.get("before_each"), "after_each": hooks.get("after_each")}
+        cpu = cpus[index % len(cpus)] if cpus else None
 
-            func(data)
+        if isolation:
+            samples, workers = run_isolated(
+                func, data, runs, mode=isolation, cpu=cpu, warmup=warmup,
+                min_sample_time=min_sample_time, memory_runs=traced_runs, hooks=hooks,
+            )
+            loops = workers[0]["loops"]
+            memory_profile = workers[0]["memory"]
+            cold = workers[0]["cold"]
+        else:
+            workers = None
+            state, setup_time = run_setup(hooks, data)
+            cold = {"setup_time": setup_time, "first_call_time": None}
+            try:
+                if warmup:
+                    cold["first_call_time"] = cold_call(func, state, **each)
+                run_warmup(func, state, max(0, warmup - 1), **each)
+                loops = calibrate(func, state, min_sample_time=min_sample_time, **each)
+                samples = collect_samples(func, state, runs, loops, **each)
+                memory_profile = (profile_memory(func, state, runs=traced_runs, **each)
+                                  if traced_runs else None)
+            finally:
+                cold["teardown_time"] = run_teardown(hooks, state)
 
-            end = time.perf_counter()
-            mem_after = process.memory_info().rss
-            cpu_after = process.cpu_percent(interval=None)
+        timings = [s["time"] for s in samples]
+        memory_usages = [s["memory"] for s in samples]
 
-            timings.append(end - start)
-            cpu_usages.append(cpu_after)
-            memory_usages.append(mem_after - mem_before)
+        kept, outliers = remove_outliers(timings)
+        clean_timings[name] = kept
+        stats = summarize(kept, confidence=confidence)
 
-        results["results"].append({
+        entry = {
             "method": name,
-            "avg_time": mean(timings),
-            "avg_cpu": mean(cpu_usages),
+            "loops": loops,
+            "avg_time": stats["mean"],
+            "median_time": stats["median"],
+            "avg_cpu_time": mean(s["cpu_process"] for s in samples),
+            "cpu": summarize_cpu(samples),
             "avg_memory_bytes": mean(memory_usages),
             "min_time": min(timings),
             "max_time": max(timings),
-        })
+            "outliers_removed": outliers,
+            "time_stats": stats,
+            "timings": kept,
+            "cold": cold,
+            "hook_time": mean(s["hook_time"] for s in samples),
+        }
+        if memory_profile:
+            entry["tracemalloc"] = memory_profile
+        if workers:
+            entry["workers"] = workers
+        results["results"].append(entry)
 
     # Decide best methods
-    best_time = min(results["results"], key=lambda x: x["avg_time"])
-    best_cpu = min(results["results"], key=lambda x: x["avg_cpu"])
-    best_memory = min(results["results"], key=lambda x: x["avg_memory_bytes"])
+    fastest, p_values = pick_winner(clean_timings, alpha=alpha)
+    best_cpu = min(results["results"], key=lambda x: x["avg_cpu_time"])
+    if traced_runs:
+        best_memory = min(results["results"], key=lambda x: x["tracemalloc"]["peak_bytes"])
+    else:
+        best_memory = min(results["results"], key=lambda x: x["avg_memory_bytes"])
 
     results["best"] = {
-        "time": best_time["method"],
+        "time": fastest,
         "cpu": best_cpu["method"],
         "memory": best_memory["method"],
     }
+    results["significance"] = {
+        "test": "mann_whitney_u",
+        "alpha": alpha,
+        "p_values": p_values,
+    }
+
+    if verbose:
+        print_summary(results)
+
+    if save:
+        save_results(task_name, results)
+        if history:
+            record_run(results)
 
-    # Print summary
+    return results
+
+
+def print_summary(results):
+    """
+    Print the per-method statistics and the best method for each metric.
+    """
     print("\n📊 Benchmark Summary")
     print("-" * 40)
-    print(f"🏆 Fastest method       : {best_time['method']}")
-    print(f"🧠 Lowest CPU usage     : {best_cpu['method']}")
-    print(f"💾 Lowest memory usage  : {best_memory['method']}")
+    for r in results["results"]:
+        low, high = r["time_stats"]["median_ci"]
+        print(f"   {r['method']:<20}: median {r['median_time']:.6e}s "
+              f"[{low:.6e}, {high:.6e}] x{r['loops']}")
+        cpu = r["cpu"]
+        print(f"   {'':<20}  cpu {r['avg_cpu_time']:.6e}s/call, "
+              f"ratio {cpu['cpu_wall_ratio']:.2f} ({cpu['bound']}-bound), "
+              f"{cpu['ctx_voluntary']:.1f}/{cpu['ctx_involuntary']:.1f} ctx switches")
+        cold = r.get("cold")
+        if cold:
+            first = cold["first_call_time"]
+            first_text = f"{first:.6e}s" if first is not None else "-"
+            print(f"   {'':<20}  cold: setup {cold['setup_time']:.6e}s, first call {first_text}, "
+                  f"teardown {cold['teardown_time']:.6e}s, hooks {r['hook_time']:.6e}s/call")
+        if "tracemalloc" in r:
+            traced = r["tracemalloc"]
+            print(f"   {'':<20}  peak {traced['peak_bytes']:,.0f} B, "
+                  f"net {traced['net_bytes']:,.0f} B, {traced['allocations']:,.0f} blocks")
+    fastest = results["best"]["time"]
+    if fastest:
+        print(f"🏆 Fastest method       : {fastest}")
+    else:
+        print("🏆 Fastest method       : no significant difference")
+    print(f"🧠 Lowest CPU usage     : {results['best']['cpu']}")
+    print(f"💾 Lowest memory usage  : {results['best']['memory']}")
     print("-" * 40)
 
-    save_results(task_name, results)
 
-    return results
+def summarize_cpu(samples):
+    """
+    CPU accounting for one method, all values per call.
+
+    The CPU/wall ratio is computed over the totals of all samples, so short
+    calls below the OS tick resolution still add up to a meaningful value.
+    """
+    wall = sum(s["time"] for s in samples)
+    cpu_total = sum(s["cpu_process"] for s in samples)
+    ratio = cpu_total / wall if wall else 0.0
+
+    return {
+        "user": mean(s["cpu_user"] for s in samples),
+        "system": mean(s["cpu_system"] for s in samples),
+        "process": mean(s["cpu_process"] for s in samples),
+        "thread": mean(s["thread_cpu"] for s in samples),
+        "cpu_wall_ratio": ratio,
+        "ctx_voluntary": mean(s["ctx_voluntary"] for s in samples),
+        "ctx_involuntary": mean(s["ctx_involuntary"] for s in samples),
+        "bound": "cpu" if ratio >= CPU_BOUND_RATIO else "io_wait",
+    }
 
 
 def save_results(task_name, results):
@@ -0,0 +1,197 @@
+import json
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from statistics import median
+
+from Bench_Marker.core.benchmark_runner import save_results
+from Bench_Marker.core.history import record_run, current_commit
+from Bench_Marker.core.quiz_app import QUIZ_APP_DIR
+from Bench_Marker.core.stats import summarize
+
+# Third-party packages app.py pulls in before it builds the app.
+QUIZ_APP_DEPENDENCIES = ("flask", "flask_sqlalchemy", "flask_login", "flask_wtf",
+                         "flask_profiler", "sqlalchemy", "werkzeug.security")
+
+# "import time: <self us> | <cumulative us> | <indent><module>"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+# Runs inside a fresh interpreter; prints one JSON line of timings.
+_QUIZ_APP_PROBE = """
+import importlib, json, sys, time
+sys.path.insert(0, {app_dir!r})
+t0 = time.perf_counter()
+for name in {dependencies!r}:
+    importlib.import_module(name)
+t1 = time.perf_counter()
+import app as quiz_app
+t2 = time.perf_counter()
+client = quiz_app.app.test_client()
+first = client.get({path!r})
+t3 = time.perf_counter()
+second = client.get({path!r})
+t4 = time.perf_counter()
+print(json.dumps({{
+    "dependencies": t1 - t0,
+    "construct": t2 - t1,
+    "first_request": t3 - t2,
+    "second_request": t4 - t3,
+    "status": first.status_code,
+}}))
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Parse `python -X importtime` output.
+
+    Returns one dict per imported module, in import-completion order:
+    module, self_us, cumulative_us and depth (0 = imported directly).
+    """
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append({
+                "module": module,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": max(0, (len(indent) - 1) // 2),
+            })
+    return entries
+
+
+def _run(args, cwd=None, timeout=120):
+    """
+    Run a fresh interpreter. Returns (completed process, wall seconds).
+    """
+    start = time.perf_counter()
+    proc = subprocess.run(args, capture_output=True, text=True, cwd=cwd, timeout=timeout)
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited with {proc.returncode}:\n{proc.stderr[-2000:]}")
+    return proc, wall
+
+
+def interpreter_startup(runs=10, python=sys.executable):
+    """
+    Wall seconds of `python -c pass`: the floor every cold start pays.
+    """
+    return [_run([python, "-c", "pass"])[1] for _ in range(runs)]
+
+
+def measure_import(module, runs=10, python=sys.executable, top=10):
+    """
+    Import `module` in `runs` fresh interpreters under -X importtime.
+
+    Returns:
+      - samples : cumulative import time of module per run, in seconds
+      - wall    : process wall time per run, in seconds
+      - top_self: the `top` modules with the highest median self time (us)
+    """
+    samples, wall = [], []
+    self_times = {}
+
+    for _ in range(runs):
+        proc, elapsed = _run([python, "-X", "importtime", "-c", f"import {module}"])
+        entries = parse_importtime(proc.stderr)
+        wall.append(elapsed)
+        root = [e for e in entries if e["module"] == module and e["depth"] == 0]
+        samples.append(root[-1]["cumulative_us"] / 1e6 if root else 0.0)
+        for e in entries:
+            self_times.setdefault(e["module"], []).append(e["self_us"])
+
+    top_self = sorted(
+        ({"module": name, "self_us": median(values)} for name, values in self_times.items()),
+        key=lambda e: e["self_us"], reverse=True
+    )[:top]
+    return {"module": module, "samples": samples, "wall": wall, "top_self": top_self}
+
+
+def measure_quiz_app(runs=10, path="/login", python=sys.executable, app_dir=QUIZ_APP_DIR):
+    """
+    Build the quiz app in `runs` fresh interpreters and issue its first
+    request through the Flask test client.
+
+    Returns lists of seconds per phase: dependencies (third-party imports),
+    construct (importing app.py, which builds the app), first_request,
+    second_request and process (interpreter wall time).
+
+    Each run uses an empty working directory so the profiler database the
+    app creates on import does not accumulate between runs.
+    """
+    code = _QUIZ_APP_PROBE.format(
+        app_dir=app_dir, dependencies=QUIZ_APP_DEPENDENCIES, path=path
+    )
+    phases = {"dependencies": [], "construct": [], "first_request": [],
+              "second_request": [], "process": []}
+
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory(prefix="bench_coldstart_") as work_dir:
+            proc, wall = _run([python, "-c", code], cwd=work_dir)
+        timings = json.loads(proc.stdout.strip().splitlines()[-1])
+        if timings["status"] >= 500:
+            raise RuntimeError(f"{path} returned {timings['status']}")
+        for phase in phases:
+            if phase != "process":
+                phases[phase].append(timings[phase])
+        phases["process"].append(wall)
+
+    return phases
+
+
+def cold_start_results(task_name, series, confidence=0.95, extra=None):
+    """
+    Turn {name: [seconds, ...]} into a result dict in the benchmark_methods
+    format, so it can be saved and compared with the history store.
+    Cold-start samples are kept as measured: slow runs are real cold starts,
+    so no outliers are dropped.
+    """
+    results = {
+        "task": task_name,
+        "runs": max(len(v) for v in series.values()),
+        "isolation": "process",
+        "timestamp": datetime.utcnow().isoformat(),
+        "git_commit": current_commit(),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "results": [],
+    }
+    for name, values in series.items():
+        stats = summarize(values, confidence=confidence)
+        results["results"].append({
+            "method": name,
+            "avg_time": stats["mean"],
+            "median_time": stats["median"],
+            "min_time": min(values),
+            "max_time": max(values),
+            "time_stats": stats,
+            "timings": values,
+        })
+    if extra:
+        results.update(extra)
+    return results
+
+
+def print_cold_start(results):
+    print("\n📊 Cold Start Summary")
+    print("-" * 40)
+    for r in results["results"]:
+        low, high = r["time_stats"]["median_ci"]
+        print(f"   {r['method']:<32}: median {r['median_time'] * 1000:9.2f}ms "
+              f"[{low * 1000:.2f}, {high * 1000:.2f}]  max {r['max_time'] * 1000:9.2f}ms")
+    print("-" * 40)
+
+
+def record_cold_start(results, history=True):
+    """
+    Save results/<task>/ JSON and add the run to the history store.
+    """
+    save_results(results["task"], results)
+    if history:
+        record_run(results)
@@ -0,0 +1,295 @@
+import argparse
+import glob
+import json
+import os
+import sqlite3
+import subprocess
+from datetime import datetime
+from statistics import median
+
+from Bench_Marker.core.stats import mann_whitney_u
+
+
+DEFAULT_DB = os.environ.get(
+    "BENCH_HISTORY_DB",
+    os.path.join(os.path.dirname(__file__), "..", "results", "history.sqlite"),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    task TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    git_commit TEXT,
+    host TEXT,
+    python TEXT
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    method TEXT NOT NULL,
+    median_time REAL,
+    mean_time REAL,
+    stddev_time REAL,
+    cpu_time REAL,
+    peak_bytes REAL,
+    timings TEXT,
+    PRIMARY KEY (run_id, method)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_task ON runs(task, timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_commit ON runs(git_commit);
+CREATE INDEX IF NOT EXISTS idx_measurements_method ON measurements(method);
+"""
+
+
+def connect(db_path=DEFAULT_DB):
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def current_commit():
+    """
+    Short git commit of the working tree, or None outside a git checkout.
+    """
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def record_run(results, db_path=DEFAULT_DB):
+    """
+    Store one benchmark_methods() result dict. Returns the new run id.
+    """
+    conn = connect(db_path)
+    try:
+        with conn:
+            cur = conn.execute(
+                "INSERT INTO runs (task, timestamp, git_commit, host, python) VALUES (?, ?, ?, ?, ?)",
+                (
+                    results["task"],
+                    results.get("timestamp") or datetime.utcnow().isoformat(),
+                    results.get("git_commit"),
+                    results.get("host"),
+                    results.get("python"),
+                ),
+            )
+            run_id = cur.lastrowid
+            conn.executemany(
+                "INSERT INTO measurements VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        r["method"],
+                        r.get("median_time"),
+                        r.get("avg_time"),
+                        r.get("time_stats", {}).get("stddev"),
+                        r.get("avg_cpu_time"),
+                        r.get("tracemalloc", {}).get("peak_bytes"),
+                        json.dumps(r.get("timings", [])),
+                    )
+                    for r in results["results"]
+                ],
+            )
+        return run_id
+    finally:
+        conn.close()
+
+
+def _already_recorded(conn, results):
+    return conn.execute(
+        "SELECT 1 FROM runs WHERE task = ? AND timestamp = ? AND host IS ?",
+        (results["task"], results.get("timestamp"), results.get("host")),
+    ).fetchone() is not None
+
+
+def import_json_results(results_dir, db_path=DEFAULT_DB):
+    """
+    Backfill the history store from results/<task>/*.json files. Runs
+    already stored (same task, timestamp and host) are skipped, so
+    importing the same directory twice adds nothing.
+    """
+    count = 0
+    conn = connect(db_path)
+    try:
+        for path in sorted(glob.glob(os.path.join(results_dir, "*", "*.json"))):
+            with open(path, encoding="utf-8") as f:
+                results = json.load(f)
+            if "task" not in results or "results" not in results:
+                continue
+            if results.get("timestamp") and _already_recorded(conn, results):
+                continue
+            record_run(results, db_path=db_path)
+            count += 1
+    finally:
+        conn.close()
+    return count
+
+
+def list_runs(task=None, limit=20, db_path=DEFAULT_DB):
+    conn = connect(db_path)
+    try:
+        query = "SELECT * FROM runs"
+        params = []
+        if task:
+            query += " WHERE task = ?"
+            params.append(task)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        return [dict(r) for r in conn.execute(query, params)]
+    finally:
+        conn.close()
+
+
+def _resolve_run(conn, task, ref, host=None):
+    """
+    Find a run id for task. ref may be "#<run id>", a git commit prefix,
+    "latest" or "previous" (the run before the latest one). With host,
+    only runs recorded on that host match.
+    """
+    host_clause = " AND host = ?" if host else ""
+    host_params = [host] if host else []
+
+    if ref in ("latest", "previous"):
+        offset = 0 if ref == "latest" else 1
+        row = conn.execute(
+            f"SELECT id FROM runs WHERE task = ?{host_clause} ORDER BY id DESC LIMIT 1 OFFSET ?",
+            [task, *host_params, offset],
+        ).fetchone()
+    elif str(ref).startswith("#") and str(ref)[1:].isdigit():
+        row = conn.execute(
+            f"SELECT id FROM runs WHERE task = ? AND id = ?{host_clause}",
+            [task, int(str(ref)[1:]), *host_params],
+        ).fetchone()
+    else:
+        row = conn.execute(
+            f"SELECT id FROM runs WHERE task = ? AND git_commit LIKE ?{host_clause} "
+            "ORDER BY id DESC LIMIT 1",
+            [task, f"{ref}%", *host_params],
+        ).fetchone()
+
+    if row is None:
+        raise LookupError(f"No run found for task={task!r} ref={ref!r}")
+    return row["id"]
+
+
+def _load_measurements(conn, run_id):
+    rows = conn.execute("SELECT * FROM measurements WHERE run_id = ?", (run_id,))
+    return {r["method"]: dict(r, timings=json.loads(r["timings"] or "[]")) for r in rows}
+
+
+def compare(task, baseline="previous", candidate="latest", threshold=0.05,
+            alpha=0.05, host=None, db_path=DEFAULT_DB):
+    """
+    Compare two runs of a task method by method.
+
+    A method is a regression when its median time grew by more than
+    `threshold` (0.15 = 15%) AND the Mann-Whitney U test on the stored
+    timings is significant at `alpha`. Improvements are reported the same
+    way in the other direction.
+    """
+    conn = connect(db_path)
+    try:
+        base_id = _resolve_run(conn, task, baseline, host)
+        cand_id = _resolve_run(conn, task, candidate, host)
+        base = _load_measurements(conn, base_id)
+        cand = _load_measurements(conn, cand_id)
+    finally:
+        conn.close()
+
+    rows = []
+    for method in sorted(set(base) & set(cand)):
+        b, c = base[method], cand[method]
+        b_median = median(b["timings"]) if b["timings"] else b["median_time"]
+        c_median = median(c["timings"]) if c["timings"] else c["median_time"]
+        change = (c_median - b_median) / b_median if b_median else 0.0
+
+        p_value = None
+        if len(b["timings"]) > 1 and len(c["timings"]) > 1:
+            _, p_value = mann_whitney_u(b["timings"], c["timings"])
+        significant = p_value is not None and p_value < alpha
+
+        if significant and change > threshold:
+            status = "regression"
+        elif significant and change < -threshold:
+            status = "improvement"
+        else:
+            status = "unchanged"
+
+        rows.append({
+            "method": method,
+            "baseline_median": b_median,
+            "candidate_median": c_median,
+            "change": change,
+            "p_value": p_value,
+            "status": status,
+        })
+
+    return {
+        "task": task,
+        "baseline_run": base_id,
+        "candidate_run": cand_id,
+        "threshold": threshold,
+        "alpha": alpha,
+        "methods": rows,
+        "regressions": [r["method"] for r in rows if r["status"] == "regression"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark result history.")
+    parser.add_argument("--db", default=DEFAULT_DB, help="History database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_list = sub.add_parser("list", help="List recorded runs")
+    p_list.add_argument("--task")
+    p_list.add_argument("--limit", type=int, default=20)
+
+    p_import = sub.add_parser("import", help="Import results/<task>/*.json files")
+    p_import.add_argument("results_dir", nargs="?",
+                          default=os.path.join(os.path.dirname(__file__), "..", "results"))
+
+    p_cmp = sub.add_parser("compare", help="Flag regressions against a baseline run")
+    p_cmp.add_argument("--task", required=True)
+    p_cmp.add_argument("--baseline", default="previous",
+                       help="'#<run id>', git commit prefix, 'latest' or 'previous'")
+    p_cmp.add_argument("--candidate", default="latest")
+    p_cmp.add_argument("--threshold", type=float, default=0.05,
+                       help="Relative slowdown that counts as a regression (0.15 = 15%%)")
+    p_cmp.add_argument("--alpha", type=float, default=0.05)
+    p_cmp.add_argument("--host", help="Only compare runs recorded on this host")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for run in list_runs(args.task, args.limit, db_path=args.db):
+            print(f"{run['id']:>5}  {run['timestamp']:<26} {run['task']:<25} "
+                  f"{run['git_commit'] or '-':<10} {run['host']}")
+
+    elif args.command == "import":
+        print(f"[✓] Imported {import_json_results(args.results_dir, db_path=args.db)} runs")
+
+    elif args.command == "compare":
+        report = compare(args.task, args.baseline, args.candidate, args.threshold,
+                         args.alpha, args.host, db_path=args.db)
+        print(f"\n📈 {report['task']}: run {report['baseline_run']} → run {report['candidate_run']}")
+        print("-" * 40)
+        for r in report["methods"]:
+            p = f"{r['p_value']:.4f}" if r["p_value"] is not None else "n/a"
+            print(f"   {r['method']:<20}: {r['change']:+.1%} (p={p}) {r['status']}")
+        print("-" * 40)
+        if report["regressions"]:
+            print(f"❌ Regressions: {', '.join(report['regressions'])}")
+            raise SystemExit(1)
+        print("✅ No significant regressions")
+
+
+if __name__ == "__main__":
+    main()
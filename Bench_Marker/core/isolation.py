@@ -0,0 +1,166 @@
+import os
+import queue as queue_module
+import traceback
+import multiprocessing as mp
+
+import psutil
+
+from Bench_Marker.core.measurement import (
+    warmup, calibrate, collect_samples, cold_call, run_setup, run_teardown
+)
+from Bench_Marker.core.memory import profile_memory
+
+
+# "spawn" gives every worker a fresh interpreter: no inherited GC state,
+# allocator arenas or imported modules from the previous method.
+_CONTEXT = mp.get_context("spawn")
+
+ISOLATION_MODES = (None, "method", "run")
+
+
+def pin_to_cpu(cpu):
+    """
+    Pin the current process to a CPU id (or a collection of CPU ids).
+    Returns True if pinning worked.
+    """
+    if cpu is None:
+        return False
+    cpus = {cpu} if isinstance(cpu, int) else set(cpu)
+    if not cpus:
+        return False
+    try:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+        else:
+            psutil.Process().cpu_affinity(sorted(cpus))
+        return True
+    except (AttributeError, OSError, ValueError, psutil.Error):
+        return False
+
+
+def available_cpus():
+    """
+    CPU ids this process is allowed to run on.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    try:
+        return sorted(psutil.Process().cpu_affinity())
+    except (AttributeError, psutil.Error):
+        return list(range(os.cpu_count() or 1))
+
+
+def _worker(func, data, runs, cpu, options, queue):
+    """
+    Entry point of a worker process: measure func and stream every sample
+    back to the parent through queue. Per-method hooks run here, so the
+    setup state is built in the worker's own interpreter.
+    """
+    try:
+        pinned = pin_to_cpu(cpu)
+        queue.put(("start", {"pid": os.getpid(), "cpu": cpu, "pinned": pinned}))
+
+        hooks = options.get("hooks") or {}
+        each = {"before_each": hooks.get("before_each"), "after_each": hooks.get("after_each")}
+        state, setup_time = run_setup(hooks, data)
+        cold = {"setup_time": setup_time, "first_call_time": None}
+        if options["warmup"]:
+            cold["first_call_time"] = cold_call(func, state, **each)
+        warmup(func, state, max(0, options["warmup"] - 1), **each)
+        loops = options.get("loops") or calibrate(
+            func, state, min_sample_time=options["min_sample_time"], **each
+        )
+        queue.put(("loops", loops))
+
+        collect_samples(func, state, runs, loops,
+                        on_sample=lambda sample: queue.put(("sample", sample)), **each)
+
+        if options.get("memory_runs"):
+            queue.put(("memory", profile_memory(func, state, runs=options["memory_runs"], **each)))
+        cold["teardown_time"] = run_teardown(hooks, state)
+        queue.put(("cold", cold))
+        queue.put(("done", None))
+    except BaseException:
+        queue.put(("error", traceback.format_exc()))
+
+
+def _run_worker(func, data, runs, cpu, options, on_sample):
+    """
+    Start one worker and consume its messages until it finishes.
+    """
+    queue = _CONTEXT.Queue()
+    proc = _CONTEXT.Process(target=_worker, args=(func, data, runs, cpu, options, queue))
+    proc.start()
+
+    info = {"loops": None, "memory": None, "cold": None}
+    try:
+        while True:
+            try:
+                kind, payload = queue.get(timeout=1.0)
+            except queue_module.Empty:
+                if not proc.is_alive():
+                    raise RuntimeError(
+                        f"Benchmark worker exited with code {proc.exitcode} "
+                        "before reporting results"
+                    )
+                continue
+            if kind == "start":
+                info.update(payload)
+            elif kind == "loops":
+                info["loops"] = payload
+            elif kind == "sample":
+                on_sample(payload)
+            elif kind == "memory":
+                info["memory"] = payload
+            elif kind == "cold":
+                info["cold"] = payload
+            elif kind == "error":
+                raise RuntimeError(f"Benchmark worker failed:\n{payload}")
+            elif kind == "done":
+                break
+    finally:
+        proc.join()
+
+    return info
+
+
+def run_isolated(func, data, runs, mode="method", cpu=None, warmup=3,
+                 min_sample_time=0.005, memory_runs=0, hooks=None, on_sample=None):
+    """
+    Measure func in fresh worker processes, optionally pinned to `cpu`.
+
+    mode="method" runs all repetitions in one worker; mode="run" starts a
+    new worker for every repetition (slow, but nothing carries over between
+    samples). If memory_runs is set, the (first) worker also traces
+    allocations with tracemalloc after timing. hooks are the per-method
+    setup/teardown/before_each/after_each hooks (see measurement.HOOKS) and
+    run inside every worker; each worker reports its own cold-start times.
+    Returns (samples, worker_info_list).
+    """
+    if mode not in ("method", "run"):
+        raise ValueError(f"Unknown isolation mode: {mode!r}")
+
+    samples = []
+
+    def collect(sample):
+        samples.append(sample)
+        if on_sample is not None:
+            on_sample(sample)
+
+    options = {
+        "warmup": warmup,
+        "min_sample_time": min_sample_time,
+        "memory_runs": memory_runs,
+        "hooks": hooks,
+    }
+
+    if mode == "method":
+        return samples, [_run_worker(func, data, runs, cpu, options, collect)]
+
+    workers = [_run_worker(func, data, 1, cpu, options, collect)]
+    # Calibrate once, reuse the loop count so every repetition is comparable.
+    options["loops"] = workers[0]["loops"]
+    options["memory_runs"] = 0
+    for _ in range(runs - 1):
+        workers.append(_run_worker(func, data, 1, cpu, options, collect))
+    return samples, workers
@@ -0,0 +1,207 @@
+import time
+import psutil
+
+
+# Optional per-method hooks (see benchmark_runner.benchmark_methods):
+#   setup(data) -> state : once per method, before anything is measured;
+#                          func is then called with state instead of data
+#   teardown(state)      : once per method, after measuring
+#   before_each(state)   : before every call
+#   after_each(state)    : after every call
+# None of them is included in the timings; their cost is reported apart.
+HOOKS = ("setup", "teardown", "before_each", "after_each")
+
+
+def run_setup(hooks, data):
+    """
+    Call the per-method setup hook. Returns (state, seconds); without a
+    setup hook the state is data itself.
+    """
+    setup = (hooks or {}).get("setup")
+    if setup is None:
+        return data, 0.0
+    start = time.perf_counter()
+    state = setup(data)
+    return state, time.perf_counter() - start
+
+
+def run_teardown(hooks, state):
+    """
+    Call the per-method teardown hook. Returns seconds.
+    """
+    teardown = (hooks or {}).get("teardown")
+    if teardown is None:
+        return 0.0
+    start = time.perf_counter()
+    teardown(state)
+    return time.perf_counter() - start
+
+
+def cold_call(func, data, before_each=None, after_each=None):
+    """
+    Wall time of the very first call of func: lazy imports, connection
+    setup, empty caches and all.
+    """
+    if before_each is not None:
+        before_each(data)
+    start = time.perf_counter()
+    func(data)
+    elapsed = time.perf_counter() - start
+    if after_each is not None:
+        after_each(data)
+    return elapsed
+
+
+def warmup(func, data, iterations, before_each=None, after_each=None):
+    """
+    Call func a few times so caches, lazy imports and JIT-like
+    specialisation settle before anything is measured.
+    """
+    for _ in range(iterations):
+        if before_each is not None:
+            before_each(data)
+        func(data)
+        if after_each is not None:
+            after_each(data)
+
+
+def calibrate(func, data, min_sample_time=0.005, max_loops=1_000_000,
+              before_each=None, after_each=None):
+    """
+    Pick how many calls go into one timing sample (timeit.autorange style).
+
+    Tries 1, 2, 5, 10, 20, 50, ... loops until a single sample takes at
+    least min_sample_time seconds, so very fast functions are not lost in
+    perf_counter resolution and call overhead.
+    """
+    loops = 1
+    while True:
+        for factor in (1, 2, 5):
+            number = loops * factor
+            elapsed = time_loops(func, data, number, before_each, after_each)
+            if elapsed >= min_sample_time or number >= max_loops:
+                return number
+        loops *= 10
+
+
+def time_loops(func, data, number, before_each=None, after_each=None):
+    """
+    Total wall time of `number` calls of func(data), excluding the
+    per-iteration hooks.
+    """
+    if before_each is None and after_each is None:
+        start = time.perf_counter()
+        for _ in range(number):
+            func(data)
+        return time.perf_counter() - start
+
+    elapsed = 0.0
+    for _ in range(number):
+        if before_each is not None:
+            before_each(data)
+        start = time.perf_counter()
+        func(data)
+        elapsed += time.perf_counter() - start
+        if after_each is not None:
+            after_each(data)
+    return elapsed
+
+
+def _hooked_loops(func, data, loops, before_each, after_each):
+    """
+    Run `loops` calls with per-iteration hooks, timing only func.
+
+    Returns (wall, process_cpu, thread_cpu, hook_wall) totals.
+    """
+    wall = cpu = thread = hooks = 0.0
+    for _ in range(loops):
+        hook_start = time.perf_counter()
+        if before_each is not None:
+            before_each(data)
+        thread_start = time.thread_time()
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+
+        func(data)
+
+        end = time.perf_counter()
+        cpu += time.process_time() - cpu_start
+        thread += time.thread_time() - thread_start
+        wall += end - start
+        hooks += start - hook_start
+        if after_each is not None:
+            after_each(data)
+        hooks += time.perf_counter() - end
+    return wall, cpu, thread, hooks
+
+
+def collect_samples(func, data, runs, loops, on_sample=None,
+                    before_each=None, after_each=None):
+    """
+    Take `runs` timing samples of `loops` calls each.
+
+    Returns a list of sample dicts, all values per call:
+      - time              : wall seconds (perf_counter)
+      - cpu_process       : process CPU seconds, user + system, all threads
+                            (time.process_time, high resolution)
+      - cpu_user          : process user CPU seconds (psutil, clock ticks)
+      - cpu_system        : process system CPU seconds (psutil, clock ticks)
+      - thread_cpu        : CPU seconds of the calling thread only
+      - ctx_voluntary     : voluntary context switches (blocking on I/O, locks)
+      - ctx_involuntary   : involuntary context switches (preempted)
+      - memory            : RSS delta in bytes (whole sample)
+      - hook_time         : wall seconds spent in before_each/after_each
+
+    With per-iteration hooks every call is timed on its own so time,
+    cpu_process and thread_cpu exclude the hooks; the psutil user/system
+    split, context switches and RSS cover the whole sample, hooks included.
+    If on_sample is given it is called with each sample as soon as it is
+    measured.
+    """
+    process = psutil.Process()
+    samples = []
+    hooked = before_each is not None or after_each is not None
+
+    for _ in range(runs):
+        mem_before = process.memory_info().rss
+        ctx_before = process.num_ctx_switches()
+        cpu_before = process.cpu_times()
+        thread_before = time.thread_time()
+        process_before = time.process_time()
+        start = time.perf_counter()
+
+        if hooked:
+            wall, cpu, thread, hook_time = _hooked_loops(func, data, loops, before_each, after_each)
+        else:
+            for _ in range(loops):
+                func(data)
+
+        end = time.perf_counter()
+        process_after = time.process_time()
+        thread_after = time.thread_time()
+        cpu_after = process.cpu_times()
+        ctx_after = process.num_ctx_switches()
+        mem_after = process.memory_info().rss
+
+        if not hooked:
+            wall = end - start
+            cpu = process_after - process_before
+            thread = thread_after - thread_before
+            hook_time = 0.0
+
+        sample = {
+            "time": wall / loops,
+            "cpu_process": cpu / loops,
+            "cpu_user": (cpu_after.user - cpu_before.user) / loops,
+            "cpu_system": (cpu_after.system - cpu_before.system) / loops,
+            "thread_cpu": thread / loops,
+            "ctx_voluntary": (ctx_after.voluntary - ctx_before.voluntary) / loops,
+            "ctx_involuntary": (ctx_after.involuntary - ctx_before.involuntary) / loops,
+            "memory": mem_after - mem_before,
+            "hook_time": hook_time / loops,
+        }
+        samples.append(sample)
+        if on_sample is not None:
+            on_sample(sample)
+
+    return samples
@@ -0,0 +1,90 @@
+import linecache
+import tracemalloc
+from statistics import median
+
+
+_IGNORED_FILES = (tracemalloc.__file__, linecache.__file__, __file__)
+
+
+def _top_lines(before, after, top):
+    """
+    Source lines that allocated the most memory between two snapshots.
+    """
+    filters = [tracemalloc.Filter(False, path) for path in _IGNORED_FILES]
+    before = before.filter_traces(filters)
+    after = after.filter_traces(filters)
+
+    lines = []
+    for stat in after.compare_to(before, "lineno")[:top]:
+        if stat.size_diff <= 0:
+            break
+        frame = stat.traceback[0]
+        lines.append({
+            "file": frame.filename,
+            "line": frame.lineno,
+            "code": linecache.getline(frame.filename, frame.lineno).strip(),
+            "size_bytes": stat.size_diff,
+            "blocks": stat.count_diff,
+        })
+    return lines
+
+
+def trace_call(func, data, top=5):
+    """
+    Run func(data) once under tracemalloc.
+
+    Returns:
+      - peak_bytes  : highest traced memory above the starting point
+      - net_bytes   : memory still allocated after the call (incl. result)
+      - allocations : net number of memory blocks still allocated
+      - top_lines   : the source lines that allocated the most
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+
+        result = func(data)
+
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        del result
+
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+        return {
+            "peak_bytes": peak - baseline,
+            "net_bytes": current - baseline,
+            "allocations": blocks,
+            "top_lines": _top_lines(before, after, top),
+        }
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+def profile_memory(func, data, runs=3, top=5, before_each=None, after_each=None):
+    """
+    Trace func(data) `runs` times and summarise allocation behaviour.
+
+    tracemalloc slows every allocation down, so this is a separate pass
+    from the timing samples. Per-iteration hooks run outside the traced call.
+    """
+    traces = []
+    for _ in range(runs):
+        if before_each is not None:
+            before_each(data)
+        traces.append(trace_call(func, data, top=top))
+        if after_each is not None:
+            after_each(data)
+    return {
+        "runs": runs,
+        "peak_bytes": median(t["peak_bytes"] for t in traces),
+        "net_bytes": median(t["net_bytes"] for t in traces),
+        "allocations": median(t["allocations"] for t in traces),
+        "max_peak_bytes": max(t["peak_bytes"] for t in traces),
+        "top_lines": traces[-1]["top_lines"],
+    }
@@ -0,0 +1,115 @@
+import json
+import random
+import string
+
+
+SHAPES = ("flat", "records", "nested", "wide_dict", "long_string")
+
+
+def geometric_sizes(start, stop, factor=2):
+    """
+    start, start*factor, start*factor^2, ... up to and including stop.
+    """
+    if start <= 0 or factor <= 1:
+        raise ValueError("geometric_sizes() needs start > 0 and factor > 1")
+
+    sizes = []
+    size = start
+    while size <= stop:
+        sizes.append(int(size))
+        size *= factor
+    return sizes
+
+
+def _nested(depth, fanout, rng):
+    if depth == 0:
+        return rng.randint(0, 1_000_000)
+    return {f"k{i}": _nested(depth - 1, fanout, rng) for i in range(fanout)}
+
+
+def make_payload(shape, size, seed=0):
+    """
+    Build a JSON-compatible payload of the given shape whose element count
+    grows linearly with size.
+
+      - flat        : list of `size` integers
+      - records     : list of `size` small flat dicts
+      - nested      : list of size // 16 objects, each 4 levels deep with
+                      fan-out 2 (16 leaves per object)
+      - wide_dict   : one dict with `size` keys
+      - long_string : one dict holding a `size` character string
+    """
+    rng = random.Random(seed)
+
+    if shape == "flat":
+        return list(range(size))
+    if shape == "records":
+        return [
+            {"id": i, "name": f"user{i}", "score": rng.random(), "active": i % 2 == 0}
+            for i in range(size)
+        ]
+    if shape == "nested":
+        return [_nested(4, 2, rng) for _ in range(max(1, size // 16))]
+    if shape == "wide_dict":
+        return {f"key_{i}": i for i in range(size)}
+    if shape == "long_string":
+        alphabet = string.ascii_letters + string.digits + " "
+        return {"text": "".join(rng.choice(alphabet) for _ in range(size))}
+
+    raise ValueError(f"Unknown payload shape {shape!r}; expected one of {SHAPES}")
+
+
+CORPUS_FORMATS = ("array", "ndjson")
+LEVELS = ("DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR")
+SERVICES = ("api", "auth", "billing", "search", "worker")
+
+
+def make_log_record(i, rng):
+    """
+    One structured log event, the kind of object large log files hold.
+    """
+    return {
+        "ts": 1_700_000_000 + i * 0.013,
+        "level": rng.choice(LEVELS),
+        "service": rng.choice(SERVICES),
+        "request_id": f"{rng.getrandbits(64):016x}",
+        "latency_ms": round(rng.lognormvariate(3, 1), 3),
+        "status": rng.choice((200, 200, 200, 201, 204, 400, 404, 500)),
+        "message": " ".join(rng.choice(string.ascii_lowercase) * rng.randint(2, 9)
+                            for _ in range(rng.randint(3, 12))),
+        "tags": [rng.choice(SERVICES) for _ in range(rng.randint(0, 4))],
+        "user": {"id": rng.randint(1, 100_000), "plan": rng.choice(("free", "pro"))},
+    }
+
+
+def write_corpus(path, target_bytes, fmt="ndjson", seed=0):
+    """
+    Write log records to path until the file reaches target_bytes.
+
+      - ndjson : one JSON document per line
+      - array  : a single JSON array of records
+
+    Returns the number of records written.
+    """
+    if fmt not in CORPUS_FORMATS:
+        raise ValueError(f"Unknown corpus format {fmt!r}; expected one of {CORPUS_FORMATS}")
+
+    rng = random.Random(seed)
+    written = 0
+    count = 0
+    with open(path, "w") as f:
+        if fmt == "array":
+            f.write("[")
+            written += 1
+        while written < target_bytes:
+            line = json.dumps(make_log_record(count, rng))
+            if fmt == "array":
+                line = ("," if count else "") + line
+            else:
+                line += "\n"
+            f.write(line)
+            written += len(line)
+            count += 1
+        if fmt == "array":
+            f.write("]")
+    return count
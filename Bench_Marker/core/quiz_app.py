@@ -0,0 +1,43 @@
+import importlib
+import os
+import subprocess
+import sys
+
+
+QUIZ_APP_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "..", "..", "Performance_Analyser", "quiz_management_system"
+))
+
+
+def quiz_module(name):
+    """
+    Import one of the quiz app's modules that does not build the Flask app
+    (models, aggregates, ...).
+    """
+    if QUIZ_APP_DIR not in sys.path:
+        sys.path.insert(0, QUIZ_APP_DIR)
+    return importlib.import_module(name)
+
+
+def quiz_models():
+    return quiz_module("models")
+
+
+def build_quiz_database(path, scale="small", seed=0, **overrides):
+    """
+    Create a SQLite database at `path` with the app's schema and
+    datagen.py's synthetic data at `scale` ("small", "medium", "large");
+    overrides are datagen options such as users=50_000 or scores=10**6.
+
+    datagen runs in a fresh interpreter: the app binds its database URI
+    when it is imported. Its profiler file goes next to the database.
+    """
+    args = [sys.executable, "datagen.py", "--scale", scale, "--seed", str(seed),
+            "--database", f"sqlite:///{os.path.abspath(path)}"]
+    for key, value in overrides.items():
+        args += [f"--{key.replace('_', '-')}", str(value)]
+    env = dict(os.environ, QUIZ_PROFILER_FILE=os.path.abspath(path) + ".profiler.sqlite")
+    proc = subprocess.run(args, cwd=QUIZ_APP_DIR, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"datagen.py failed:\n{proc.stderr[-2000:]}")
+    return path
@@ -0,0 +1,103 @@
+import importlib
+import pkgutil
+
+
+TASKS_PACKAGE = "Bench_Marker.tasks"
+TASK_KINDS = ("cpu", "io")
+
+# {task_name: {"name", "kind", "methods": {method_name: func},
+#              "hooks": {method_name: hooks}, "setup", "teardown"}}
+TASKS = {}
+
+
+def _task(task, kind=None):
+    entry = TASKS.setdefault(task, {
+        "name": task, "kind": "cpu", "methods": {}, "hooks": {}, "setup": None, "teardown": None
+    })
+    if kind is not None:
+        if kind not in TASK_KINDS:
+            raise ValueError(f"{task}: kind must be one of {TASK_KINDS}")
+        entry["kind"] = kind
+    return entry
+
+
+def register(task, name=None, kind=None, available=True, hooks=None):
+    """
+    Decorator: register func as a candidate method for task.
+
+        @register("json_parsing", "orjson", available=orjson is not None)
+        def parse_json_orjson(data): ...
+
+    name defaults to the function name. With available=False (an optional
+    dependency is missing) the method is not registered. hooks are the
+    method's own setup/teardown/before_each/after_each hooks, excluded from
+    timing (see benchmark_runner.benchmark_methods). The function is
+    returned unchanged.
+    """
+    def decorator(func):
+        if not available:
+            return func
+        entry = _task(task, kind)
+        methods = entry["methods"]
+        method = name or func.__name__
+        if method in methods and methods[method] is not func:
+            raise ValueError(f"{task}: method {method!r} is already registered")
+        methods[method] = func
+        if hooks:
+            entry["hooks"][method] = hooks
+        return func
+    return decorator
+
+
+def register_setup(task, kind=None):
+    """
+    Decorator: register the fixture that builds the data for task.
+
+    It is called once per size, as setup(size), outside the timed region,
+    and its return value is passed to every method. size is None when the
+    suite does not give sizes.
+    """
+    def decorator(func):
+        _task(task, kind)["setup"] = func
+        return func
+    return decorator
+
+
+def register_teardown(task):
+    """
+    Decorator: register the fixture called with the setup data once all
+    methods have run for a size.
+    """
+    def decorator(func):
+        _task(task)["teardown"] = func
+        return func
+    return decorator
+
+
+def load_tasks(modules=(), package=TASKS_PACKAGE):
+    """
+    Import every module in the tasks package plus any extra `modules`
+    (dotted names) so their decorators run. Returns TASKS.
+    """
+    pkg = importlib.import_module(package)
+    for info in pkgutil.iter_modules(pkg.__path__):
+        importlib.import_module(f"{package}.{info.name}")
+    for module in modules:
+        importlib.import_module(module)
+    return TASKS
+
+
+def get_task(name, methods=None):
+    """
+    The registered task, optionally restricted to a subset of its methods.
+    """
+    if name not in TASKS:
+        raise ValueError(f"Unknown task {name!r}. Available: {sorted(TASKS)}")
+    task = TASKS[name]
+    if methods:
+        unknown = set(methods) - set(task["methods"])
+        if unknown:
+            raise ValueError(f"{name}: unknown methods {sorted(unknown)}. "
+                             f"Available: {sorted(task['methods'])}")
+        task = dict(task, methods={m: task["methods"][m] for m in methods})
+    return task
@@ -0,0 +1,205 @@
+import argparse
+import contextlib
+import importlib
+import io
+import multiprocessing as mp
+import pkgutil
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from Bench_Marker.core.isolation import pin_to_cpu, available_cpus
+
+
+RUNNERS_PACKAGE = "Bench_Marker.runners"
+SUITE_KINDS = ("cpu", "io")
+
+
+def discover_suites(package=RUNNERS_PACKAGE):
+    """
+    Find runner modules that declare a SUITE dict and a main() function.
+
+    Returns {suite_name: {"name", "kind", "module"}}.
+    """
+    pkg = importlib.import_module(package)
+    suites = {}
+
+    for info in pkgutil.iter_modules(pkg.__path__):
+        module_name = f"{package}.{info.name}"
+        module = importlib.import_module(module_name)
+        suite = getattr(module, "SUITE", None)
+        if suite is None or not callable(getattr(module, "main", None)):
+            continue
+
+        kind = suite.get("kind", "cpu")
+        if kind not in SUITE_KINDS:
+            raise ValueError(f"{module_name}: SUITE kind must be one of {SUITE_KINDS}")
+
+        suites[suite["name"]] = {"name": suite["name"], "kind": kind, "module": module_name}
+
+    return suites
+
+
+def _run_job(target, args, cpus):
+    """
+    Pool worker: pin to the given CPUs, call target ("module:function")
+    with args and hand back everything it printed so output from parallel
+    jobs does not interleave.
+    """
+    pinned = pin_to_cpu(cpus)
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    error = None
+    module_name, func_name = target.split(":")
+
+    with contextlib.redirect_stdout(buffer):
+        try:
+            getattr(importlib.import_module(module_name), func_name)(*args)
+        except Exception:
+            error = traceback.format_exc()
+
+    return {
+        "module": module_name,
+        "target": target,
+        "cpus": sorted(cpus) if cpus else None,
+        "pinned": pinned,
+        "elapsed": time.perf_counter() - start,
+        "output": buffer.getvalue(),
+        "error": error,
+    }
+
+
+def plan_cpus(cpu_jobs, cpus=None):
+    """
+    Split the available CPUs into one dedicated core per CPU-bound slot and
+    a shared set for I/O-bound suites, so the two kinds never share a core.
+
+    Returns (cpu_slot_cores, io_cores). With too few cores to separate them,
+    io_cores is empty and I/O-bound suites are left unpinned.
+    """
+    cpus = list(cpus) if cpus is not None else available_cpus()
+    cpu_slot_cores = cpus[:cpu_jobs]
+    io_cores = cpus[cpu_jobs:]
+    return cpu_slot_cores, io_cores
+
+
+def run_suites(names=None, max_workers=None, cpu_jobs=None, verbose=True):
+    """
+    Run benchmark suites concurrently on a process pool (see run_jobs).
+
+    Returns a list of per-suite reports in completion order.
+    """
+    suites = discover_suites()
+    if names:
+        unknown = set(names) - set(suites)
+        if unknown:
+            raise ValueError(f"Unknown suites: {sorted(unknown)}. Available: {sorted(suites)}")
+        suites = {name: suites[name] for name in names}
+
+    jobs = [
+        {"name": s["name"], "kind": s["kind"], "target": f"{s['module']}:main", "args": ()}
+        for s in suites.values()
+    ]
+    return run_jobs(jobs, max_workers=max_workers, cpu_jobs=cpu_jobs, verbose=verbose)
+
+
+def run_jobs(jobs, max_workers=None, cpu_jobs=None, verbose=True):
+    """
+    Run jobs ({"name", "kind", "target": "module:function", "args"})
+    concurrently on a process pool.
+
+    - max_workers: total number of jobs running at once
+    - cpu_jobs   : how many CPU-bound jobs may run at once; each gets its
+                   own core. I/O-bound jobs share the remaining cores.
+
+    Each job runs in a fresh worker process (one task per child).
+    Returns a list of per-job reports in completion order.
+    """
+    cores = available_cpus()
+    if cpu_jobs is None:
+        cpu_jobs = len(cores) // 2
+    if max_workers is None:
+        max_workers = len(cores)
+    # At least one slot each, and never more CPU-bound slots than cores.
+    cpu_jobs = max(1, min(cpu_jobs, len(cores)))
+    max_workers = max(1, max_workers)
+
+    cpu_slot_cores, io_cores = plan_cpus(cpu_jobs, cores)
+
+    for job in jobs:
+        if job["kind"] not in SUITE_KINDS:
+            raise ValueError(f"{job['name']}: kind must be one of {SUITE_KINDS}")
+    pending_cpu = [job for job in jobs if job["kind"] == "cpu"]
+    pending_io = [job for job in jobs if job["kind"] == "io"]
+    free_cores = list(cpu_slot_cores)
+    running = {}
+    reports = []
+    wall_start = time.perf_counter()
+
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp.get_context("spawn"),
+        max_tasks_per_child=1,
+    )
+    with executor:
+        while pending_cpu or pending_io or running:
+            while len(running) < max_workers and (pending_cpu or pending_io):
+                if pending_cpu and free_cores:
+                    job = pending_cpu.pop(0)
+                    core = free_cores.pop(0)
+                    future = executor.submit(_run_job, job["target"], job["args"], [core])
+                    running[future] = (job, core)
+                elif pending_io:
+                    job = pending_io.pop(0)
+                    future = executor.submit(_run_job, job["target"], job["args"], io_cores or None)
+                    running[future] = (job, None)
+                else:
+                    break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job, core = running.pop(future)
+                if core is not None:
+                    free_cores.append(core)
+
+                report = future.result()
+                report["suite"] = job["name"]
+                report["kind"] = job["kind"]
+                reports.append(report)
+
+                if verbose:
+                    print(report["output"], end="")
+                    status = "✗ failed" if report["error"] else "✓ done"
+                    print(f"[{status}] {job['name']} ({job['kind']}) "
+                          f"in {report['elapsed']:.2f}s on cpus={report['cpus']}")
+                    if report["error"]:
+                        print(report["error"])
+
+    if verbose:
+        print(f"\n⏱  All jobs finished in {time.perf_counter() - wall_start:.2f}s")
+
+    return reports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run benchmark suites in parallel.")
+    parser.add_argument("suites", nargs="*", help="Suite names to run (default: all)")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Maximum suites running at once")
+    parser.add_argument("--cpu-jobs", type=int, default=None,
+                        help="Maximum CPU-bound suites running at once")
+    parser.add_argument("--list", action="store_true", help="List discovered suites and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, suite in sorted(discover_suites().items()):
+            print(f"{name:<25} {suite['kind']:<4} {suite['module']}")
+        return
+
+    reports = run_suites(args.suites or None, max_workers=args.jobs, cpu_jobs=args.cpu_jobs)
+    if any(r["error"] for r in reports):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
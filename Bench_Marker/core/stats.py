@@ -0,0 +1,158 @@
+import math
+import random
+from statistics import mean, median, stdev
+
+
+def percentile(values, q):
+    """
+    Return the q-th percentile (0-100) of values using linear interpolation.
+    """
+    if not values:
+        raise ValueError("percentile() requires at least one value")
+
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+
+    pos = (len(ordered) - 1) * (q / 100.0)
+    lower = math.floor(pos)
+    upper = math.ceil(pos)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)
+
+
+def median_abs_deviation(values):
+    """
+    Median absolute deviation: a spread estimate that ignores outliers.
+    """
+    centre = median(values)
+    return median(abs(v - centre) for v in values)
+
+
+def remove_outliers(values, k=1.5):
+    """
+    Drop samples outside the Tukey fences [Q1 - k*IQR, Q3 + k*IQR].
+
+    Returns (kept, removed_count). Fewer than 4 samples are returned as is.
+    """
+    if len(values) < 4:
+        return list(values), 0
+
+    q1 = percentile(values, 25)
+    q3 = percentile(values, 75)
+    iqr = q3 - q1
+    low = q1 - k * iqr
+    high = q3 + k * iqr
+
+    kept = [v for v in values if low <= v <= high]
+    return kept, len(values) - len(kept)
+
+
+def bootstrap_ci(values, statistic=median, confidence=0.95, resamples=2000, seed=None):
+    """
+    Percentile bootstrap confidence interval for statistic(values).
+    """
+    if len(values) < 2:
+        value = statistic(values)
+        return value, value
+
+    rng = random.Random(seed)
+    n = len(values)
+    estimates = sorted(
+        statistic(rng.choices(values, k=n)) for _ in range(resamples)
+    )
+    alpha = (1.0 - confidence) / 2.0
+    return percentile(estimates, alpha * 100), percentile(estimates, (1 - alpha) * 100)
+
+
+def mann_whitney_u(a, b):
+    """
+    Two-sided Mann-Whitney U test (normal approximation with tie correction).
+
+    Non-parametric, so it does not assume timings are normally distributed.
+    Returns (u_statistic, p_value).
+    """
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("mann_whitney_u() requires two non-empty samples")
+
+    combined = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        avg_rank = (i + j) / 2.0 + 1
+        for k in range(i, j + 1):
+            ranks[k] = avg_rank
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    rank_sum_a = sum(r for r, (_, group) in zip(ranks, combined) if group == 0)
+    u1 = rank_sum_a - n1 * (n1 + 1) / 2.0
+    u2 = n1 * n2 - u1
+    u = min(u1, u2)
+
+    n = n1 + n2
+    mu = n1 * n2 / 2.0
+    sigma_sq = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if sigma_sq <= 0:
+        # Every sample is identical: no evidence of a difference.
+        return u, 1.0
+
+    z = (abs(u - mu) - 0.5) / math.sqrt(sigma_sq)
+    p_value = math.erfc(max(z, 0.0) / math.sqrt(2))
+    return u, min(p_value, 1.0)
+
+
+def summarize(values, confidence=0.95, resamples=2000, seed=None):
+    """
+    Descriptive statistics for a list of samples.
+    """
+    ci_low, ci_high = bootstrap_ci(
+        values, median, confidence=confidence, resamples=resamples, seed=seed
+    )
+    return {
+        "samples": len(values),
+        "mean": mean(values),
+        "median": median(values),
+        "stddev": stdev(values) if len(values) > 1 else 0.0,
+        "mad": median_abs_deviation(values),
+        "min": min(values),
+        "max": max(values),
+        "p5": percentile(values, 5),
+        "p25": percentile(values, 25),
+        "p75": percentile(values, 75),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "median_ci": [ci_low, ci_high],
+        "confidence": confidence,
+    }
+
+
+def pick_winner(samples_by_name, alpha=0.05):
+    """
+    Choose the method with the lowest median, but only if it is
+    significantly lower than every other method.
+
+    Returns (winner_or_None, {other_name: p_value}).
+    """
+    if not samples_by_name:
+        return None, {}
+
+    ranked = sorted(samples_by_name, key=lambda name: median(samples_by_name[name]))
+    leader = ranked[0]
+    if len(ranked) == 1:
+        return leader, {}
+
+    p_values = {}
+    for other in ranked[1:]:
+        _, p_values[other] = mann_whitney_u(samples_by_name[leader], samples_by_name[other])
+
+    if all(p < alpha for p in p_values.values()):
+        return leader, p_values
+    return None, p_values
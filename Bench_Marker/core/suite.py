@@ -0,0 +1,215 @@
+import argparse
+import json
+import os
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from Bench_Marker.core.benchmark_runner import benchmark_methods
+from Bench_Marker.core.registry import TASKS, load_tasks, get_task
+
+
+# Keys a suite file may set under [defaults] or on a task, passed through
+# to benchmark_methods.
+BENCHMARK_OPTIONS = ("runs", "warmup", "min_sample_time", "confidence", "alpha",
+                     "isolation", "cpus", "memory", "memory_runs", "history", "save")
+TASK_KEYS = ("name", "methods", "sizes") + BENCHMARK_OPTIONS
+
+
+def _read(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".toml":
+        if tomllib is None:
+            raise RuntimeError("tomllib not available (Python 3.11+ required for TOML suites)")
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    if ext in (".yaml", ".yml"):
+        if yaml is None:
+            raise RuntimeError("PyYAML not installed")
+        with open(path) as f:
+            return yaml.safe_load(f) or {}
+    raise ValueError(f"Unsupported suite file {path!r}; expected .toml, .yaml or .yml")
+
+
+def load_suite(path):
+    """
+    Read a declarative suite file (TOML or YAML):
+
+        name = "quick"
+        modules = ["my_project.bench_tasks"]   # extra modules that register tasks
+
+        [defaults]
+        runs = 10
+        isolation = "none"                     # "none" | "method" | "run"
+
+        [[tasks]]
+        name = "json_parsing"
+        methods = ["json", "orjson"]           # default: every registered method
+        sizes = [100, 10000]                   # passed to the task's setup fixture
+        runs = 20
+
+    Returns {"name", "path", "modules", "tasks"} where each task entry has
+    the defaults merged in.
+    """
+    raw = _read(path)
+    defaults = raw.get("defaults", {})
+    unknown = set(defaults) - set(BENCHMARK_OPTIONS + ("sizes",))
+    if unknown:
+        raise ValueError(f"{path}: unknown defaults {sorted(unknown)}")
+
+    tasks = []
+    for entry in raw.get("tasks", []):
+        if "name" not in entry:
+            raise ValueError(f"{path}: every task needs a name")
+        unknown = set(entry) - set(TASK_KEYS)
+        if unknown:
+            raise ValueError(f"{path}: task {entry['name']!r} has unknown keys {sorted(unknown)}")
+        spec = {**defaults, **entry}
+        if spec.get("isolation") == "none":
+            spec["isolation"] = None
+        tasks.append(spec)
+
+    if not tasks:
+        raise ValueError(f"{path}: no tasks defined")
+
+    return {
+        "name": raw.get("name", os.path.splitext(os.path.basename(path))[0]),
+        "path": path,
+        "modules": list(raw.get("modules", [])),
+        "tasks": tasks,
+    }
+
+
+def run_task(spec, verbose=True):
+    """
+    Run one suite entry: for every size, build the data with the task's
+    setup fixture, benchmark the selected methods and tear the data down.
+
+    Returns {size: best-method dict}.
+    """
+    task = get_task(spec["name"], spec.get("methods"))
+    options = {key: spec[key] for key in BENCHMARK_OPTIONS if key in spec}
+    methods = [(name, func, task["hooks"].get(name, {})) for name, func in task["methods"].items()]
+    if not methods:
+        raise ValueError(f"{spec['name']}: no methods available")
+
+    best = {}
+    for size in spec.get("sizes") or [None]:
+        data = task["setup"](size) if task["setup"] else None
+        try:
+            if verbose:
+                print(f"\n▶ {spec['name']}" + (f", size {size}" if size is not None else ""))
+            results = benchmark_methods(
+                task_name=spec["name"] if size is None else f"{spec['name']}_{size}",
+                methods=methods,
+                data=data,
+                verbose=verbose,
+                **options
+            )
+        finally:
+            if task["teardown"]:
+                task["teardown"](data)
+        best[str(size) if size is not None else "default"] = results["best"]
+    return best
+
+
+def run_suite_entry(path, index):
+    """
+    Scheduler job: load the suite file in this (fresh) process and run
+    its index-th task.
+    """
+    suite = load_suite(path)
+    load_tasks(suite["modules"])
+    spec = suite["tasks"][index]
+    print(json.dumps({spec["name"]: run_task(spec)}, indent=2))
+
+
+def select_tasks(suite, only=None):
+    """
+    Indices of the suite's tasks, restricted to names in `only`.
+    """
+    if not only:
+        return list(range(len(suite["tasks"])))
+    names = {spec["name"] for spec in suite["tasks"]}
+    unknown = set(only) - names
+    if unknown:
+        raise ValueError(f"Not in suite {suite['name']!r}: {sorted(unknown)}. "
+                         f"Available: {sorted(names)}")
+    return [i for i, spec in enumerate(suite["tasks"]) if spec["name"] in only]
+
+
+def run_suite(path, only=None, jobs=1, cpu_jobs=None, verbose=True):
+    """
+    Run the tasks of a suite file. With jobs > 1 the tasks are spread over
+    the scheduler's process pool (CPU-bound tasks on dedicated cores);
+    otherwise they run one after another in this process.
+    """
+    suite = load_suite(path)
+    load_tasks(suite["modules"])
+    indices = select_tasks(suite, only)
+
+    if jobs and jobs > 1:
+        from Bench_Marker.core.scheduler import run_jobs
+
+        job_list = []
+        for i in indices:
+            name = suite["tasks"][i]["name"]
+            job_list.append({
+                "name": name,
+                "kind": get_task(name)["kind"],
+                "target": "Bench_Marker.core.suite:run_suite_entry",
+                "args": (os.path.abspath(path), i),
+            })
+        reports = run_jobs(job_list, max_workers=jobs, cpu_jobs=cpu_jobs, verbose=verbose)
+        if any(r["error"] for r in reports):
+            raise SystemExit(1)
+        return None
+
+    summary = {}
+    for i in indices:
+        spec = suite["tasks"][i]
+        summary[spec["name"]] = run_task(spec, verbose=verbose)
+    if verbose:
+        print(json.dumps(summary, indent=2))
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m Bench_Marker",
+        description="Run benchmark tasks from a declarative suite file."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="Run a TOML/YAML suite file")
+    run_p.add_argument("suite", help="Path to the suite file")
+    run_p.add_argument("--only", nargs="+", help="Run only these tasks from the suite")
+    run_p.add_argument("--jobs", "-j", type=int, default=1,
+                       help="Run tasks in parallel on this many worker processes")
+    run_p.add_argument("--cpu-jobs", type=int, default=None,
+                       help="Maximum CPU-bound tasks running at once")
+
+    list_p = sub.add_parser("tasks", help="List registered tasks and methods")
+    list_p.add_argument("--modules", nargs="*", default=[],
+                        help="Extra modules that register tasks")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "tasks":
+        load_tasks(args.modules)
+        for name, task in sorted(TASKS.items()):
+            print(f"{name:<25} {task['kind']:<4} {', '.join(task['methods'])}")
+        return
+
+    run_suite(args.suite, only=args.only, jobs=args.jobs, cpu_jobs=args.cpu_jobs)
+
+
+if __name__ == "__main__":
+    main()
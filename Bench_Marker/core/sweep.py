@@ -0,0 +1,161 @@
+import math
+from datetime import datetime
+from itertools import combinations
+
+from Bench_Marker.core.benchmark_runner import benchmark_methods, save_results
+from Bench_Marker.core.payloads import make_payload
+
+
+def fit_power_law(sizes, values):
+    """
+    Least-squares fit of value = coefficient * size ** exponent in log-log
+    space. An exponent near 1 means linear scaling, near 2 quadratic.
+
+    Returns {"coefficient", "exponent", "r_squared"} or None when there are
+    fewer than two positive points.
+    """
+    points = [(math.log(n), math.log(v)) for n, v in zip(sizes, values) if n > 0 and v > 0]
+    if len(points) < 2:
+        return None
+
+    xs, ys = zip(*points)
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    sxx = sum((x - x_mean) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    sxy = sum((x - x_mean) * (y - y_mean) for x, y in points)
+
+    exponent = sxy / sxx
+    intercept = y_mean - exponent * x_mean
+
+    ss_tot = sum((y - y_mean) ** 2 for y in ys)
+    ss_res = sum((y - (intercept + exponent * x)) ** 2 for x, y in points)
+    r_squared = 1 - ss_res / ss_tot if ss_tot else 1.0
+
+    return {
+        "coefficient": math.exp(intercept),
+        "exponent": exponent,
+        "r_squared": r_squared,
+    }
+
+
+def find_crossovers(sizes, series):
+    """
+    Sizes at which one method overtakes another.
+
+    series maps method name -> list of values aligned with sizes (lower is
+    better). A crossover is reported between two consecutive sizes where the
+    sign of the difference flips; the exact point is interpolated in
+    log-log space. Pairs with a missing or non-positive value are skipped,
+    as in fit_power_law.
+    """
+    crossovers = []
+
+    for a, b in combinations(sorted(series), 2):
+        va, vb = series[a], series[b]
+        for i in range(1, len(sizes)):
+            pair = (va[i - 1], vb[i - 1], va[i], vb[i], sizes[i - 1], sizes[i])
+            if any(v is None or v <= 0 for v in pair):
+                continue
+            before = va[i - 1] - vb[i - 1]
+            after = va[i] - vb[i]
+            if before == 0 or after == 0 or (before > 0) == (after > 0):
+                continue
+
+            # Interpolate log(va/vb) linearly in log(size) to find where it is 0.
+            r0 = math.log(va[i - 1] / vb[i - 1])
+            r1 = math.log(va[i] / vb[i])
+            x0, x1 = math.log(sizes[i - 1]), math.log(sizes[i])
+            x = x0 + (x1 - x0) * (r0 / (r0 - r1))
+
+            crossovers.append({
+                "methods": [a, b],
+                "between": [sizes[i - 1], sizes[i]],
+                "size": round(math.exp(x)),
+                "faster_above": a if after < 0 else b,
+            })
+
+    return crossovers
+
+
+def sweep_methods(task_name, methods, sizes, shape="flat", prepare=None,
+                  runs=5, verbose=True, **benchmark_kwargs):
+    """
+    Run benchmark_methods over a range of payload sizes.
+
+    For every size a payload of `shape` is built with make_payload() and
+    passed through prepare() (e.g. json.dumps for parsers). Time and
+    tracemalloc peak memory are then fitted against size with a power law,
+    and crossover points where one method overtakes another are reported.
+    """
+    points = []
+    time_series = {method[0]: [] for method in methods}
+    memory_series = {method[0]: [] for method in methods}
+
+    for size in sizes:
+        data = make_payload(shape, size)
+        if prepare is not None:
+            data = prepare(data)
+
+        result = benchmark_methods(
+            task_name=f"{task_name}_{shape}_{size}",
+            methods=methods,
+            data=data,
+            runs=runs,
+            save=False,
+            verbose=False,
+            **benchmark_kwargs,
+        )
+
+        point = {"size": size, "methods": {}}
+        for r in result["results"]:
+            peak = r.get("tracemalloc", {}).get("peak_bytes")
+            point["methods"][r["method"]] = {"median_time": r["median_time"], "peak_bytes": peak}
+            time_series[r["method"]].append(r["median_time"])
+            memory_series[r["method"]].append(peak or 0)
+        point["fastest"] = result["best"]["time"]
+        points.append(point)
+
+        if verbose:
+            timings = ", ".join(f"{name} {m['median_time']:.3e}s"
+                                for name, m in point["methods"].items())
+            print(f"   size {size:>9}: {timings}")
+
+    fits = {
+        name: {
+            "time": fit_power_law(sizes, time_series[name]),
+            "memory": fit_power_law(sizes, memory_series[name]),
+        }
+        for name in time_series
+    }
+
+    results = {
+        "task": task_name,
+        "shape": shape,
+        "sizes": list(sizes),
+        "runs": runs,
+        "timestamp": datetime.utcnow().isoformat(),
+        "points": points,
+        "fits": fits,
+        "time_crossovers": find_crossovers(sizes, time_series),
+        "memory_crossovers": find_crossovers(sizes, memory_series),
+    }
+
+    if verbose:
+        print("\n📈 Scaling Summary")
+        print("-" * 40)
+        for name, fit in fits.items():
+            t = fit["time"]
+            if t:
+                print(f"   {name:<20}: time ~ n^{t['exponent']:.2f} (R²={t['r_squared']:.3f})")
+        for c in results["time_crossovers"]:
+            print(f"🔀 {c['faster_above']} overtakes at ~{c['size']} "
+                  f"({' vs '.join(c['methods'])}, between {c['between'][0]} and {c['between'][1]})")
+        if not results["time_crossovers"]:
+            print("🔀 No crossovers: ranking is the same at every size")
+        print("-" * 40)
+
+    save_results(f"{task_name}_sweep", results)
+
+    return results
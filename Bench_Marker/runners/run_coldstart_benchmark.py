@@ -0,0 +1,48 @@
+import json
+from Bench_Marker.core.coldstart import (
+    interpreter_startup,
+    measure_import,
+    measure_quiz_app,
+    cold_start_results,
+    print_cold_start,
+    record_cold_start
+)
+
+SUITE = {"name": "cold_start", "kind": "cpu"}
+
+RUNS = 10
+MODULES = ["sqlalchemy", "httpx", "requests", "flask", "flask_sqlalchemy", "flask_profiler"]
+# Served without a database or a logged-in user.
+FIRST_REQUEST_PATH = "/login"
+
+
+def main():
+    series = {"interpreter": interpreter_startup(RUNS)}
+    breakdown = {}
+
+    for module in MODULES:
+        imported = measure_import(module, RUNS)
+        series[f"import {module}"] = imported["samples"]
+        breakdown[module] = imported["top_self"]
+
+    quiz = measure_quiz_app(RUNS, path=FIRST_REQUEST_PATH)
+    for phase, values in quiz.items():
+        series[f"quiz_app {phase}"] = values
+
+    results = cold_start_results("cold_start", series, extra={
+        "first_request_path": FIRST_REQUEST_PATH,
+        "import_breakdown": breakdown,
+    })
+    print_cold_start(results)
+
+    print("\n🐢 Slowest modules by self time")
+    for module, top in breakdown.items():
+        names = ", ".join(f"{e['module']} {e['self_us'] / 1000:.1f}ms" for e in top[:3])
+        print(f"   {module:<18}: {names}")
+
+    record_cold_start(results)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
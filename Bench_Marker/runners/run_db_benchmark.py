@@ -1,20 +1,44 @@
 import json
 from Bench_Marker.core.benchmark_runner import benchmark_methods
-from Bench_Marker.tasks.db_task import setup_db, fetch_orm, fetch_core, fetch_raw
+from Bench_Marker.tasks.db_task import (
+    setup_db,
+    fetch_orm,
+    fetch_core,
+    fetch_raw,
+    fetch_core_connected,
+    fetch_raw_connected,
+    open_core_connection,
+    open_raw_connection,
+    close_connection
+)
 
-setup_db()
+SUITE = {"name": "database_access", "kind": "io"}
 
-methods = [
-    ("sqlalchemy_orm", fetch_orm),
-    ("sqlalchemy_core", fetch_core),
-    ("raw_sqlite", fetch_raw)
-]
 
-results = benchmark_methods(
-    task_name="database_access",
-    methods=methods,
-    data=None,
-    runs=10
-)
+def main():
+    setup_db()
+
+    methods = [
+        ("sqlalchemy_orm", fetch_orm),
+        ("sqlalchemy_core", fetch_core),
+        ("raw_sqlite", fetch_raw),
+        # Connection opened once by a setup hook: steady-state query cost.
+        ("sqlalchemy_core_connected", fetch_core_connected,
+         {"setup": open_core_connection, "teardown": close_connection}),
+        ("raw_sqlite_connected", fetch_raw_connected,
+         {"setup": open_raw_connection, "teardown": close_connection})
+    ]
+
+    results = benchmark_methods(
+        task_name="database_access",
+        methods=methods,
+        data=None,
+        runs=10,
+        isolation="method"
+    )
+
+    print(json.dumps(results, indent=2))
+
 
-print(json.dumps(results, indent=2))
+if __name__ == "__main__":
+    main()
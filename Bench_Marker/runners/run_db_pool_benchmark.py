@@ -0,0 +1,102 @@
+import json
+from datetime import datetime
+from Bench_Marker.core.benchmark_runner import benchmark_methods, save_results
+from Bench_Marker.core.stats import percentile
+from Bench_Marker.tasks.db_pool_task import (
+    JOURNAL_MODES,
+    POOLS,
+    setup_pool_db,
+    raw_connect_only,
+    pool_checkout_only,
+    raw_query_persistent,
+    raw_connect_and_query,
+    pool_checkout_and_query,
+    run_concurrent
+)
+
+SUITE = {"name": "database_pool", "kind": "io"}
+
+THREAD_COUNTS = [1, 2, 4, 8, 16]
+OPS_PER_THREAD = 200
+WRITE_EVERY = 10  # one write per 10 operations
+
+
+def pooled(func, pool, journal):
+    """
+    Bind pool/journal so pooled methods fit the (name, func) method list.
+    """
+    def method(_):
+        return func({"pool": pool, "journal": journal})
+    return method
+
+
+def lifecycle(journal):
+    """
+    Connect/checkout cost and query cost measured separately.
+    """
+    methods = [
+        ("raw_connect_only", raw_connect_only),
+        ("raw_query_persistent", raw_query_persistent),
+        ("raw_connect_and_query", raw_connect_and_query),
+    ]
+    for pool in POOLS:
+        methods.append((f"{pool}_checkout_only", pooled(pool_checkout_only, pool, journal)))
+        methods.append((f"{pool}_checkout_and_query", pooled(pool_checkout_and_query, pool, journal)))
+
+    return benchmark_methods(
+        task_name=f"database_pool_lifecycle_{journal}",
+        methods=methods,
+        data=None,
+        runs=10
+    )
+
+
+def concurrency(journal):
+    rows = []
+    print(f"\n📊 Concurrent access ({journal} journal, 1 write per {WRITE_EVERY} ops)")
+    print("-" * 40)
+    for pool in POOLS:
+        for threads in THREAD_COUNTS:
+            run = run_concurrent(pool, journal, threads, OPS_PER_THREAD, WRITE_EVERY)
+            latencies = run["latencies"]
+            row = {
+                "pool": pool,
+                "threads": threads,
+                "ops_per_sec": run["operations"] / run["wall"],
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "lock_errors": run["lock_errors"],
+                "other_errors": run["other_errors"],
+            }
+            rows.append(row)
+            print(f"   {pool:<12} t={threads:<3}: {row['ops_per_sec']:9.1f} ops/s  "
+                  f"p50 {row['p50'] * 1000:.3f}ms  p99 {row['p99'] * 1000:.3f}ms  "
+                  f"locked {row['lock_errors']}  errors {row['other_errors']}")
+    print("-" * 40)
+    return rows
+
+
+def main():
+    results = {
+        "task": "database_pool",
+        "timestamp": datetime.utcnow().isoformat(),
+        "threads": THREAD_COUNTS,
+        "ops_per_thread": OPS_PER_THREAD,
+        "write_every": WRITE_EVERY,
+        "journals": {}
+    }
+
+    for journal in JOURNAL_MODES:
+        setup_pool_db(journal)
+        results["journals"][journal] = {
+            "lifecycle_best": lifecycle(journal)["best"],
+            "concurrency": concurrency(journal),
+        }
+
+    save_results(results["task"], results)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
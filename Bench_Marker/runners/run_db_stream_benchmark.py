@@ -0,0 +1,76 @@
+import json
+from statistics import median
+from Bench_Marker.core.benchmark_runner import benchmark_methods
+from Bench_Marker.tasks.db_stream_task import (
+    FIRST_PAGE,
+    setup_stream_db,
+    fetch_raw_fetchall,
+    fetch_raw_fetchmany,
+    fetch_raw_iterate,
+    fetch_core_fetchall,
+    fetch_core_partitions,
+    fetch_core_stream_results,
+    fetch_orm_all,
+    fetch_orm_yield_per
+)
+
+SUITE = {"name": "database_stream", "kind": "io"}
+
+# 10 ** 7 rows shows the streaming methods' flat memory best but takes
+# tens of minutes per run; append it when that is the question.
+ROW_COUNTS = [10 ** 4, 10 ** 5, 10 ** 6]
+# Above this, methods that materialize every row are skipped: at 10^7 rows
+# they need several GB, which is the failure mode this suite is about.
+MAX_MATERIALIZED_ROWS = 10 ** 6
+TTFR_RUNS = 3
+
+
+def main():
+    summary = {}
+
+    for count in ROW_COUNTS:
+        setup_stream_db(count)
+
+        methods = [
+            ("raw_fetchmany", fetch_raw_fetchmany),
+            ("raw_iterate", fetch_raw_iterate),
+            ("core_partitions", fetch_core_partitions),
+            ("core_stream_results", fetch_core_stream_results),
+            ("orm_yield_per", fetch_orm_yield_per)
+        ]
+        if count <= MAX_MATERIALIZED_ROWS:
+            methods = [
+                ("raw_fetchall", fetch_raw_fetchall),
+                ("core_fetchall", fetch_core_fetchall),
+                ("orm_all", fetch_orm_all)
+            ] + methods
+
+        print(f"\n▶ {count:,} rows")
+        results = benchmark_methods(
+            task_name=f"database_stream_{count}",
+            methods=methods,
+            data=None,
+            runs=5 if count <= 10 ** 5 else 3,
+            warmup=1,
+            min_sample_time=0,
+            memory_runs=1
+        )
+
+        ttfr = {}
+        for name, func in methods:
+            # Only the first page is read: the probe is about latency, and a
+            # full read per run is already covered by the timings above.
+            ttfr[name] = median(func(FIRST_PAGE)["time_to_first_row"] for _ in range(TTFR_RUNS))
+            print(f"   {name:<20}: first row after {ttfr[name] * 1000:.3f}ms")
+
+        summary[count] = {
+            "best": results["best"],
+            "time_to_first_row": ttfr,
+            "peak_bytes": {r["method"]: r["tracemalloc"]["peak_bytes"] for r in results["results"]},
+        }
+
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
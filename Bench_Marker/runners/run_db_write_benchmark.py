@@ -0,0 +1,62 @@
+import json
+from Bench_Marker.core.benchmark_runner import benchmark_methods
+from Bench_Marker.tasks.db_write_task import (
+    PRAGMA_PROFILES,
+    make_rows,
+    setup_write_db,
+    WRITE_HOOKS,
+    insert_row_by_row,
+    insert_row_by_row_tx,
+    insert_executemany,
+    insert_executemany_batched,
+    insert_core_executemany,
+    insert_core_values,
+    insert_orm_add_all,
+    insert_orm_bulk_save_objects,
+    insert_orm_bulk_insert
+)
+
+SUITE = {"name": "database_write", "kind": "io"}
+
+ROW_COUNTS = [100, 1000, 10000]
+# One fsync per row gets very slow with durable PRAGMAs; skip it above this.
+MAX_AUTOCOMMIT_ROWS = 1000
+
+
+def main():
+    summary = {}
+
+    for profile in PRAGMA_PROFILES:
+        setup_write_db(profile)
+
+        for count in ROW_COUNTS:
+            methods = [
+                ("row_by_row_tx", insert_row_by_row_tx),
+                ("executemany", insert_executemany),
+                ("executemany_batched", insert_executemany_batched),
+                ("core_executemany", insert_core_executemany),
+                ("core_multi_values", insert_core_values),
+                ("orm_add_all", insert_orm_add_all),
+                ("orm_bulk_save_objects", insert_orm_bulk_save_objects),
+                ("orm_bulk_insert", insert_orm_bulk_insert)
+            ]
+            if count <= MAX_AUTOCOMMIT_ROWS:
+                methods.insert(0, ("row_by_row_autocommit", insert_row_by_row))
+            methods = [(name, func, WRITE_HOOKS) for name, func in methods]
+
+            print(f"\n▶ {profile}, {count} rows")
+            results = benchmark_methods(
+                task_name=f"database_write_{profile}_{count}",
+                methods=methods,
+                data={"rows": make_rows(count), "profile": profile},
+                runs=5,
+                warmup=1,
+                min_sample_time=0
+            )
+            summary[f"{profile}/{count}"] = results["best"]
+
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
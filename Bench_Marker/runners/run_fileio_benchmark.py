@@ -1,19 +1,178 @@
 import json
+import os
 from Bench_Marker.core.benchmark_runner import benchmark_methods
-from Bench_Marker.tasks.fileio_task import write_stdlib, read_stdlib
+from Bench_Marker.core.payloads import make_payload
+from Bench_Marker.tasks.fileio_task import (
+    FORMAT_FILES,
+    msgpack,
+    numpy,
+    orjson,
+    setup_workdir,
+    cleanup_workdir,
+    workfile,
+    make_blob,
+    warm_page_cache,
+    write_buffered,
+    write_unbuffered,
+    write_fsync,
+    write_no_fsync,
+    write_open_file,
+    open_write_file,
+    rewind_write_file,
+    close_write_file,
+    read_buffered,
+    read_whole,
+    read_readinto,
+    read_mmap,
+    read_mmap_touch,
+    copy_read_write,
+    copy_shutil,
+    copy_sendfile,
+    copy_file_range,
+    dump_json,
+    load_json,
+    dump_orjson,
+    load_orjson,
+    dump_msgpack,
+    load_msgpack,
+    dump_pickle5,
+    load_pickle5,
+    dump_npy,
+    load_npy
+)
 
-payload = {"numbers": list(range(5000))}
+SUITE = {"name": "file_io", "kind": "io"}
 
-methods = [
-    ("write_json", write_stdlib),
-    ("read_json", read_stdlib)
-]
+FILE_SIZE = 16 * 1024 * 1024
+BUFFER_SIZES = [4 * 1024, 64 * 1024, 1024 * 1024]
+# "warm": files are read once beforehand and served from the page cache.
+# "cold": each read evicts the file first (posix_fadvise DONTNEED).
+CACHE_MODES = ["warm", "cold"]
+RECORDS = 20000
+
+
+def run(task_name, methods, data, runs=5):
+    return benchmark_methods(
+        task_name=task_name,
+        methods=methods,
+        data=data,
+        runs=runs,
+        warmup=1,
+        min_sample_time=0
+    )
+
+
+def throughput(results, size):
+    """
+    MB/s per method from the median time.
+    """
+    return {r["method"]: size / r["median_time"] / 1e6 for r in results["results"]}
+
+
+def print_throughput(title, rates):
+    print(f"\n📊 {title}")
+    print("-" * 40)
+    for name, rate in rates.items():
+        print(f"   {name:<20}: {rate:10.1f} MB/s")
+    print("-" * 40)
+
+
+def main():
+    setup_workdir()
+    summary = {}
+    try:
+        payload = os.urandom(FILE_SIZE)
+        source = make_blob(workfile("source.bin"), FILE_SIZE)
+
+        # Writes and reads are measured separately: they do different work
+        # and are never alternatives to each other.
+        for size in BUFFER_SIZES:
+            label = f"write_{size // 1024}k"
+            results = run(f"file_io_{label}", [
+                ("buffered", write_buffered),
+                ("os_write", write_unbuffered)
+            ], {"path": workfile("write.bin"), "payload": payload, "buffer_size": size})
+            summary[label] = throughput(results, FILE_SIZE)
+            print_throughput(label, summary[label])
+
+        results = run("file_io_fsync", [
+            ("no_fsync", write_no_fsync),
+            ("fsync", write_fsync),
+            ("no_fsync_preopened", write_open_file,
+             {"setup": open_write_file, "before_each": rewind_write_file,
+              "teardown": close_write_file})
+        ], {"path": workfile("write.bin"), "payload": payload})
+        summary["fsync"] = throughput(results, FILE_SIZE)
+        print_throughput("fsync", summary["fsync"])
+
+        for cache in CACHE_MODES:
+            if cache == "warm":
+                warm_page_cache(source)
+            for size in BUFFER_SIZES:
+                label = f"read_{cache}_{size // 1024}k"
+                results = run(f"file_io_{label}", [
+                    ("read_whole", read_whole),
+                    ("buffered", read_buffered),
+                    ("readinto", read_readinto),
+                    ("mmap_copy", read_mmap),
+                    ("mmap_touch", read_mmap_touch)
+                ], {"path": source, "buffer_size": size, "cache": cache})
+                summary[label] = throughput(results, FILE_SIZE)
+                print_throughput(label, summary[label])
+
+            methods = [
+                ("read_write", copy_read_write),
+                ("shutil", copy_shutil)
+            ]
+            if hasattr(os, "sendfile"):
+                methods.append(("sendfile", copy_sendfile))
+            if hasattr(os, "copy_file_range"):
+                methods.append(("copy_file_range", copy_file_range))
+            label = f"copy_{cache}"
+            results = run(f"file_io_{label}", methods,
+                          {"path": source, "dest": workfile("copy.bin"), "cache": cache})
+            summary[label] = throughput(results, FILE_SIZE)
+            print_throughput(label, summary[label])
+
+        # Serialized formats: dumps compete with dumps, loads with loads.
+        formats = [("json", dump_json, load_json), ("pickle5", dump_pickle5, load_pickle5)]
+        if orjson:
+            formats.append(("orjson", dump_orjson, load_orjson))
+        if msgpack:
+            formats.append(("msgpack", dump_msgpack, load_msgpack))
+        records = make_payload("records", RECORDS)
+
+        results = run("file_io_dump_records", [(name, dump) for name, dump, _ in formats],
+                      {"obj": records})
+        summary["dump_records"] = results["best"]
+        summary["file_sizes"] = {
+            name: os.path.getsize(workfile(FORMAT_FILES[name])) for name, _, _ in formats
+        }
+        for cache in CACHE_MODES:
+            results = run(f"file_io_load_records_{cache}",
+                          [(name, load) for name, _, load in formats], {"cache": cache})
+            summary[f"load_records_{cache}"] = results["best"]
+
+        if numpy is not None:
+            array = numpy.random.default_rng(0).random(FILE_SIZE // 8)
+            results = run("file_io_dump_array", [
+                ("npy", dump_npy),
+                ("pickle5", dump_pickle5)
+            ], {"obj": array})
+            summary["dump_array"] = throughput(results, array.nbytes)
+            print_throughput("dump_array", summary["dump_array"])
+            for cache in CACHE_MODES:
+                results = run(f"file_io_load_array_{cache}", [
+                    ("npy", load_npy),
+                    ("pickle5", load_pickle5)
+                ], {"cache": cache})
+                summary[f"load_array_{cache}"] = throughput(results, array.nbytes)
+                print_throughput(f"load_array_{cache}", summary[f"load_array_{cache}"])
+    finally:
+        cleanup_workdir()
+
+    print(json.dumps(summary, indent=2))
 
-results = benchmark_methods(
-    task_name="file_io",
-    methods=methods,
-    data=payload,
-    runs=10
-)
 
-print(json.dumps(results, indent=2))
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,46 @@
 import json
 from Bench_Marker.core.benchmark_runner import benchmark_methods
-from Bench_Marker.tasks.http_task import fetch_requests, fetch_httpx
-
-methods = [
-    ("requests", fetch_requests),
-    ("httpx", fetch_httpx)
-]
-
-results = benchmark_methods(
-    task_name="http_client_requests",
-    methods=methods,
-    data=None,
-    runs=10
+from Bench_Marker.tasks.http_server import target_url
+from Bench_Marker.tasks.http_task import (
+    fetch_requests,
+    fetch_requests_session,
+    fetch_httpx,
+    fetch_httpx_client,
+    fetch_with_client,
+    open_requests_session,
+    open_httpx_client,
+    close_client
 )
 
-print(json.dumps(results, indent=2))
+# Local target path; see Bench_Marker/tasks/http_server.py for the
+# size/delay/chunked/keepalive query options.
+TARGET_PATH = "/todos/1"
+
+SUITE = {"name": "http_client_requests", "kind": "io"}
+
+
+def main():
+    methods = [
+        ("requests", fetch_requests),
+        ("requests_session", fetch_requests_session),
+        ("httpx", fetch_httpx),
+        ("httpx_client", fetch_httpx_client),
+        ("requests_session_hooked", fetch_with_client,
+         {"setup": open_requests_session, "teardown": close_client}),
+        ("httpx_client_hooked", fetch_with_client,
+         {"setup": open_httpx_client, "teardown": close_client})
+    ]
+
+    with target_url(TARGET_PATH) as url:
+        results = benchmark_methods(
+            task_name="http_client_requests",
+            methods=methods,
+            data={"url": url},
+            runs=10
+        )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
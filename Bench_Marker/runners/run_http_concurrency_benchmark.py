@@ -0,0 +1,106 @@
+import json
+import time
+from datetime import datetime
+from Bench_Marker.core.benchmark_runner import save_results
+from Bench_Marker.core.stats import percentile
+from Bench_Marker.tasks.http_server import target_url
+from Bench_Marker.tasks.http_task import (
+    aiohttp,
+    open_pool,
+    close_pool,
+    batch_requests,
+    batch_requests_session,
+    batch_httpx,
+    batch_httpx_client,
+    batch_httpx_async,
+    batch_aiohttp
+)
+
+# Local target path; see Bench_Marker/tasks/http_server.py for the
+# size/delay/chunked/keepalive query options.
+TARGET_PATH = "/todos/1"
+
+SUITE = {"name": "http_client_concurrency", "kind": "io"}
+
+CONCURRENCY_LEVELS = [1, 2, 4, 8, 16, 32]
+REQUESTS_PER_LEVEL = 64
+REPEATS = 3
+
+
+def http_load(batch, url, concurrency, total=REQUESTS_PER_LEVEL, repeats=REPEATS):
+    """
+    Run `batch` against url `repeats` times on one open_pool state and
+    report throughput and latency percentiles.
+    """
+    state = open_pool({"url": url, "requests": total, "concurrency": concurrency})
+    try:
+        batch(state)  # warm up connection pools, DNS and TLS sessions
+
+        latencies = []
+        wall = 0.0
+        for _ in range(repeats):
+            start = time.perf_counter()
+            latencies.extend(batch(state))
+            wall += time.perf_counter() - start
+    finally:
+        close_pool(state)
+
+    return {
+        "concurrency": concurrency,
+        "requests": total * repeats,
+        "requests_per_sec": total * repeats / wall,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies),
+    }
+
+
+def main():
+    methods = [
+        ("requests", batch_requests),
+        ("requests_session", batch_requests_session),
+        ("httpx", batch_httpx),
+        ("httpx_client", batch_httpx_client),
+        ("httpx_async", batch_httpx_async),
+    ]
+    if aiohttp:
+        methods.append(("aiohttp", batch_aiohttp))
+
+    results = {
+        "task": "http_client_concurrency",
+        "requests_per_level": REQUESTS_PER_LEVEL,
+        "repeats": REPEATS,
+        "timestamp": datetime.utcnow().isoformat(),
+        "results": []
+    }
+
+    print("\n📊 HTTP Concurrency Sweep")
+    print("-" * 40)
+    with target_url(TARGET_PATH) as url:
+        results["url"] = url
+        for name, batch in methods:
+            levels = [http_load(batch, url, c) for c in CONCURRENCY_LEVELS]
+            results["results"].append({"method": name, "levels": levels})
+            for level in levels:
+                print(f"   {name:<18} c={level['concurrency']:<3}: "
+                      f"{level['requests_per_sec']:8.1f} req/s  "
+                      f"p50 {level['p50'] * 1000:.2f}ms  p95 {level['p95'] * 1000:.2f}ms  "
+                      f"p99 {level['p99'] * 1000:.2f}ms")
+
+    best = {}
+    for c in CONCURRENCY_LEVELS:
+        best[c] = max(
+            results["results"],
+            key=lambda r: next(l["requests_per_sec"] for l in r["levels"] if l["concurrency"] == c)
+        )["method"]
+        print(f"🏆 Highest throughput at c={c:<3}: {best[c]}")
+    results["best"] = best
+    print("-" * 40)
+
+    save_results(results["task"], results)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
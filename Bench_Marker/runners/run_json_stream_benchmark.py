@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+from Bench_Marker.core.benchmark_runner import benchmark_methods
+from Bench_Marker.core.payloads import write_corpus
+from Bench_Marker.tasks.json_stream_task import (
+    ijson,
+    orjson,
+    ujson,
+    loads_whole_stdlib,
+    loads_whole_ujson,
+    loads_whole_orjson,
+    ndjson_stdlib,
+    ndjson_ujson,
+    ndjson_orjson,
+    iterate_array_stdlib,
+    iterate_array_ijson,
+    dumps_stdlib,
+    dumps_stdlib_compact,
+    dumps_ujson,
+    dumps_orjson,
+    dumps_orjson_sorted,
+    dumps_orjson_indent,
+    dumps_orjson_ndjson
+)
+
+SUITE = {"name": "json_streaming", "kind": "cpu"}
+
+# Target corpus sizes in bytes; raise these to match production log sizes.
+CORPUS_SIZES = [1024 * 1024, 16 * 1024 * 1024, 64 * 1024 * 1024]
+
+
+def parse_methods():
+    methods = [
+        ("loads_whole_json", loads_whole_stdlib),
+        ("ndjson_json", ndjson_stdlib),
+        ("iterate_array_json", iterate_array_stdlib)
+    ]
+    if ujson:
+        methods += [("loads_whole_ujson", loads_whole_ujson), ("ndjson_ujson", ndjson_ujson)]
+    if orjson:
+        methods += [("loads_whole_orjson", loads_whole_orjson), ("ndjson_orjson", ndjson_orjson)]
+    if ijson:
+        methods.append(("iterate_array_ijson", iterate_array_ijson))
+    return methods
+
+
+def dump_methods():
+    methods = [
+        ("json", dumps_stdlib),
+        ("json_compact", dumps_stdlib_compact)
+    ]
+    if ujson:
+        methods.append(("ujson", dumps_ujson))
+    if orjson:
+        methods += [
+            ("orjson", dumps_orjson),
+            ("orjson_sort_keys", dumps_orjson_sorted),
+            ("orjson_indent_2", dumps_orjson_indent),
+            ("orjson_ndjson", dumps_orjson_ndjson)
+        ]
+    return methods
+
+
+def report(title, results, size):
+    """
+    MB/s from the median time and tracemalloc peak per method.
+    """
+    rows = {}
+    print(f"\n📊 {title}")
+    print("-" * 40)
+    for r in results["results"]:
+        peak = r.get("tracemalloc", {}).get("peak_bytes")
+        rows[r["method"]] = {"mb_per_sec": size / r["median_time"] / 1e6, "peak_bytes": peak}
+        peak_text = f"{peak / 1e6:8.1f} MB peak" if peak is not None else ""
+        print(f"   {r['method']:<20}: {rows[r['method']]['mb_per_sec']:8.1f} MB/s  {peak_text}")
+    print("-" * 40)
+    return rows
+
+
+def main():
+    summary = {}
+
+    with tempfile.TemporaryDirectory(prefix="bench_json_stream_") as work_dir:
+        for target in CORPUS_SIZES:
+            data = {
+                "array": os.path.join(work_dir, "corpus.json"),
+                "ndjson": os.path.join(work_dir, "corpus.ndjson")
+            }
+            records = write_corpus(data["array"], target, fmt="array")
+            write_corpus(data["ndjson"], target, fmt="ndjson")
+            size = os.path.getsize(data["array"])
+            label = f"{size // (1024 * 1024)}MB"
+            print(f"\n▶ Corpus: {label}, {records} records")
+
+            results = benchmark_methods(
+                task_name=f"json_streaming_parse_{label}",
+                methods=parse_methods(),
+                data=data,
+                runs=5,
+                warmup=1,
+                min_sample_time=0
+            )
+            summary[f"parse_{label}"] = report(f"Parse {label}", results, size)
+
+            with open(data["array"], "rb") as f:
+                obj = json.loads(f.read())
+            results = benchmark_methods(
+                task_name=f"json_streaming_dumps_{label}",
+                methods=dump_methods(),
+                data={"obj": obj},
+                runs=5,
+                warmup=1,
+                min_sample_time=0
+            )
+            summary[f"dumps_{label}"] = report(f"Serialize {label}", results, size)
+
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
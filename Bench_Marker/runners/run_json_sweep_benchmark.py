@@ -0,0 +1,33 @@
+import json
+from Bench_Marker.core.payloads import SHAPES, geometric_sizes
+from Bench_Marker.core.sweep import sweep_methods
+from Bench_Marker.tasks.json_task import (
+    parse_json_stdlib,
+    parse_json_ujson,
+    parse_json_orjson
+)
+
+SUITE = {"name": "json_parsing_sweep", "kind": "cpu"}
+
+
+def main():
+    methods = [
+        ("json", parse_json_stdlib),
+        ("ujson", parse_json_ujson),
+        ("orjson", parse_json_orjson)
+    ]
+
+    for shape in SHAPES:
+        print(f"\n▶ Shape: {shape}")
+        sweep_methods(
+            task_name="json_parsing",
+            methods=methods,
+            sizes=geometric_sizes(16, 65536, factor=4),
+            shape=shape,
+            prepare=json.dumps,
+            runs=10
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import json
+from Bench_Marker.core.benchmark_runner import benchmark_methods
+from Bench_Marker.tasks.quiz_cache_task import (
+    LOOKUPS,
+    BACKENDS,
+    METHODS,
+    make_cache_database,
+    remove_cache_database,
+    cache_stats
+)
+
+SUITE = {"name": "quiz_cache", "kind": "io"}
+
+# datagen.py scales: small 10^3 users / 100 quizzes, medium 2*10^4 / 500, large 10^5 / 1000
+SCALES = ["small", "medium", "large"]
+
+
+def main():
+    summary = {}
+
+    for scale in SCALES:
+        print(f"\n▶ {scale} dataset")
+        data = make_cache_database(scale)
+        summary[scale] = {}
+        try:
+            backends = [b for b in BACKENDS if b == "db" or b in data["caches"]]
+            for lookup in LOOKUPS:
+                results = benchmark_methods(
+                    task_name=f"quiz_cache_{scale}_{lookup}",
+                    methods=[(f"{lookup}_{b}", METHODS[(lookup, b)]) for b in backends],
+                    data=data,
+                    runs=10,
+                    warmup=3,
+                    memory_runs=1
+                )
+                summary[scale][lookup] = {r["method"]: r["median_time"] for r in results["results"]}
+
+            stats = cache_stats(data)
+            summary[scale]["cache_stats"] = stats
+            print("\n💾 Cache hit rates")
+            for backend, s in stats.items():
+                rates = "  ".join(f"{name} {c['hit_rate']:.1%}"
+                                  for name, c in sorted(s["namespaces"].items()))
+                print(f"   {backend:<7} {rates}")
+        finally:
+            remove_cache_database(data)
+
+    print("\n📈 Median time per lookup")
+    print("-" * 40)
+    for scale, lookups in summary.items():
+        for lookup in LOOKUPS:
+            line = "  ".join(f"{method} {t * 1e6:.1f}µs" for method, t in lookups[lookup].items())
+            print(f"   {scale:<7} {line}")
+    print("-" * 40)
+
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
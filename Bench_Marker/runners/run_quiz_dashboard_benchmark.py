@@ -0,0 +1,64 @@
+import json
+from Bench_Marker.core.benchmark_runner import benchmark_methods
+from Bench_Marker.tasks.quiz_dashboard_task import (
+    make_dashboard_database,
+    remove_dashboard_database,
+    user_dashboard_selectattr,
+    user_dashboard_grouped,
+    admin_dashboard_selectattr,
+    admin_dashboard_grouped
+)
+
+SUITE = {"name": "quiz_dashboards", "kind": "io"}
+
+# Questions over a fixed catalog of 250 quizzes / 50 chapters.
+QUESTION_COUNTS = [2_500, 25_000, 100_000]
+# The selectattr versions do quizzes x questions filter steps per render:
+# above this they take tens of seconds per call.
+MAX_SELECTATTR_QUESTIONS = 25_000
+
+VIEWS = {
+    "user_dashboard": (user_dashboard_selectattr, user_dashboard_grouped),
+    "admin_dashboard": (admin_dashboard_selectattr, admin_dashboard_grouped),
+}
+
+
+def main():
+    medians = {view: {} for view in VIEWS}
+
+    for count in QUESTION_COUNTS:
+        print(f"\n▶ {count:,} questions")
+        data = make_dashboard_database(count)
+        try:
+            for view, (selectattr, grouped) in VIEWS.items():
+                methods = [(f"{view}_grouped", grouped)]
+                if count <= MAX_SELECTATTR_QUESTIONS:
+                    methods.insert(0, (f"{view}_selectattr", selectattr))
+
+                results = benchmark_methods(
+                    task_name=f"quiz_dashboards_{view}_{count}",
+                    methods=methods,
+                    data=data,
+                    runs=10 if count <= MAX_SELECTATTR_QUESTIONS else 5,
+                    warmup=1,
+                    min_sample_time=0,
+                    memory_runs=1
+                )
+                for r in results["results"]:
+                    medians[view].setdefault(r["method"], {})[count] = r["median_time"]
+        finally:
+            remove_dashboard_database(data)
+
+    print("\n📈 Median render time by question count")
+    print("-" * 40)
+    for view, methods in medians.items():
+        for method, by_count in methods.items():
+            times = "  ".join(f"{count:>7,}: {t * 1000:9.2f}ms" for count, t in by_count.items())
+            print(f"   {method:<28} {times}")
+    print("-" * 40)
+
+    print(json.dumps(medians, indent=2))
+
+
+if __name__ == "__main__":
+    main()
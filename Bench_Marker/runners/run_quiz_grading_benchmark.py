@@ -0,0 +1,111 @@
+import json
+import time
+from datetime import datetime
+from Bench_Marker.core.benchmark_runner import save_results
+from Bench_Marker.core.stats import percentile
+from Bench_Marker.tasks.quiz_grading_task import (
+    make_grading_database,
+    remove_grading_database,
+    batch_submissions,
+    aggregates_consistent,
+    delete_paths_consistent,
+    submit_orm,
+    submit_key_sync,
+    submit_key_group,
+    submit_key_behind
+)
+
+SUITE = {"name": "quiz_grading", "kind": "io"}
+
+# datagen.py scale of the database submits are written to.
+SCALE = "medium"
+CONCURRENCY_LEVELS = [1, 4, 16, 64]
+SUBMISSIONS_PER_LEVEL = 500
+REPEATS = 3
+
+
+def submit_load(submit, data, concurrency, total=SUBMISSIONS_PER_LEVEL, repeats=REPEATS):
+    """
+    Run `total` submits at `concurrency` `repeats` times; report
+    submissions/sec, latency percentiles and the writer's mean batch size.
+    """
+    data.update(submissions=total, concurrency=concurrency)
+    batch_submissions(submit, dict(data, submissions=min(total, 50)))  # warm up the key cache
+
+    writer = data["writer"]
+    batches, written = writer.batches, writer.written
+    latencies = []
+    wall = 0.0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        latencies.extend(batch_submissions(submit, data))
+        wall += time.perf_counter() - start
+
+    batches, written = writer.batches - batches, writer.written - written
+    return {
+        "concurrency": concurrency,
+        "submissions": total * repeats,
+        "submissions_per_sec": total * repeats / wall,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies),
+        "mean_batch": written / batches if batches else 1.0,
+    }
+
+
+def main():
+    methods = [
+        ("orm_per_submit", submit_orm),
+        ("key_per_submit", submit_key_sync),
+        ("key_group_commit", submit_key_group),
+        ("key_write_behind", submit_key_behind),
+    ]
+
+    results = {
+        "task": "quiz_grading",
+        "scale": SCALE,
+        "submissions_per_level": SUBMISSIONS_PER_LEVEL,
+        "repeats": REPEATS,
+        "timestamp": datetime.utcnow().isoformat(),
+        "results": []
+    }
+
+    print(f"\n▶ {SCALE} dataset")
+    data = make_grading_database(SCALE)
+    try:
+        print("\n📊 Quiz Submissions under Concurrency")
+        print("-" * 40)
+        for name, submit in methods:
+            levels = [submit_load(submit, data, c) for c in CONCURRENCY_LEVELS]
+            results["results"].append({"method": name, "levels": levels})
+            for level in levels:
+                print(f"   {name:<18} c={level['concurrency']:<3}: "
+                      f"{level['submissions_per_sec']:8.1f} submits/s  "
+                      f"p50 {level['p50'] * 1000:.2f}ms  p95 {level['p95'] * 1000:.2f}ms  "
+                      f"p99 {level['p99'] * 1000:.2f}ms  batch {level['mean_batch']:.1f}")
+        results["aggregates_consistent"] = aggregates_consistent(data)
+        results["delete_paths_consistent"] = delete_paths_consistent(data)
+    finally:
+        remove_grading_database(data)
+
+    best = {}
+    for c in CONCURRENCY_LEVELS:
+        best[c] = max(
+            results["results"],
+            key=lambda r: next(l["submissions_per_sec"] for l in r["levels"] if l["concurrency"] == c)
+        )["method"]
+        print(f"🏆 Highest throughput at c={c:<3}: {best[c]}")
+    results["best"] = best
+    mark = "✓" if results["aggregates_consistent"] else "✗"
+    print(f"{mark} Aggregates match the score table")
+    mark = "✓" if results["delete_paths_consistent"] else "✗"
+    print(f"{mark} Aggregates match after deleting a user and a chapter")
+    print("-" * 40)
+
+    save_results(results["task"], results)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
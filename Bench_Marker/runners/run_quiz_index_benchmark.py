@@ -0,0 +1,57 @@
+import json
+from Bench_Marker.core.benchmark_runner import benchmark_methods
+from Bench_Marker.tasks.quiz_index_task import (
+    QUERIES,
+    METHODS,
+    make_quiz_databases,
+    remove_quiz_databases,
+    query_plan
+)
+
+SUITE = {"name": "quiz_indexes", "kind": "io"}
+
+# datagen.py scales: small 10^4 scores, medium 2*10^5, large 10^6
+SCALES = ["small", "medium", "large"]
+
+
+def main():
+    summary = {}
+
+    for scale in SCALES:
+        print(f"\n▶ {scale} dataset")
+        data = make_quiz_databases(scale)
+        summary[scale] = {}
+        try:
+            for query in QUERIES:
+                for layout in ("unindexed", "indexed"):
+                    print(f"   {query} ({layout}): {' / '.join(query_plan(data, layout, query))}")
+
+                methods = [(f"{query}_{layout}", METHODS[(query, layout)])
+                           for layout in ("unindexed", "indexed")]
+                results = benchmark_methods(
+                    task_name=f"quiz_indexes_{scale}_{query}",
+                    methods=methods,
+                    data=data,
+                    runs=10 if scale != "large" else 5,
+                    warmup=2,
+                    memory_runs=1
+                )
+
+                medians = {r["method"]: r["median_time"] for r in results["results"]}
+                before = medians[f"{query}_unindexed"]
+                after = medians[f"{query}_indexed"]
+                summary[scale][query] = {
+                    "unindexed": before,
+                    "indexed": after,
+                    "speedup": before / after if after else None,
+                }
+                print(f"📈 {query}: {before * 1000:.3f}ms -> {after * 1000:.3f}ms "
+                      f"({before / after:.1f}x)")
+        finally:
+            remove_quiz_databases(data)
+
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import json
+from Bench_Marker.core.benchmark_runner import benchmark_methods
+from Bench_Marker.tasks.quiz_summary_task import (
+    SUBMIT_HOOKS,
+    make_summary_database,
+    remove_summary_database,
+    make_submit_database,
+    remove_submit_database,
+    summary_full_scan,
+    summary_aggregates,
+    submit_plain,
+    submit_with_aggregates
+)
+
+SUITE = {"name": "quiz_summary", "kind": "io"}
+
+# datagen.py scales: small 10^4 scores, medium 2*10^5, large 10^6
+SCALES = ["small", "medium", "large"]
+
+
+def main():
+    summary = {}
+
+    for scale in SCALES:
+        print(f"\n▶ {scale} dataset")
+        summary[scale] = {}
+        data = make_summary_database(scale)
+        try:
+            # Read side: the admin summary page.
+            reads = benchmark_methods(
+                task_name=f"quiz_summary_{scale}",
+                methods=[
+                    ("summary_full_scan", summary_full_scan),
+                    ("summary_aggregates", summary_aggregates)
+                ],
+                data=data,
+                runs=10 if scale != "large" else 5,
+                warmup=1,
+                min_sample_time=0,
+                memory_runs=1
+            )
+        finally:
+            remove_summary_database(data)
+
+        # Write side: what maintaining the aggregates adds to a submit, each
+        # method on its own copy of a separate database.
+        data = make_submit_database(scale)
+        try:
+            writes = benchmark_methods(
+                task_name=f"quiz_submit_{scale}",
+                methods=[
+                    ("submit_plain", submit_plain, SUBMIT_HOOKS),
+                    ("submit_with_aggregates", submit_with_aggregates, SUBMIT_HOOKS)
+                ],
+                data=data,
+                runs=10,
+                warmup=3,
+                memory_runs=1
+            )
+        finally:
+            remove_submit_database(data)
+
+        for results in (reads, writes):
+            for r in results["results"]:
+                summary[scale][r["method"]] = r["median_time"]
+
+    print("\n📈 Median time per call")
+    print("-" * 40)
+    for scale, medians in summary.items():
+        line = "  ".join(f"{method} {t * 1000:.2f}ms" for method, t in medians.items())
+        print(f"   {scale:<7} {line}")
+    print("-" * 40)
+
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
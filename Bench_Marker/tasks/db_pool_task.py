@@ -0,0 +1,161 @@
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool, StaticPool, NullPool
+
+DB_PATH = "benchmark_pool.db"
+ROWS = 1000
+BUSY_TIMEOUT = 5  # seconds sqlite waits on a locked database before failing
+
+JOURNAL_MODES = ("delete", "wal")
+POOLS = {
+    "queue_pool": QueuePool,
+    "static_pool": StaticPool,
+    "null_pool": NullPool,
+}
+
+QUERY = "SELECT id, name FROM users WHERE id = :id"
+WRITE = "UPDATE users SET name = :name WHERE id = :id"
+
+
+def setup_pool_db(journal="wal"):
+    """
+    (Re)fill the users table and set the journal mode. The mode is stored in
+    the database file, so no connection has to set it again: every variant
+    connects at the same cost.
+    """
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute(f"PRAGMA journal_mode={journal}")
+    conn.execute("CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute("DELETE FROM users")
+    conn.executemany("INSERT INTO users (id, name) VALUES (?, ?)",
+                     [(i, f"user{i}") for i in range(1, ROWS + 1)])
+    conn.commit()
+    conn.close()
+
+
+_engines = {}
+
+
+def get_engine(pool, journal="wal"):
+    """
+    One engine per (pool class, journal mode), cached for the process. The
+    journal mode itself comes from the file (setup_pool_db).
+    """
+    key = (pool, journal)
+    if key not in _engines:
+        kwargs = {}
+        if pool == "queue_pool":
+            kwargs.update(pool_size=16, max_overflow=16)
+        engine = create_engine(
+            f"sqlite:///{DB_PATH}",
+            poolclass=POOLS[pool],
+            connect_args={"check_same_thread": False, "timeout": BUSY_TIMEOUT},
+            **kwargs,
+        )
+
+        _engines[key] = engine
+    return _engines[key]
+
+
+# ---------------- CONNECT / CHECKOUT COST ----------------
+# data is {"pool": name, "journal": mode} for the pooled variants.
+
+def raw_connect_only(_):
+    sqlite3.connect(DB_PATH).close()
+
+
+def pool_checkout_only(data):
+    with get_engine(data["pool"], data["journal"]).connect():
+        pass
+
+
+# ---------------- QUERY COST ----------------
+
+_persistent = threading.local()
+
+
+def _persistent_connection():
+    conn = getattr(_persistent, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, timeout=BUSY_TIMEOUT)
+        _persistent.conn = conn
+    return conn
+
+
+def raw_query_persistent(_):
+    """Query only: the connection is opened once per thread and reused."""
+    return _persistent_connection().execute(
+        "SELECT id, name FROM users WHERE id = ?", (ROWS // 2,)
+    ).fetchall()
+
+
+def raw_connect_and_query(_):
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute("SELECT id, name FROM users WHERE id = ?", (ROWS // 2,)).fetchall()
+    conn.close()
+    return rows
+
+
+def pool_checkout_and_query(data):
+    with get_engine(data["pool"], data["journal"]).connect() as conn:
+        return conn.execute(text(QUERY), {"id": ROWS // 2}).fetchall()
+
+
+# ---------------- CONCURRENT WORKLOAD ----------------
+
+def _operation(engine, i, write_every):
+    row_id = i % ROWS + 1
+    with engine.connect() as conn:
+        if write_every and i % write_every == 0:
+            conn.execute(text(WRITE), {"id": row_id, "name": f"user{row_id}-{i}"})
+            conn.commit()
+        else:
+            conn.execute(text(QUERY), {"id": row_id}).fetchall()
+
+
+def run_concurrent(pool, journal, threads, ops_per_thread=200, write_every=10):
+    """
+    Drive the database from `threads` threads, each doing ops_per_thread
+    operations of which one in `write_every` is an UPDATE (0 = read only).
+
+    StaticPool hands every thread the same sqlite3 connection, which is not
+    safe to use from two threads at once, so its operations are serialized
+    with a lock - the throughput you get when sharing one connection.
+
+    Returns per-operation latencies, wall time, the number of operations
+    that failed with "database is locked" and any other errors.
+    """
+    engine = get_engine(pool, journal)
+    total = threads * ops_per_thread
+    errors = {"lock_errors": 0, "other_errors": 0}
+    errors_guard = threading.Lock()
+    shared_connection = threading.Lock() if pool == "static_pool" else None
+
+    def timed(i):
+        start = time.perf_counter()
+        try:
+            if shared_connection is not None:
+                with shared_connection:
+                    _operation(engine, i, write_every)
+            else:
+                _operation(engine, i, write_every)
+        except OperationalError as e:
+            kind = "lock_errors" if "locked" in str(e) else "other_errors"
+            with errors_guard:
+                errors[kind] += 1
+        except Exception:
+            with errors_guard:
+                errors["other_errors"] += 1
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = list(executor.map(timed, range(total)))
+    wall = time.perf_counter() - start
+
+    return {"latencies": latencies, "wall": wall, "operations": total, **errors}
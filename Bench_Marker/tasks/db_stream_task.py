@@ -0,0 +1,150 @@
+import sqlite3
+import time
+from sqlalchemy import create_engine, text, select, Column, Integer, String, Float
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+DB_PATH = "benchmark_stream.db"
+FETCH_SIZE = 1000
+FIRST_PAGE = {"limit": FETCH_SIZE}
+QUERY = "SELECT id, name, score FROM events"
+
+engine = create_engine(f"sqlite:///{DB_PATH}")
+Session = sessionmaker(bind=engine)
+Base = declarative_base()
+
+
+class Event(Base):
+    __tablename__ = "events"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    score = Column(Float)
+
+
+def setup_stream_db(rows, batch=50_000):
+    """
+    (Re)create the events table with `rows` rows, inserted in batches so
+    10^7 rows do not have to be held in memory at once.
+    """
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("DROP TABLE IF EXISTS events")
+    conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, name TEXT, score REAL)")
+    for start in range(0, rows, batch):
+        end = min(start + batch, rows)
+        conn.executemany(
+            "INSERT INTO events (id, name, score) VALUES (?, ?, ?)",
+            ((i, f"event{i}", i * 0.5) for i in range(start, end)),
+        )
+    conn.commit()
+    conn.close()
+
+
+def _consume(rows, limit=None):
+    """
+    Walk the rows the way a report would, stopping after `limit` rows if
+    given.
+
+    Returns (row_count, perf_counter() when the first row arrived).
+    """
+    count = 0
+    first = None
+    for _ in rows:
+        if first is None:
+            first = time.perf_counter()
+        count += 1
+        if count == limit:
+            break
+    return count, first
+
+
+def _run(fetch):
+    start = time.perf_counter()
+    count, first = fetch()
+    return {"rows": count, "time_to_first_row": (first - start) if first else None}
+
+
+def _limit(data):
+    return data.get("limit") if data else None
+
+
+# Each fetch_* method returns {"rows": n, "time_to_first_row": seconds}.
+# With data {"limit": n} it stops after the first n rows (FIRST_PAGE for a
+# time-to-first-row probe), so streaming methods do not read the whole
+# table; the fetchall ones still materialize every row before the first.
+
+def fetch_raw_fetchall(data):
+    def fetch():
+        conn = sqlite3.connect(DB_PATH)
+        try:
+            return _consume(conn.execute(QUERY).fetchall(), _limit(data))
+        finally:
+            conn.close()
+    return _run(fetch)
+
+
+def fetch_raw_fetchmany(data):
+    def fetch():
+        conn = sqlite3.connect(DB_PATH)
+        try:
+            cur = conn.execute(QUERY)
+
+            def batches():
+                while True:
+                    batch = cur.fetchmany(FETCH_SIZE)
+                    if not batch:
+                        return
+                    yield from batch
+
+            return _consume(batches(), _limit(data))
+        finally:
+            conn.close()
+    return _run(fetch)
+
+
+def fetch_raw_iterate(data):
+    """Iterate the cursor directly: sqlite3 steps one row at a time."""
+    def fetch():
+        conn = sqlite3.connect(DB_PATH)
+        try:
+            return _consume(conn.execute(QUERY), _limit(data))
+        finally:
+            conn.close()
+    return _run(fetch)
+
+
+def fetch_core_fetchall(data):
+    def fetch():
+        with engine.connect() as conn:
+            return _consume(conn.execute(text(QUERY)).fetchall(), _limit(data))
+    return _run(fetch)
+
+
+def fetch_core_partitions(data):
+    def fetch():
+        with engine.connect() as conn:
+            result = conn.execute(text(QUERY))
+            return _consume((row for part in result.partitions(FETCH_SIZE) for row in part), _limit(data))
+    return _run(fetch)
+
+
+def fetch_core_stream_results(data):
+    """stream_results + yield_per: server-side-cursor style buffered fetch."""
+    def fetch():
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=FETCH_SIZE).execute(text(QUERY))
+            return _consume(result, _limit(data))
+    return _run(fetch)
+
+
+def fetch_orm_all(data):
+    def fetch():
+        with Session() as session:
+            return _consume(session.scalars(select(Event)).all(), _limit(data))
+    return _run(fetch)
+
+
+def fetch_orm_yield_per(data):
+    def fetch():
+        with Session() as session:
+            events = session.scalars(select(Event).execution_options(yield_per=FETCH_SIZE))
+            return _consume(events, _limit(data))
+    return _run(fetch)
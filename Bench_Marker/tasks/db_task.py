@@ -2,12 +2,15 @@ import sqlite3
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
+from Bench_Marker.core.registry import register, register_setup
+
 DB_URL = "sqlite:///benchmark.db"
 
 engine = create_engine(DB_URL)
 Session = sessionmaker(bind=engine)
 
-def setup_db():
+@register_setup("database_access", kind="io")
+def setup_db(rows=None):
     with engine.begin() as conn:
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS users (
@@ -16,10 +19,11 @@ def setup_db():
             )
         """))
         conn.execute(text("DELETE FROM users"))
-        for i in range(1000):
+        for i in range(rows or 1000):
             conn.execute(text("INSERT INTO users (name) VALUES (:n)"), {"n": f"user{i}"})
 
 
+@register("database_access", "sqlalchemy_orm")
 def fetch_orm(_):
     session = Session()
     result = session.execute(text("SELECT * FROM users")).fetchall()
@@ -27,11 +31,25 @@ def fetch_orm(_):
     return result
 
 
+def open_core_connection(_):
+    return engine.connect()
+
+
+def open_raw_connection(_):
+    return sqlite3.connect("benchmark.db")
+
+
+def close_connection(conn):
+    conn.close()
+
+
+@register("database_access", "sqlalchemy_core")
 def fetch_core(_):
     with engine.connect() as conn:
         return conn.execute(text("SELECT * FROM users")).fetchall()
 
 
+@register("database_access", "raw_sqlite")
 def fetch_raw(_):
     conn = sqlite3.connect("benchmark.db")
     cur = conn.cursor()
@@ -39,3 +57,18 @@ def fetch_raw(_):
     rows = cur.fetchall()
     conn.close()
     return rows
+
+
+# Steady-state variants: the connection is opened by a setup hook, outside
+# the timed region, and passed in as data.
+
+@register("database_access", "sqlalchemy_core_connected",
+          hooks={"setup": open_core_connection, "teardown": close_connection})
+def fetch_core_connected(conn):
+    return conn.execute(text("SELECT * FROM users")).fetchall()
+
+
+@register("database_access", "raw_sqlite_connected",
+          hooks={"setup": open_raw_connection, "teardown": close_connection})
+def fetch_raw_connected(conn):
+    return conn.execute("SELECT * FROM users").fetchall()
@@ -0,0 +1,169 @@
+import sqlite3
+from sqlalchemy import create_engine, event, insert, Column, Integer, String, Float
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+DB_PATH = "benchmark_write.db"
+
+# PRAGMA profiles applied to every connection.
+PRAGMA_PROFILES = {
+    "rollback_full": {"journal_mode": "DELETE", "synchronous": "FULL"},
+    "wal_full": {"journal_mode": "WAL", "synchronous": "FULL"},
+    "wal_normal": {"journal_mode": "WAL", "synchronous": "NORMAL"},
+    "wal_off": {"journal_mode": "WAL", "synchronous": "OFF"},
+}
+
+BATCH_SIZE = 500
+
+Base = declarative_base()
+
+
+class IngestRow(Base):
+    __tablename__ = "ingest"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    score = Column(Float)
+
+
+def make_rows(count):
+    return [{"name": f"user{i}", "score": i * 0.5} for i in range(count)]
+
+
+def _apply_pragmas(conn, profile):
+    for key, value in PRAGMA_PROFILES[profile].items():
+        conn.execute(f"PRAGMA {key}={value}")
+
+
+def raw_connect(profile):
+    # isolation_level=None: autocommit, transactions are explicit.
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    _apply_pragmas(conn, profile)
+    return conn
+
+
+_engines = {}
+
+
+def get_engine(profile):
+    if profile not in _engines:
+        engine = create_engine(f"sqlite:///{DB_PATH}")
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_conn, _):
+            _apply_pragmas(dbapi_conn, profile)
+
+        _engines[profile] = engine
+    return _engines[profile]
+
+
+def setup_write_db(profile="rollback_full"):
+    Base.metadata.create_all(get_engine(profile))
+    clear_table(profile)
+
+
+def clear_table(profile):
+    conn = raw_connect(profile)
+    conn.execute("DELETE FROM ingest")
+    conn.close()
+
+
+# ---------------- HOOKS ----------------
+# Every method is run with these per-method hooks (see benchmark_methods):
+# setup opens a raw connection with the profile's PRAGMAs, before_each
+# empties the ingest table through it, so each call inserts into an empty
+# table, and teardown closes it. None of this is timed. Setup takes
+# {"rows", "profile"}; the methods get the state {"rows", "profile", "conn"}.
+
+def open_ingest(data):
+    return dict(data, conn=raw_connect(data["profile"]))
+
+
+def empty_ingest(state):
+    state["conn"].execute("DELETE FROM ingest")
+
+
+def close_ingest(state):
+    state["conn"].close()
+
+
+WRITE_HOOKS = {"setup": open_ingest, "before_each": empty_ingest, "teardown": close_ingest}
+
+
+# ---------------- RAW sqlite3 ----------------
+# On the connection from open_ingest, so connecting is not timed here while
+# the Core and ORM methods reuse the engine's pooled connections.
+
+def insert_row_by_row(state):
+    """One INSERT per row, each in its own (autocommit) transaction."""
+    conn = state["conn"]
+    for row in state["rows"]:
+        conn.execute("INSERT INTO ingest (name, score) VALUES (:name, :score)", row)
+
+
+def insert_row_by_row_tx(state):
+    """One INSERT per row inside a single transaction."""
+    conn = state["conn"]
+    conn.execute("BEGIN")
+    for row in state["rows"]:
+        conn.execute("INSERT INTO ingest (name, score) VALUES (:name, :score)", row)
+    conn.execute("COMMIT")
+
+
+def insert_executemany(state):
+    """cursor.executemany in a single transaction."""
+    conn = state["conn"]
+    conn.execute("BEGIN")
+    conn.executemany("INSERT INTO ingest (name, score) VALUES (:name, :score)", state["rows"])
+    conn.execute("COMMIT")
+
+
+def insert_executemany_batched(state):
+    """executemany with one transaction per BATCH_SIZE rows."""
+    conn = state["conn"]
+    rows = state["rows"]
+    for i in range(0, len(rows), BATCH_SIZE):
+        conn.execute("BEGIN")
+        conn.executemany("INSERT INTO ingest (name, score) VALUES (:name, :score)",
+                         rows[i:i + BATCH_SIZE])
+        conn.execute("COMMIT")
+
+
+# ---------------- SQLAlchemy Core ----------------
+
+def insert_core_executemany(data):
+    """conn.execute(insert(table), rows): DBAPI executemany via Core."""
+    with get_engine(data["profile"]).begin() as conn:
+        conn.execute(insert(IngestRow.__table__), data["rows"])
+
+
+def insert_core_values(data):
+    """A single multi-row INSERT ... VALUES (...), (...) per batch."""
+    table = IngestRow.__table__
+    rows = data["rows"]
+    # SQLite limits bound parameters per statement (32766); stay well below.
+    with get_engine(data["profile"]).begin() as conn:
+        for i in range(0, len(rows), BATCH_SIZE):
+            conn.execute(insert(table).values(rows[i:i + BATCH_SIZE]))
+
+
+# ---------------- SQLAlchemy ORM ----------------
+
+def insert_orm_add_all(data):
+    Session = sessionmaker(bind=get_engine(data["profile"]))
+    with Session() as session:
+        session.add_all([IngestRow(**row) for row in data["rows"]])
+        session.commit()
+
+
+def insert_orm_bulk_save_objects(data):
+    Session = sessionmaker(bind=get_engine(data["profile"]))
+    with Session() as session:
+        session.bulk_save_objects([IngestRow(**row) for row in data["rows"]])
+        session.commit()
+
+
+def insert_orm_bulk_insert(data):
+    """ORM-enabled INSERT with a list of dicts (SQLAlchemy 2.0 bulk path)."""
+    Session = sessionmaker(bind=get_engine(data["profile"]))
+    with Session() as session:
+        session.execute(insert(IngestRow), data["rows"])
+        session.commit()
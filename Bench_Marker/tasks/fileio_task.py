@@ -1,12 +1,358 @@
 import json
+import mmap
 import os
+import pickle
+import shutil
+import tempfile
 
-FILE_PATH = "benchmark_file.json"
+from Bench_Marker.core.registry import register, register_setup, register_teardown
 
-def write_stdlib(data):
-    with open(FILE_PATH, "w") as f:
-        json.dump(data, f)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def read_stdlib(_):
-    with open(FILE_PATH) as f:
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# All benchmark files live in one private temp directory (see setup_workdir).
+WORK_DIR = None
+
+
+def setup_workdir():
+    """
+    Create the isolated directory benchmark files are written to.
+    Returns the directory.
+    """
+    global WORK_DIR
+    if WORK_DIR is None:
+        WORK_DIR = tempfile.mkdtemp(prefix="bench_fileio_")
+    return WORK_DIR
+
+
+def cleanup_workdir():
+    global WORK_DIR
+    if WORK_DIR is not None:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+    WORK_DIR = None
+
+
+def workfile(name):
+    return os.path.join(setup_workdir(), name)
+
+
+def make_blob(path, size):
+    """
+    Write `size` random bytes to path and flush them to disk.
+    """
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining:
+            chunk = min(remaining, 1 << 20)
+            f.write(os.urandom(chunk))
+            remaining -= chunk
+        f.flush()
+        os.fsync(f.fileno())
+    return path
+
+
+# ---------------- PAGE CACHE CONTROL ----------------
+
+def drop_page_cache(path):
+    """
+    Ask the kernel to evict path from the page cache so the next read goes
+    to disk. Per-file and unprivileged (posix_fadvise); a no-op where that
+    is unavailable. Returns True if the hint was given.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        return True
+    finally:
+        os.close(fd)
+
+
+def warm_page_cache(path):
+    with open(path, "rb") as f:
+        while f.read(1 << 20):
+            pass
+
+
+@register_setup("file_read", kind="io")
+def make_read_fixture(size):
+    """
+    A `size`-byte file (default 16 MB) in the work directory, read in
+    64 KB buffers from a warm page cache.
+    """
+    path = make_blob(workfile("source.bin"), size or 16 * 1024 * 1024)
+    warm_page_cache(path)
+    return {"path": path, "buffer_size": 64 * 1024, "cache": "warm"}
+
+
+@register_teardown("file_read")
+def remove_read_fixture(_):
+    cleanup_workdir()
+
+
+def _prepare_read(data, path=None):
+    # data["cache"] == "cold": evict before reading (the fadvise call itself
+    # is included in the timing but costs microseconds).
+    if data.get("cache") == "cold":
+        drop_page_cache(path or data["path"])
+
+
+# ---------------- RAW THROUGHPUT ----------------
+# data: {"path", "size", "buffer_size", "cache", "payload" (for writes)}
+
+def write_buffered(data):
+    bs = data["buffer_size"]
+    payload = memoryview(data["payload"])
+    with open(data["path"], "wb", buffering=bs) as f:
+        for i in range(0, len(payload), bs):
+            f.write(payload[i:i + bs])
+
+
+def write_unbuffered(data):
+    """One os.write per buffer_size chunk, no Python-level buffering."""
+    bs = data["buffer_size"]
+    payload = memoryview(data["payload"])
+    fd = os.open(data["path"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for i in range(0, len(payload), bs):
+            os.write(fd, payload[i:i + bs])
+    finally:
+        os.close(fd)
+
+
+def write_fsync(data):
+    """Write then fsync: the cost of making the data durable."""
+    with open(data["path"], "wb") as f:
+        f.write(data["payload"])
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def write_no_fsync(data):
+    with open(data["path"], "wb") as f:
+        f.write(data["payload"])
+
+
+# Pre-opened file: opening happens in a setup hook and every iteration
+# rewinds the file in a before_each hook, so only write() + flush() is
+# timed. Setup takes {"path", "payload"}.
+
+def open_write_file(data):
+    return {"file": open(data["path"], "wb"), "payload": data["payload"]}
+
+
+def rewind_write_file(state):
+    state["file"].seek(0)
+    state["file"].truncate()
+
+
+def close_write_file(state):
+    state["file"].close()
+
+
+def write_open_file(state):
+    state["file"].write(state["payload"])
+    state["file"].flush()
+
+
+@register("file_read", "buffered")
+def read_buffered(data):
+    _prepare_read(data)
+    bs = data["buffer_size"]
+    total = 0
+    with open(data["path"], "rb", buffering=bs) as f:
+        while True:
+            chunk = f.read(bs)
+            if not chunk:
+                return total
+            total += len(chunk)
+
+
+@register("file_read", "read_whole")
+def read_whole(data):
+    _prepare_read(data)
+    with open(data["path"], "rb") as f:
+        return len(f.read())
+
+
+@register("file_read", "readinto")
+def read_readinto(data):
+    """readinto a preallocated buffer: no new bytes object per chunk."""
+    _prepare_read(data)
+    buf = bytearray(data["buffer_size"])
+    view = memoryview(buf)
+    total = 0
+    with open(data["path"], "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(view)
+            if not n:
+                return total
+            total += n
+
+
+@register("file_read", "mmap_copy")
+def read_mmap(data):
+    """Map the file and copy it out in buffer_size slices."""
+    _prepare_read(data)
+    bs = data["buffer_size"]
+    total = 0
+    with open(data["path"], "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            for i in range(0, len(m), bs):
+                total += len(m[i:i + bs])
+    return total
+
+
+@register("file_read", "mmap_touch")
+def read_mmap_touch(data):
+    """Map the file and fault in every page without copying the data."""
+    _prepare_read(data)
+    with open(data["path"], "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            view = memoryview(m)
+            try:
+                return len(bytes(view[::mmap.PAGESIZE]))
+            finally:
+                view.release()
+
+
+# ---------------- COPIES ----------------
+# data: {"path" (source), "dest", "cache"}
+
+def copy_read_write(data):
+    _prepare_read(data)
+    with open(data["path"], "rb") as src, open(data["dest"], "wb") as dst:
+        while True:
+            chunk = src.read(1 << 20)
+            if not chunk:
+                return
+            dst.write(chunk)
+
+
+def copy_shutil(data):
+    _prepare_read(data)
+    shutil.copyfile(data["path"], data["dest"])
+
+
+def copy_sendfile(data):
+    if not hasattr(os, "sendfile"):
+        raise RuntimeError("os.sendfile not available on this platform")
+    _prepare_read(data)
+    with open(data["path"], "rb") as src, open(data["dest"], "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+
+
+def copy_file_range(data):
+    if not hasattr(os, "copy_file_range"):
+        raise RuntimeError("os.copy_file_range not available on this platform")
+    _prepare_read(data)
+    with open(data["path"], "rb") as src, open(data["dest"], "wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+
+
+# ---------------- SERIALIZED FORMATS ----------------
+# Writers take {"obj"}; readers take {"cache"}. Each format has its own file
+# in the work directory, so a load reads what the matching dump wrote.
+# NumPy tasks expect "obj" to be an ndarray.
+
+FORMAT_FILES = {
+    "json": "payload.json",
+    "orjson": "payload.orjson",
+    "msgpack": "payload.msgpack",
+    "pickle5": "payload.pickle",
+    "npy": "payload.npy",
+}
+
+def dump_json(data):
+    with open(workfile(FORMAT_FILES["json"]), "w") as f:
+        json.dump(data["obj"], f)
+
+
+def load_json(data):
+    path = workfile(FORMAT_FILES["json"])
+    _prepare_read(data, path)
+    with open(path) as f:
         return json.load(f)
+
+
+def dump_orjson(data):
+    if not orjson:
+        raise RuntimeError("orjson not installed")
+    with open(workfile(FORMAT_FILES["orjson"]), "wb") as f:
+        f.write(orjson.dumps(data["obj"]))
+
+
+def load_orjson(data):
+    if not orjson:
+        raise RuntimeError("orjson not installed")
+    path = workfile(FORMAT_FILES["orjson"])
+    _prepare_read(data, path)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def dump_msgpack(data):
+    if not msgpack:
+        raise RuntimeError("msgpack not installed")
+    with open(workfile(FORMAT_FILES["msgpack"]), "wb") as f:
+        f.write(msgpack.packb(data["obj"]))
+
+
+def load_msgpack(data):
+    if not msgpack:
+        raise RuntimeError("msgpack not installed")
+    path = workfile(FORMAT_FILES["msgpack"])
+    _prepare_read(data, path)
+    with open(path, "rb") as f:
+        return msgpack.unpackb(f.read())
+
+
+def dump_pickle5(data):
+    with open(workfile(FORMAT_FILES["pickle5"]), "wb") as f:
+        pickle.dump(data["obj"], f, protocol=5)
+
+
+def load_pickle5(data):
+    path = workfile(FORMAT_FILES["pickle5"])
+    _prepare_read(data, path)
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def dump_npy(data):
+    if numpy is None:
+        raise RuntimeError("numpy not installed")
+    numpy.save(workfile(FORMAT_FILES["npy"]), data["obj"])
+
+
+def load_npy(data):
+    if numpy is None:
+        raise RuntimeError("numpy not installed")
+    path = workfile(FORMAT_FILES["npy"])
+    _prepare_read(data, path)
+    return numpy.load(path)
@@ -0,0 +1,172 @@
+"""
+Local, deterministic HTTP target for the HTTP client benchmarks.
+
+Every response is shaped by query parameters, so one server covers all
+scenarios:
+
+  /todos/1                 small JSON document (like jsonplaceholder)
+  /json?size=N             JSON document of roughly N bytes
+  ...&delay=MS             sleep MS milliseconds before responding
+  ...&chunked=1&chunk=K    Transfer-Encoding: chunked, K bytes per chunk
+  ...&keepalive=0          send "Connection: close" and drop the connection
+
+Usage:
+  python -m Bench_Marker.tasks.http_server --port 8765
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+
+TODO = {"userId": 1, "id": 1, "title": "delectus aut autem", "completed": False}
+
+
+@lru_cache(maxsize=64)
+def json_body(size):
+    """
+    Deterministic JSON document of about `size` bytes.
+    """
+    if size <= 0:
+        return json.dumps(TODO).encode()
+    item = json.dumps(TODO)
+    count = max(1, size // (len(item) + 2))
+    return json.dumps([dict(TODO, id=i) for i in range(count)]).encode()
+
+
+class BenchmarkHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so clients can keep connections alive.
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # second write waits for the client's delayed ACK (~40ms on Linux).
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/health":
+            body = b'{"ok": true}'
+        elif url.path.startswith("/todos/"):
+            body = json_body(0)
+        elif url.path == "/json":
+            body = json_body(int(params.get("size", 0)))
+        else:
+            self.send_error(404)
+            return
+
+        delay = float(params.get("delay", 0)) / 1000.0
+        if delay:
+            time.sleep(delay)
+
+        keepalive = params.get("keepalive", "1") != "0"
+        chunked = params.get("chunked", "0") == "1"
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if not keepalive:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+
+        if chunked:
+            chunk = max(1, int(params.get("chunk", 1024)))
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(0, len(body), chunk):
+                part = body[i:i + chunk]
+                self.wfile.write(f"{len(part):X}\r\n".encode() + part + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+
+class BenchmarkServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def serve(host="127.0.0.1", port=0, ready=None):
+    """
+    Serve forever. If ready is a queue, the bound port is put on it.
+    """
+    server = BenchmarkServer((host, port), BenchmarkHandler)
+    if ready is not None:
+        ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_server(host="127.0.0.1", port=0, in_process=False):
+    """
+    Start the target server and return (handle, base_url).
+
+    By default it runs in a separate process so serving requests does not
+    compete with the client under test for the GIL. Stop it with
+    stop_server(handle).
+    """
+    if in_process:
+        server = BenchmarkServer((host, port), BenchmarkHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server, f"http://{host}:{server.server_address[1]}"
+
+    ctx = mp.get_context("spawn")
+    ready = ctx.Queue()
+    proc = ctx.Process(target=serve, args=(host, port, ready), daemon=True)
+    proc.start()
+    bound_port = ready.get(timeout=30)
+    return proc, f"http://{host}:{bound_port}"
+
+
+def stop_server(handle):
+    if isinstance(handle, BenchmarkServer):
+        handle.shutdown()
+        handle.server_close()
+    else:
+        handle.terminate()
+        handle.join()
+
+
+@contextmanager
+def target_url(path="/todos/1"):
+    """
+    Yield the URL HTTP benchmarks should hit.
+
+    If BENCH_HTTP_URL is set it is used as is (an external target);
+    otherwise a local server is started for the duration of the block.
+    """
+    external = os.environ.get("BENCH_HTTP_URL")
+    if external:
+        yield external
+        return
+
+    handle, base_url = start_server()
+    try:
+        yield base_url + path
+    finally:
+        stop_server(handle)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP benchmark target.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    print(f"Benchmark target running at http://{args.host}:{args.port}")
+    serve(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,266 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 import httpx
 
-URL = "https://jsonplaceholder.typicode.com/todos/1"
+from Bench_Marker.core.registry import register, register_setup, register_teardown
+from Bench_Marker.tasks.http_server import start_server, stop_server
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Every method takes data carrying the target "url" (see http_server.py),
+# so the target travels with the data into isolated worker processes.
+# BENCH_HTTP_URL points start_target at another host instead.
 TIMEOUT = 5  # seconds
+MAX_CONCURRENCY = 64  # connection pool size for the reused clients
+
+# Servers started by start_target, by url. Setup and teardown run in the
+# parent process, so the handles never have to be pickled.
+_servers = {}
+
 
+@register_setup("http_client_requests", kind="io")
+def start_target(_=None):
+    """
+    Start a local server (unless BENCH_HTTP_URL is set) and return the
+    data for the methods: {"url": ...}.
+    """
+    external = os.environ.get("BENCH_HTTP_URL")
+    if external:
+        return {"url": external}
+    handle, base_url = start_server()
+    url = base_url + "/todos/1"
+    _servers[url] = handle
+    return {"url": url}
 
-def fetch_requests(_):
-    response = requests.get(URL, timeout=TIMEOUT)
+
+@register_teardown("http_client_requests")
+def stop_target(data):
+    handle = _servers.pop(data["url"], None)
+    if handle is not None:
+        stop_server(handle)
+
+
+@register("http_client_requests", "requests")
+def fetch_requests(data):
+    response = requests.get(data["url"], timeout=TIMEOUT)
     response.raise_for_status()
     return response.json()
 
 
-def fetch_httpx(_):
+@register("http_client_requests", "httpx")
+def fetch_httpx(data):
     with httpx.Client(timeout=TIMEOUT) as client:
-        response = client.get(URL)
+        response = client.get(data["url"])
         response.raise_for_status()
         return response.json()
+
+
+# ---------------- REUSED CLIENTS ----------------
+# Created lazily so importing this module does not open connections, and
+# kept in a clients dict so keep-alive connections are reused across calls:
+# the module's own for single calls, or the one open_pool puts in the data
+# of the concurrent batches (closed by close_pool).
+
+def _new_clients():
+    return {"local": threading.local(), "lock": threading.Lock(),
+            "sessions": [], "httpx": None}
+
+
+_clients = _new_clients()
+
+
+def _requests_session(clients):
+    # requests.Session is not guaranteed thread-safe: one per thread.
+    session = getattr(clients["local"], "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=MAX_CONCURRENCY
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        clients["local"].session = session
+        with clients["lock"]:
+            clients["sessions"].append(session)
+    return session
+
+
+def _shared_httpx_client(clients):
+    with clients["lock"]:
+        if clients["httpx"] is None:
+            clients["httpx"] = httpx.Client(
+                timeout=TIMEOUT,
+                limits=httpx.Limits(max_connections=MAX_CONCURRENCY,
+                                    max_keepalive_connections=MAX_CONCURRENCY),
+            )
+    return clients["httpx"]
+
+
+def _close_clients(clients):
+    for session in clients["sessions"]:
+        session.close()
+    if clients["httpx"] is not None:
+        clients["httpx"].close()
+
+
+@register("http_client_requests", "requests_session")
+def fetch_requests_session(data):
+    session = _requests_session(data.get("clients", _clients))
+    response = session.get(data["url"], timeout=TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+@register("http_client_requests", "httpx_client")
+def fetch_httpx_client(data):
+    response = _shared_httpx_client(data.get("clients", _clients)).get(data["url"])
+    response.raise_for_status()
+    return response.json()
+
+
+# ---------------- CLIENTS FROM SETUP HOOKS ----------------
+# Client construction happens in a per-method setup hook, outside the timed
+# region, so these measure the steady-state request cost and report the
+# construction cost separately (see benchmark_methods hooks).
+
+def open_requests_session(data):
+    return {"url": data["url"], "client": requests.Session()}
+
+
+def open_httpx_client(data):
+    return {"url": data["url"], "client": httpx.Client(timeout=TIMEOUT)}
+
+
+def close_client(state):
+    state["client"].close()
+
+
+@register("http_client_requests", "requests_session_hooked",
+          hooks={"setup": open_requests_session, "teardown": close_client})
+@register("http_client_requests", "httpx_client_hooked",
+          hooks={"setup": open_httpx_client, "teardown": close_client})
+def fetch_with_client(state):
+    response = state["client"].get(state["url"], timeout=TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+# ---------------- CONCURRENT BATCHES ----------------
+# Each batch_* method takes {"url", "requests": N, "concurrency": C}, issues N
+# requests with at most C in flight and returns the per-request latencies.
+# They need the state from open_pool: one executor and one set of clients
+# for the threaded batches, and one event loop with an httpx.AsyncClient
+# (and aiohttp.ClientSession) for the async ones, so repeated batches reuse
+# the same threads and keep-alive connections whatever the client.
+# close_pool shuts them down.
+
+async def _open_async_clients(concurrency):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    clients = {"httpx_async": httpx.AsyncClient(timeout=TIMEOUT, limits=limits)}
+    if aiohttp:
+        # Created inside the loop it will run on.
+        clients["aiohttp"] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=concurrency),
+            timeout=aiohttp.ClientTimeout(total=TIMEOUT),
+        )
+    return clients
+
+
+async def _close_async_clients(clients):
+    await clients["httpx_async"].aclose()
+    if "aiohttp" in clients:
+        await clients["aiohttp"].close()
+
+
+def open_pool(data):
+    loop = asyncio.new_event_loop()
+    return dict(data, pool=ThreadPoolExecutor(max_workers=data["concurrency"]),
+                clients=_new_clients(), loop=loop,
+                async_clients=loop.run_until_complete(_open_async_clients(data["concurrency"])))
+
+
+def close_pool(state):
+    state["pool"].shutdown()
+    _close_clients(state["clients"])
+    loop = state["loop"]
+    loop.run_until_complete(_close_async_clients(state["async_clients"]))
+    loop.close()
+
+
+def _timed(fetch, data):
+    start = time.perf_counter()
+    fetch(data)
+    return time.perf_counter() - start
+
+
+def _run_threaded(fetch, state):
+    total, concurrency = state["requests"], state["concurrency"]
+    if concurrency == 1:
+        return [_timed(fetch, state) for _ in range(total)]
+    return list(state["pool"].map(lambda _: _timed(fetch, state), range(total)))
+
+
+def batch_requests(state):
+    return _run_threaded(fetch_requests, state)
+
+
+def batch_requests_session(state):
+    return _run_threaded(fetch_requests_session, state)
+
+
+def batch_httpx(state):
+    return _run_threaded(fetch_httpx, state)
+
+
+def batch_httpx_client(state):
+    return _run_threaded(fetch_httpx_client, state)
+
+
+async def _fan_out(fetch_one, total, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await fetch_one()
+            return time.perf_counter() - start
+
+    return await asyncio.gather(*(one() for _ in range(total)))
+
+
+async def _httpx_async(client, url, total, concurrency):
+    async def fetch_one():
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    return await _fan_out(fetch_one, total, concurrency)
+
+
+async def _aiohttp(session, url, total, concurrency):
+    async def fetch_one():
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    return await _fan_out(fetch_one, total, concurrency)
+
+
+def batch_httpx_async(state):
+    return state["loop"].run_until_complete(_httpx_async(
+        state["async_clients"]["httpx_async"], state["url"], state["requests"], state["concurrency"]))
+
+
+def batch_aiohttp(state):
+    if not aiohttp:
+        raise RuntimeError("aiohttp not installed")
+    return state["loop"].run_until_complete(_aiohttp(
+        state["async_clients"]["aiohttp"], state["url"], state["requests"], state["concurrency"]))
@@ -0,0 +1,250 @@
+import json
+import os
+import random
+import re
+import shutil
+import tempfile
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from Bench_Marker.core.payloads import make_log_record, write_corpus
+from Bench_Marker.core.registry import register, register_setup, register_teardown
+
+CHUNK_SIZE = 64 * 1024
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Parsing tasks take {"array": path, "ndjson": path}, the same records
+# written by Bench_Marker.core.payloads.write_corpus in both formats, and
+# return the record count.
+# Serialization tasks take {"obj"} and return the encoded size in bytes.
+
+
+@register_setup("json_streaming")
+def make_corpus(size):
+    """
+    The same log records as a JSON array and as NDJSON, `size` bytes each
+    (default 16 MB), in a fresh temporary directory.
+    """
+    work_dir = tempfile.mkdtemp(prefix="bench_json_stream_")
+    data = {
+        "dir": work_dir,
+        "array": os.path.join(work_dir, "corpus.json"),
+        "ndjson": os.path.join(work_dir, "corpus.ndjson"),
+    }
+    write_corpus(data["array"], size or 16 * 1024 * 1024, fmt="array")
+    write_corpus(data["ndjson"], size or 16 * 1024 * 1024, fmt="ndjson")
+    return data
+
+
+@register_teardown("json_streaming")
+def remove_corpus(data):
+    shutil.rmtree(data["dir"], ignore_errors=True)
+
+
+@register_setup("json_serialization")
+def make_records(size):
+    """`size` log records (default 50 000) to serialize."""
+    rng = random.Random(0)
+    return {"obj": [make_log_record(i, rng) for i in range(size or 50_000)]}
+
+
+# ---------------- WHOLE DOCUMENT ----------------
+
+@register("json_streaming", "loads_whole_json")
+def loads_whole_stdlib(data):
+    with open(data["array"], "rb") as f:
+        return len(json.loads(f.read()))
+
+
+@register("json_streaming", "loads_whole_ujson", available=ujson is not None)
+def loads_whole_ujson(data):
+    if not ujson:
+        raise RuntimeError("ujson not installed")
+    with open(data["array"], "rb") as f:
+        return len(ujson.loads(f.read()))
+
+
+@register("json_streaming", "loads_whole_orjson", available=orjson is not None)
+def loads_whole_orjson(data):
+    if not orjson:
+        raise RuntimeError("orjson not installed")
+    with open(data["array"], "rb") as f:
+        return len(orjson.loads(f.read()))
+
+
+# ---------------- NDJSON, ONE LINE AT A TIME ----------------
+
+def _count_lines(path, loads):
+    count = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                loads(line)
+                count += 1
+    return count
+
+
+@register("json_streaming", "ndjson_json")
+def ndjson_stdlib(data):
+    return _count_lines(data["ndjson"], json.loads)
+
+
+@register("json_streaming", "ndjson_ujson", available=ujson is not None)
+def ndjson_ujson(data):
+    if not ujson:
+        raise RuntimeError("ujson not installed")
+    return _count_lines(data["ndjson"], ujson.loads)
+
+
+@register("json_streaming", "ndjson_orjson", available=orjson is not None)
+def ndjson_orjson(data):
+    if not orjson:
+        raise RuntimeError("orjson not installed")
+    return _count_lines(data["ndjson"], orjson.loads)
+
+
+# ---------------- INCREMENTAL ARRAY PARSING ----------------
+
+def iter_json_array(f, chunk_size=CHUNK_SIZE):
+    """
+    Yield the elements of a top-level JSON array read from text file f,
+    holding at most one element plus one chunk in memory.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    started = False
+    first = True  # no element read yet
+    after_comma = False
+    eof = False
+
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()
+        if pos < len(buf):
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError("top-level value is not an array")
+                started = True
+                continue_at = pos + 1
+            elif buf[pos] == "]":
+                if after_comma:
+                    raise ValueError("trailing ',' before ']'")
+                return
+            elif buf[pos] == ",":
+                if first or after_comma:
+                    raise ValueError("expected array element before ','")
+                after_comma = True
+                continue_at = pos + 1
+            else:
+                if not (first or after_comma):
+                    raise ValueError("expected ',' or ']' after array element")
+                try:
+                    item, continue_at = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    # Element split across chunks: read more and retry.
+                    if eof:
+                        raise
+                    continue_at = None
+                else:
+                    after = _WHITESPACE.match(buf, continue_at).end()
+                    if after < len(buf) and buf[after] in ",]":
+                        first = after_comma = False
+                        yield item
+                    elif eof:
+                        raise ValueError("expected ',' or ']' after array element")
+                    else:
+                        # A number cut at the chunk boundary decodes too
+                        # early ("3" of "3.5"): wait for the delimiter.
+                        continue_at = None
+            if continue_at is not None:
+                pos = continue_at
+                continue
+        if eof:
+            raise ValueError("unterminated array")
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buf = buf[pos:] + chunk
+        pos = 0
+
+
+@register("json_streaming", "iterate_array_json")
+def iterate_array_stdlib(data):
+    """JSONDecoder.raw_decode over fixed-size chunks."""
+    count = 0
+    with open(data["array"]) as f:
+        for _ in iter_json_array(f):
+            count += 1
+    return count
+
+
+@register("json_streaming", "iterate_array_ijson", available=ijson is not None)
+def iterate_array_ijson(data):
+    if not ijson:
+        raise RuntimeError("ijson not installed")
+    count = 0
+    with open(data["array"], "rb") as f:
+        for _ in ijson.items(f, "item", use_float=True):
+            count += 1
+    return count
+
+
+# ---------------- SERIALIZATION ----------------
+
+@register("json_serialization", "json")
+def dumps_stdlib(data):
+    return len(json.dumps(data["obj"]))
+
+
+@register("json_serialization", "json_compact")
+def dumps_stdlib_compact(data):
+    return len(json.dumps(data["obj"], separators=(",", ":"), ensure_ascii=False))
+
+
+@register("json_serialization", "ujson", available=ujson is not None)
+def dumps_ujson(data):
+    if not ujson:
+        raise RuntimeError("ujson not installed")
+    return len(ujson.dumps(data["obj"]))
+
+
+@register("json_serialization", "orjson", available=orjson is not None)
+def dumps_orjson(data):
+    if not orjson:
+        raise RuntimeError("orjson not installed")
+    return len(orjson.dumps(data["obj"]))
+
+
+@register("json_serialization", "orjson_sort_keys", available=orjson is not None)
+def dumps_orjson_sorted(data):
+    if not orjson:
+        raise RuntimeError("orjson not installed")
+    return len(orjson.dumps(data["obj"], option=orjson.OPT_SORT_KEYS))
+
+
+@register("json_serialization", "orjson_indent_2", available=orjson is not None)
+def dumps_orjson_indent(data):
+    if not orjson:
+        raise RuntimeError("orjson not installed")
+    return len(orjson.dumps(data["obj"], option=orjson.OPT_INDENT_2))
+
+
+@register("json_serialization", "orjson_ndjson", available=orjson is not None)
+def dumps_orjson_ndjson(data):
+    """One document per record, newline-appended by orjson itself."""
+    if not orjson:
+        raise RuntimeError("orjson not installed")
+    return sum(len(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+               for record in data["obj"])
@@ -1,5 +1,8 @@
 import json
 
+from Bench_Marker.core.payloads import make_payload
+from Bench_Marker.core.registry import register, register_setup
+
 try:
     import ujson
 except ImportError:
@@ -11,16 +14,25 @@ except ImportError:
     orjson = None
 
 
+@register_setup("json_parsing")
+def make_document(size):
+    """A JSON string of `size` records (default 1000)."""
+    return json.dumps(make_payload("records", size or 1000))
+
+
+@register("json_parsing", "json")
 def parse_json_stdlib(data):
     return json.loads(data)
 
 
+@register("json_parsing", "ujson", available=ujson is not None)
 def parse_json_ujson(data):
     if not ujson:
         raise RuntimeError("ujson not installed")
     return ujson.loads(data)
 
 
+@register("json_parsing", "orjson", available=orjson is not None)
 def parse_json_orjson(data):
     if not orjson:
         raise RuntimeError("orjson not installed")
@@ -0,0 +1,147 @@
+import os
+import random
+import shutil
+import tempfile
+from functools import partial
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, selectinload
+
+from Bench_Marker.core.quiz_app import quiz_module, build_quiz_database
+from Bench_Marker.core.registry import register, register_setup, register_teardown
+
+# The catalog reads app.py now serves from its cache:
+#   view       : quiz -> chapter -> subject by primary key
+#   load_user  : the logged-in user, as every dashboard and admin check does
+#   admin_tree : every subject with its chapters (admin_dashboard)
+LOOKUPS = ["view", "load_user", "admin_tree"]
+
+# "db" reads the database every time, as the routes did; "memory" and
+# "redis" go through cache.Cache with that backend ("redis" is a
+# fakeredis stand-in and only runs when fakeredis is installed).
+BACKENDS = ["db", "memory", "redis"]
+
+# Lookups are drawn from the first HOT_USERS users so the LRU sees the
+# repetition a real login population has.
+HOT_USERS = 1_000
+
+
+@register_setup("quiz_cache", kind="io")
+def make_cache_database(scale=None, seed=0):
+    """
+    A datagen database at `scale` plus one Cache per available backend.
+    """
+    cache = quiz_module("cache")
+    models = quiz_module("models")
+
+    work_dir = tempfile.mkdtemp(prefix="bench_quiz_cache_")
+    path = os.path.join(work_dir, "quiz.db")
+    build_quiz_database(path, scale or "small", seed=seed)
+    engine = create_engine(f"sqlite:///{path}")
+
+    with Session(engine) as session:
+        user_ids = session.scalars(select(models.User.id).limit(HOT_USERS)).all()
+        quiz_ids = session.scalars(select(models.Quiz.id)).all()
+
+    caches = {"memory": cache.Cache(cache.make_backend("memory"))}
+    if cache.fakeredis is not None:
+        caches["redis"] = cache.Cache(cache.make_backend("redis", url="fakeredis://"))
+    data = {"work_dir": work_dir, "engine": engine, "rng": random.Random(seed),
+            "user_ids": user_ids, "quiz_ids": quiz_ids, "caches": caches}
+    warm_caches(data)
+    return data
+
+
+def warm_caches(data):
+    """
+    Load every hot user and every quiz once, so the methods time a warm
+    cache (the app's steady state); hit counters start from zero after.
+    """
+    models = quiz_module("models")
+    for cache in data["caches"].values():
+        with Session(data["engine"]) as session:
+            for user_id in data["user_ids"]:
+                _get(session, cache, models.User, user_id, exclude=("password",))
+            for quiz_id in data["quiz_ids"]:
+                quiz = _get(session, cache, models.Quiz, quiz_id)
+                chapter = _get(session, cache, models.Chapter, quiz.chapter_id)
+                _get(session, cache, models.Subject, chapter.subject_id)
+            _admin_tree(session, cache, data)
+        cache.reset_stats()
+
+
+@register_teardown("quiz_cache")
+def remove_cache_database(data):
+    data["engine"].dispose()
+    shutil.rmtree(data["work_dir"], ignore_errors=True)
+
+
+def _get(session, cache, model, ident, exclude=()):
+    """
+    app.cached_get against `cache`, or session.get when cache is None.
+    """
+    if cache is None:
+        return session.get(model, ident)
+    snapshots = quiz_module("cache")
+
+    def load():
+        obj = session.get(model, ident)
+        return snapshots.snapshot(obj, exclude) if obj is not None else None
+
+    values = cache.get_or_load(f"{model.__tablename__}:{ident}", load)
+    return snapshots.restore(session, model, values) if values is not None else None
+
+
+def _view(session, cache, data):
+    models = quiz_module("models")
+    quiz = _get(session, cache, models.Quiz, data["rng"].choice(data["quiz_ids"]))
+    chapter = _get(session, cache, models.Chapter, quiz.chapter_id)
+    subject = _get(session, cache, models.Subject, chapter.subject_id)
+    return quiz.date_of_quiz, chapter.name, subject.name
+
+
+def _load_user(session, cache, data):
+    models = quiz_module("models")
+    user = _get(session, cache, models.User, data["rng"].choice(data["user_ids"]),
+                exclude=("password",))
+    return user.full_name, user.role
+
+
+def _admin_tree(session, cache, data):
+    models = quiz_module("models")
+    snapshots = quiz_module("cache")
+
+    def load():
+        subjects = session.scalars(
+            select(models.Subject).options(selectinload(models.Subject.chapters))
+        ).all()
+        return [dict(snapshots.snapshot(subject),
+                     chapters=[snapshots.snapshot(c) for c in subject.chapters])
+                for subject in subjects]
+
+    return load() if cache is None else cache.get_or_load("subjects:tree", load)
+
+
+_LOOKUPS = {"view": _view, "load_user": _load_user, "admin_tree": _admin_tree}
+
+
+def run_lookup(data, lookup, backend):
+    """
+    One request's worth of `lookup` in a fresh session.
+    """
+    cache = None if backend == "db" else data["caches"][backend]
+    with Session(data["engine"]) as session:
+        return _LOOKUPS[lookup](session, cache, data)
+
+
+def cache_stats(data):
+    return {backend: cache.stats() for backend, cache in data["caches"].items()}
+
+
+# One method per (lookup, backend): view_db, view_memory, view_redis, ...
+METHODS = {}
+for _lookup in LOOKUPS:
+    for _backend in BACKENDS:
+        METHODS[(_lookup, _backend)] = register("quiz_cache", f"{_lookup}_{_backend}")(
+            partial(run_lookup, lookup=_lookup, backend=_backend)
+        )
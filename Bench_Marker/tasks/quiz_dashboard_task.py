@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+
+from jinja2 import Environment
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, selectinload
+
+from Bench_Marker.core.quiz_app import quiz_models, build_quiz_database
+from Bench_Marker.core.registry import register, register_setup, register_teardown
+
+# Catalog shape for every size: 5 subjects x 10 chapters x 5 quizzes.
+# The total question count is spread over these 250 quizzes.
+SUBJECTS = 5
+CHAPTERS_PER_SUBJECT = 10
+QUIZZES_PER_CHAPTER = 5
+QUIZZES = SUBJECTS * CHAPTERS_PER_SUBJECT * QUIZZES_PER_CHAPTER
+
+# The dashboards' table rows, before and after the counts moved out of the
+# templates. The rest of each page does not depend on the question count.
+TEMPLATES = {
+    "user_selectattr": """{% for quiz in quizzes %}<tr><td>{{ loop.index }}</td>
+<td>{{ questions | selectattr('quiz_id', 'equalto', quiz.id) | list | length }}</td>
+<td>{{ quiz.date_of_quiz }}</td><td>{{ quiz.time_duration }}</td></tr>{% endfor %}""",
+    "user_grouped": """{% for quiz in quizzes %}<tr><td>{{ loop.index }}</td>
+<td>{{ question_counts.get(quiz.id, 0) }}</td>
+<td>{{ quiz.date_of_quiz }}</td><td>{{ quiz.time_duration }}</td></tr>{% endfor %}""",
+    "admin_selectattr": """{% for subject in subjects %}<h2>{{ subject.name }}</h2>
+{% for chapter in chapters %}{% if chapter.subject_id == subject.id %}<tr><td>{{ chapter.name }}</td>
+<td>{{ questions | selectattr('chapter_id', 'equalto', chapter.id) | list | length }}</td></tr>
+{% endif %}{% endfor %}{% endfor %}""",
+    "admin_grouped": """{% for subject in subjects %}<h2>{{ subject.name }}</h2>
+{% for chapter in subject.chapters %}<tr><td>{{ chapter.name }}</td>
+<td>{{ question_counts.get(chapter.id, 0) }}</td></tr>
+{% endfor %}{% endfor %}""",
+}
+
+_env = Environment(autoescape=True)
+_templates = {name: _env.from_string(source) for name, source in TEMPLATES.items()}
+
+
+@register_setup("quiz_dashboards", kind="io")
+def make_dashboard_database(questions=None):
+    """
+    A datagen database with `questions` questions (default 2500) over the
+    fixed 250-quiz catalog.
+    """
+    questions = questions or 2_500
+    work_dir = tempfile.mkdtemp(prefix="bench_quiz_dash_")
+    path = os.path.join(work_dir, "quiz.db")
+    build_quiz_database(path, "small", users=100, scores=1_000, subjects=SUBJECTS,
+                        chapters_per_subject=CHAPTERS_PER_SUBJECT,
+                        quizzes_per_chapter=QUIZZES_PER_CHAPTER,
+                        questions_per_quiz=max(1, questions // QUIZZES))
+    engine = create_engine(f"sqlite:///{path}")
+    return {"work_dir": work_dir, "engine": engine, "questions": questions}
+
+
+@register_teardown("quiz_dashboards")
+def remove_dashboard_database(data):
+    data["engine"].dispose()
+    shutil.rmtree(data["work_dir"], ignore_errors=True)
+
+
+def _counts(session, column):
+    models = quiz_models()
+    return dict(session.execute(
+        select(column, func.count(models.Question.id)).group_by(column)
+    ).all())
+
+
+# Each method runs the view's queries and renders its rows in a fresh
+# session, as one request would.
+
+@register("quiz_dashboards", "user_dashboard_selectattr")
+def user_dashboard_selectattr(data):
+    models = quiz_models()
+    with Session(data["engine"]) as session:
+        quizzes = session.scalars(select(models.Quiz)).all()
+        questions = session.scalars(select(models.Question)).all()
+        return _templates["user_selectattr"].render(quizzes=quizzes, questions=questions)
+
+
+@register("quiz_dashboards", "user_dashboard_grouped")
+def user_dashboard_grouped(data):
+    models = quiz_models()
+    with Session(data["engine"]) as session:
+        quizzes = session.scalars(select(models.Quiz)).all()
+        counts = _counts(session, models.Question.quiz_id)
+        return _templates["user_grouped"].render(quizzes=quizzes, question_counts=counts)
+
+
+@register("quiz_dashboards", "admin_dashboard_selectattr")
+def admin_dashboard_selectattr(data):
+    models = quiz_models()
+    with Session(data["engine"]) as session:
+        subjects = session.scalars(select(models.Subject)).all()
+        chapters = session.scalars(select(models.Chapter)).all()
+        questions = session.scalars(select(models.Question)).all()
+        return _templates["admin_selectattr"].render(subjects=subjects, chapters=chapters,
+                                                     questions=questions)
+
+
+@register("quiz_dashboards", "admin_dashboard_grouped")
+def admin_dashboard_grouped(data):
+    models = quiz_models()
+    with Session(data["engine"]) as session:
+        subjects = session.scalars(
+            select(models.Subject).options(selectinload(models.Subject.chapters))
+        ).all()
+        counts = _counts(session, models.Question.chapter_id)
+        return _templates["admin_grouped"].render(subjects=subjects, question_counts=counts)
@@ -0,0 +1,199 @@
+import os
+import random
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from Bench_Marker.core.quiz_app import quiz_module, build_quiz_database
+from Bench_Marker.core.registry import register, register_setup, register_teardown
+
+# Submits waiting on the SQLite write lock at high concurrency.
+LOCK_TIMEOUT = 60
+
+
+@register_setup("quiz_grading", kind="io")
+def make_grading_database(scale=None, seed=0):
+    """
+    A datagen database at `scale`, the question ids of every quiz (to fill
+    in forms), an answer-key cache and a grading.ScoreWriter on it.
+    """
+    models = quiz_module("models")
+    cache = quiz_module("cache")
+    grading = quiz_module("grading")
+
+    work_dir = tempfile.mkdtemp(prefix="bench_quiz_grading_")
+    path = os.path.join(work_dir, "quiz.db")
+    build_quiz_database(path, scale or "small", seed=seed)
+    engine = create_engine(f"sqlite:///{path}", connect_args={"timeout": LOCK_TIMEOUT})
+    models.enable_sqlite_foreign_keys(engine)
+
+    questions = {}
+    with Session(engine) as session:
+        user_ids = session.scalars(select(models.User.id).limit(1000)).all()
+        for quiz_id, question_id in session.execute(
+            select(models.Question.quiz_id, models.Question.id).order_by(models.Question.id)
+        ):
+            questions.setdefault(quiz_id, []).append(question_id)
+
+    return {"work_dir": work_dir, "engine": engine, "rng": random.Random(seed),
+            "user_ids": user_ids, "questions": questions, "quiz_ids": sorted(questions),
+            "cache": cache.Cache(cache.make_backend("memory")),
+            "writer": grading.ScoreWriter(engine)}
+
+
+@register_teardown("quiz_grading")
+def remove_grading_database(data):
+    data["writer"].close()
+    data["engine"].dispose()
+    shutil.rmtree(data["work_dir"], ignore_errors=True)
+
+
+def _submission(data):
+    """
+    (quiz_id, user_id, form) with every question answered at random, as
+    quiz.html posts it.
+    """
+    rng = data["rng"]
+    quiz_id = rng.choice(data["quiz_ids"])
+    form = {str(question_id): str(rng.randint(1, 4)) for question_id in data["questions"][quiz_id]}
+    return quiz_id, rng.choice(data["user_ids"]), form
+
+
+def _answer_key(data, session, quiz_id):
+    grading = quiz_module("grading")
+    return data["cache"].get_or_load(f"answers:{quiz_id}",
+                                     lambda: grading.load_answer_key(session, quiz_id))
+
+
+@register("quiz_grading", "submit_orm")
+def submit_orm(data):
+    """
+    submit_quiz as it was: load the quiz's Question objects, grade them in
+    a loop, one transaction per submit.
+    """
+    models = quiz_module("models")
+    aggregates = quiz_module("aggregates")
+    quiz_id, user_id, form = _submission(data)
+    with Session(data["engine"]) as session:
+        total_score = 0
+        questions = session.scalars(select(models.Question).where(models.Question.quiz_id == quiz_id))
+        for question in questions:
+            selected_answer = form.get(str(question.id))
+            if selected_answer and int(selected_answer) == question.correct_answer:
+                total_score += 1
+        session.add(models.Score(quiz_id=quiz_id, user_id=user_id,
+                                 time_stamp_of_attempt=datetime.now(), total_scored=total_score))
+        aggregates.record_attempt(session, quiz_id, user_id, total_score)
+        session.commit()
+
+
+@register("quiz_grading", "submit_key_sync")
+def submit_key_sync(data):
+    """
+    Cached answer key and grade(), still one transaction per submit
+    (QUIZ_SCORE_WRITES=sync).
+    """
+    models = quiz_module("models")
+    aggregates = quiz_module("aggregates")
+    grading = quiz_module("grading")
+    quiz_id, user_id, form = _submission(data)
+    with Session(data["engine"]) as session:
+        total_score = grading.grade(_answer_key(data, session, quiz_id), form)
+        session.add(models.Score(quiz_id=quiz_id, user_id=user_id,
+                                 time_stamp_of_attempt=datetime.now(), total_scored=total_score))
+        aggregates.record_attempt(session, quiz_id, user_id, total_score)
+        session.commit()
+
+
+def _submit_queued(data, wait):
+    grading = quiz_module("grading")
+    quiz_id, user_id, form = _submission(data)
+    with Session(data["engine"]) as session:
+        total_score = grading.grade(_answer_key(data, session, quiz_id), form)
+    pending = data["writer"].submit(quiz_id, user_id, total_score, datetime.now())
+    if wait:
+        pending.result()
+
+
+@register("quiz_grading", "submit_key_group")
+def submit_key_group(data):
+    """
+    Cached key; the score goes through the ScoreWriter and the submit waits
+    for its batch to commit (QUIZ_SCORE_WRITES=group).
+    """
+    _submit_queued(data, wait=True)
+
+
+@register("quiz_grading", "submit_key_behind")
+def submit_key_behind(data):
+    """
+    Cached key; the submit returns once the score is queued
+    (QUIZ_SCORE_WRITES=behind).
+    """
+    _submit_queued(data, wait=False)
+
+
+# ---------------- CONCURRENT BATCHES ----------------
+# batch_submissions takes data with "submissions": N and "concurrency": C,
+# runs N submits with at most C in flight and returns their latencies. The
+# ScoreWriter is flushed before returning, so the caller's wall time covers
+# every score reaching the database.
+
+def _timed(submit, data):
+    start = time.perf_counter()
+    submit(data)
+    return time.perf_counter() - start
+
+
+def batch_submissions(submit, data):
+    total, concurrency = data["submissions"], data["concurrency"]
+    if concurrency == 1:
+        latencies = [_timed(submit, data) for _ in range(total)]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(pool.map(lambda _: _timed(submit, data), range(total)))
+    data["writer"].flush()
+    return latencies
+
+
+def aggregates_consistent(data):
+    """
+    Whether every QuizStats and UserStats row still matches the score table.
+    """
+    aggregates = quiz_module("aggregates")
+    with Session(data["engine"]) as session:
+        return not aggregates.stale_aggregates(session)
+
+
+def _delete_with_scores(session, target, where):
+    aggregates = quiz_module("aggregates")
+    affected = aggregates.affected_aggregates(session, where)
+    session.delete(target)
+    session.flush()
+    aggregates.refresh_aggregates(session, *affected)
+    session.commit()
+
+
+def delete_paths_consistent(data):
+    """
+    Delete a user with scores and a chapter with scores the way
+    manage_users and delete_chapter do, then check the aggregates. Run it
+    last: it removes rows the submits draw from.
+    """
+    models = quiz_module("models")
+    Score, Quiz = models.Score, models.Quiz
+    with Session(data["engine"]) as session:
+        user_id = session.scalars(select(Score.user_id).where(Score.user_id.isnot(None)).limit(1)).first()
+        _delete_with_scores(session, session.get(models.User, user_id), Score.user_id == user_id)
+
+        chapter_id = session.scalars(
+            select(Quiz.chapter_id).join(Score, Score.quiz_id == Quiz.id).limit(1)
+        ).first()
+        _delete_with_scores(session, session.get(models.Chapter, chapter_id),
+                            Score.quiz_id.in_(select(Quiz.id).where(Quiz.chapter_id == chapter_id)))
+    return aggregates_consistent(data)
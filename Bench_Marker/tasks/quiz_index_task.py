@@ -0,0 +1,128 @@
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+from functools import partial
+from itertools import cycle
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from Bench_Marker.core.quiz_app import quiz_models, build_quiz_database
+from Bench_Marker.core.registry import register, register_setup, register_teardown
+
+# Lookup keys cycled through per call, so one hot row does not hide a scan.
+KEYS = 200
+
+# The app's lookups that were full table scans before the foreign key
+# columns were indexed.
+QUERIES = ("scores_by_user", "attempted_quizzes", "user_quiz_score", "questions_by_quiz")
+
+
+def drop_secondary_indexes(path):
+    """
+    Turn a copy of the database back into the pre-migration layout: same
+    rows, no secondary indexes (foreign key declarations do not change
+    how SQLite reads, so they can stay).
+    """
+    conn = sqlite3.connect(path)
+    names = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND sql IS NOT NULL"
+    )]
+    for name in names:
+        conn.execute(f'DROP INDEX "{name}"')
+    conn.commit()
+    conn.close()
+    return names
+
+
+@register_setup("quiz_indexes", kind="io")
+def make_quiz_databases(scale=None, seed=0):
+    """
+    Build one synthetic database at `scale` and an unindexed copy of it.
+
+    Returns {"indexed", "unindexed"} sessions, the lookup keys and the
+    work directory.
+    """
+    work_dir = tempfile.mkdtemp(prefix="bench_quiz_")
+    indexed = os.path.join(work_dir, "indexed.db")
+    unindexed = os.path.join(work_dir, "unindexed.db")
+    build_quiz_database(indexed, scale or "small", seed=seed)
+    shutil.copyfile(indexed, unindexed)
+    drop_secondary_indexes(unindexed)
+
+    conn = sqlite3.connect(indexed)
+    rng = random.Random(seed)
+    pairs = conn.execute("SELECT user_id, quiz_id FROM score ORDER BY random() LIMIT ?",
+                         (KEYS,)).fetchall()
+    quiz_ids = [row[0] for row in conn.execute("SELECT id FROM quiz")]
+    conn.close()
+    rng.shuffle(quiz_ids)
+
+    engines = {name: create_engine(f"sqlite:///{path}")
+               for name, path in (("indexed", indexed), ("unindexed", unindexed))}
+    return {
+        "work_dir": work_dir,
+        "engines": engines,
+        "sessions": {name: Session(engine) for name, engine in engines.items()},
+        "pairs": cycle(pairs),
+        "quiz_ids": cycle(quiz_ids[:KEYS]),
+    }
+
+
+@register_teardown("quiz_indexes")
+def remove_quiz_databases(data):
+    for session in data["sessions"].values():
+        session.close()
+    for engine in data["engines"].values():
+        engine.dispose()
+    shutil.rmtree(data["work_dir"], ignore_errors=True)
+
+
+def statement(query, data):
+    """
+    The query as the app issues it, for the next lookup key.
+    """
+    models = quiz_models()
+    Score, Question = models.Score, models.Question
+
+    if query == "questions_by_quiz":
+        return select(Question).where(Question.quiz_id == next(data["quiz_ids"]))
+    user_id, quiz_id = next(data["pairs"])
+    if query == "scores_by_user":
+        return select(Score).where(Score.user_id == user_id)
+    if query == "attempted_quizzes":
+        return select(Score.quiz_id).where(Score.user_id == user_id)
+    if query == "user_quiz_score":
+        return select(Score).where(Score.quiz_id == quiz_id, Score.user_id == user_id).limit(1)
+    raise ValueError(f"Unknown query {query!r}")
+
+
+def run_query(data, layout, query):
+    session = data["sessions"][layout]
+    rows = session.execute(statement(query, data)).all()
+    session.expunge_all()
+    return rows
+
+
+def query_plan(data, layout, query):
+    """
+    SQLite's EXPLAIN QUERY PLAN detail lines, e.g. "SCAN score" or
+    "SEARCH score USING INDEX ix_score_user_id_quiz_id (user_id=?)".
+    """
+    engine = data["engines"][layout]
+    compiled = statement(query, data).compile(engine)
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + str(compiled),
+                                    tuple(compiled.params[k] for k in compiled.positiontup))
+        return [row[-1] for row in rows]
+
+
+# One method per (query, layout): scores_by_user_unindexed, scores_by_user_indexed, ...
+METHODS = {}
+for _query in QUERIES:
+    for _layout in ("unindexed", "indexed"):
+        METHODS[(_query, _layout)] = register("quiz_indexes", f"{_query}_{_layout}")(
+            partial(run_query, layout=_layout, query=_query)
+        )
@@ -0,0 +1,165 @@
+import os
+import random
+import shutil
+import tempfile
+from datetime import datetime
+
+from jinja2 import Environment
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from Bench_Marker.core.quiz_app import quiz_module, build_quiz_database
+from Bench_Marker.core.registry import register, register_setup, register_teardown
+
+# The summary page's tables, before (every score, users looked up in a
+# dict of every user) and after (one page of scores plus the aggregates).
+TEMPLATES = {
+    "full_scan": """{% for score in scores %}<tr>
+<td>{{ users[score.user_id].full_name if score.user_id in users else 'Unknown' }}</td>
+<td>{{ score.quiz_id }}</td><td>{{ score.total_scored }}</td></tr>{% endfor %}""",
+    "aggregates": """<p>{{ totals[0] }} attempts on {{ totals[1] }} quizzes</p>
+{% for leader in leaders %}<tr><td>{{ loop.index }}</td>
+<td>{{ leader.user.full_name if leader.user else 'Unknown' }}</td>
+<td>{{ leader.total_score }}</td></tr>{% endfor %}
+{% for stats in quiz_stats %}<tr><td>{{ stats.quiz_id }}</td><td>{{ stats.attempts }}</td>
+<td>{{ '%.2f' % stats.average_score }}</td><td>{{ stats.max_score }}</td></tr>{% endfor %}
+{% for score in scores %}<tr>
+<td>{{ score.user.full_name if score.user else 'Unknown' }}</td>
+<td>{{ score.quiz_id }}</td><td>{{ score.total_scored }}</td></tr>{% endfor %}""",
+}
+
+_env = Environment(autoescape=True)
+_templates = {name: _env.from_string(source) for name, source in TEMPLATES.items()}
+
+
+def _summary_database(scale, seed, prefix):
+    """
+    (work_dir, path) of a fresh datagen database at `scale` (its aggregates
+    are rebuilt by datagen).
+    """
+    work_dir = tempfile.mkdtemp(prefix=prefix)
+    path = os.path.join(work_dir, "quiz.db")
+    build_quiz_database(path, scale or "small", seed=seed)
+    return work_dir, path
+
+
+# Reads (the admin summary page) and writes (a submit) are separate tasks:
+# their timings are not comparable, and submits would grow the tables the
+# summary reads while it is measured.
+
+@register_setup("quiz_summary_read", kind="io")
+def make_summary_database(scale=None, seed=0):
+    """
+    A datagen database at `scale` to render the summary from.
+    """
+    work_dir, path = _summary_database(scale, seed, "bench_quiz_summary_")
+    return {"work_dir": work_dir, "engine": create_engine(f"sqlite:///{path}")}
+
+
+@register_teardown("quiz_summary_read")
+def remove_summary_database(data):
+    data["engine"].dispose()
+    shutil.rmtree(data["work_dir"], ignore_errors=True)
+
+
+@register("quiz_summary_read", "summary_full_scan")
+def summary_full_scan(data):
+    """
+    The summary as it was: every score, every user, attempts per quiz.
+    """
+    models = quiz_module("models")
+    Score, User = models.Score, models.User
+    with Session(data["engine"]) as session:
+        scores = session.scalars(select(Score)).all()
+        session.execute(select(Score.quiz_id, func.count(Score.user_id)).group_by(Score.quiz_id)).all()
+        users = {user.id: user for user in session.scalars(select(User))}
+        return _templates["full_scan"].render(scores=scores, users=users)
+
+
+@register("quiz_summary_read", "summary_aggregates")
+def summary_aggregates(data):
+    """
+    The summary as it is now: first page of scores plus the aggregates.
+    """
+    aggregates = quiz_module("aggregates")
+    with Session(data["engine"]) as session:
+        scores, _ = aggregates.score_page(session)
+        return _templates["aggregates"].render(
+            scores=scores,
+            leaders=aggregates.leaderboard(session),
+            quiz_stats=aggregates.top_quizzes(session),
+            totals=aggregates.totals(session),
+        )
+
+
+@register_setup("quiz_summary_write", kind="io")
+def make_submit_database(scale=None, seed=0):
+    """
+    A datagen database at `scale` plus the ids submits are drawn from. Each
+    write method works on its own copy of it (open_submit_copy).
+    """
+    work_dir, path = _summary_database(scale, seed, "bench_quiz_submit_")
+    engine = create_engine(f"sqlite:///{path}")
+    models = quiz_module("models")
+    with Session(engine) as session:
+        user_ids = session.scalars(select(models.User.id).limit(1000)).all()
+        quiz_ids = session.scalars(select(models.Quiz.id)).all()
+    engine.dispose()
+    return {"work_dir": work_dir, "path": path, "seed": seed,
+            "user_ids": user_ids, "quiz_ids": quiz_ids}
+
+
+@register_teardown("quiz_summary_write")
+def remove_submit_database(data):
+    shutil.rmtree(data["work_dir"], ignore_errors=True)
+
+
+def open_submit_copy(data):
+    """
+    Per-method setup hook: a fresh copy of the database and the same random
+    submits, so every write method starts from the same rows.
+    """
+    fd, copy = tempfile.mkstemp(suffix=".db", dir=data["work_dir"])
+    os.close(fd)
+    shutil.copyfile(data["path"], copy)
+    return dict(data, copy=copy, engine=create_engine(f"sqlite:///{copy}"),
+                rng=random.Random(data["seed"]))
+
+
+def close_submit_copy(state):
+    state["engine"].dispose()
+    os.remove(state["copy"])
+
+
+SUBMIT_HOOKS = {"setup": open_submit_copy, "teardown": close_submit_copy}
+
+
+def _submit(data, maintain_aggregates):
+    models = quiz_module("models")
+    aggregates = quiz_module("aggregates")
+    rng = data["rng"]
+    user_id = rng.choice(data["user_ids"])
+    quiz_id = rng.choice(data["quiz_ids"])
+    score = rng.randint(0, 10)
+    with Session(data["engine"]) as session:
+        session.add(models.Score(quiz_id=quiz_id, user_id=user_id,
+                                 time_stamp_of_attempt=datetime.now(), total_scored=score))
+        if maintain_aggregates:
+            aggregates.record_attempt(session, quiz_id, user_id, score)
+        session.commit()
+
+
+@register("quiz_summary_write", "submit_plain", hooks=SUBMIT_HOOKS)
+def submit_plain(data):
+    """
+    Insert one score, as submit_quiz did before the aggregates.
+    """
+    _submit(data, False)
+
+
+@register("quiz_summary_write", "submit_with_aggregates", hooks=SUBMIT_HOOKS)
+def submit_with_aggregates(data):
+    """
+    Insert one score and fold it into QuizStats/UserStats.
+    """
+    _submit(data, True)
@@ -0,0 +1,236 @@
+"""
+Score aggregates maintained incrementally.
+
+record_attempt() is called in the same transaction as every new Score, so
+QuizStats (attempts, total and max score per quiz) and UserStats (attempts,
+total and best score per user) never need a scan of the score table.
+Deletes that cascade to scores (a user, a chapter) recompute the rows they
+touch with affected_aggregates() and refresh_aggregates().
+rebuild_aggregates() recomputes both from scratch for databases filled
+without going through submit_quiz (datagen.py, seed data, old databases):
+
+    python aggregates.py                      # the app's database
+    python aggregates.py --database sqlite:////tmp/quiz_large.db
+
+Every function takes the SQLAlchemy session to work in, so they are usable
+outside a Flask request (benchmarks, scripts).
+"""
+import argparse
+import os
+
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+
+from models import Score, QuizStats, UserStats
+
+LEADERBOARD_SIZE = 10
+TOP_QUIZZES = 20
+
+
+def _bump(session, model, key_column, key, attempts, total, best, max_column):
+    """
+    Add `attempts` attempts scoring `total` in all (best of them: `best`) to
+    the row of model keyed by key, creating it if needed. UPDATE first:
+    after the first attempt the row exists, and a single
+    UPDATE ... SET x = x + n cannot lose concurrent increments.
+    """
+    values = {
+        "attempts": model.attempts + attempts,
+        "total_score": model.total_score + total,
+        max_column.key: case((max_column < best, best), else_=max_column),
+    }
+    result = session.execute(update(model).where(key_column == key).values(**values))
+    if result.rowcount:
+        return
+    try:
+        with session.begin_nested():
+            session.execute(insert(model).values(**{
+                key_column.key: key, "attempts": attempts, "total_score": total, max_column.key: best,
+            }))
+    except IntegrityError:
+        # Another request created the row between our UPDATE and INSERT.
+        session.execute(update(model).where(key_column == key).values(**values))
+
+
+def _group(attempts, index):
+    """
+    {key: [attempts, total, best]} over (quiz_id, user_id, score) tuples,
+    keyed by the tuple's element at index.
+    """
+    groups = {}
+    for attempt in attempts:
+        key, score = attempt[index], attempt[2]
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [1, score, score]
+        else:
+            group[0] += 1
+            group[1] += score
+            group[2] = max(group[2], score)
+    return groups
+
+
+def record_attempts(session, attempts):
+    """
+    Fold new (quiz_id, user_id, score) attempts into the aggregates with
+    one UPDATE per distinct quiz and user, in the transaction that inserts
+    their Score rows (grading.ScoreWriter's batches).
+    """
+    attempts = list(attempts)
+    for quiz_id, (count, total, best) in _group(attempts, 0).items():
+        _bump(session, QuizStats, QuizStats.quiz_id, quiz_id, count, total, best, QuizStats.max_score)
+    for user_id, (count, total, best) in _group(attempts, 1).items():
+        _bump(session, UserStats, UserStats.user_id, user_id, count, total, best, UserStats.best_score)
+
+
+def record_attempt(session, quiz_id, user_id, score):
+    """
+    Fold one new score into the per-quiz and per-user aggregates. Call it in
+    the transaction that inserts the Score row.
+    """
+    record_attempts(session, [(quiz_id, user_id, score)])
+
+
+# (model, its key column, the Score column it is keyed by, its max column)
+_AGGREGATES = (
+    (QuizStats, QuizStats.quiz_id, Score.quiz_id, QuizStats.max_score),
+    (UserStats, UserStats.user_id, Score.user_id, UserStats.best_score),
+)
+# Keys per IN (...) list, below SQLite's bound parameter limit.
+_KEYS_PER_STATEMENT = 500
+
+
+def _score_totals(score_key):
+    """
+    (key, attempts, total, max) per score_key value, from the score table.
+    """
+    return (select(score_key, func.count(Score.id), func.coalesce(func.sum(Score.total_scored), 0),
+                   func.coalesce(func.max(Score.total_scored), 0))
+            .where(score_key.isnot(None)).group_by(score_key))
+
+
+def _columns(key_column, max_column):
+    return [key_column.key, "attempts", "total_score", max_column.key]
+
+
+def rebuild_aggregates(session):
+    """
+    Recompute QuizStats and UserStats from the score table (one GROUP BY
+    each). Commits.
+    """
+    for model, key_column, score_key, max_column in _AGGREGATES:
+        session.execute(delete(model))
+        session.execute(insert(model).from_select(_columns(key_column, max_column),
+                                                  _score_totals(score_key)))
+    session.commit()
+
+
+def affected_aggregates(session, where):
+    """
+    (quiz ids, user ids) of the scores matching `where`. Call it before a
+    delete that cascades to those scores, and pass the result to
+    refresh_aggregates once the delete is flushed.
+    """
+    rows = session.execute(select(Score.quiz_id, Score.user_id).where(where).distinct()).all()
+    return {quiz_id for quiz_id, _ in rows}, {user_id for _, user_id in rows}
+
+
+def refresh_aggregates(session, quiz_ids=(), user_ids=()):
+    """
+    Recompute the QuizStats and UserStats rows of the given quizzes and
+    users from their remaining scores (a max cannot be un-merged, so
+    deleted scores are not subtracted); rows left without scores go away.
+    Does not commit.
+    """
+    for (model, key_column, score_key, max_column), keys in zip(_AGGREGATES, (quiz_ids, user_ids)):
+        keys = sorted(key for key in keys if key is not None)
+        for i in range(0, len(keys), _KEYS_PER_STATEMENT):
+            chunk = keys[i:i + _KEYS_PER_STATEMENT]
+            session.execute(delete(model).where(key_column.in_(chunk)))
+            session.execute(insert(model).from_select(_columns(key_column, max_column),
+                                                      _score_totals(score_key).where(score_key.in_(chunk))))
+
+
+def stale_aggregates(session):
+    """
+    [(table, key)] of the QuizStats and UserStats rows that do not match the
+    score table, missing and leftover rows included. Empty when consistent.
+    """
+    stale = []
+    for model, key_column, score_key, max_column in _AGGREGATES:
+        expected = {row[0]: tuple(row[1:]) for row in session.execute(_score_totals(score_key))}
+        actual = {row[0]: tuple(row[1:]) for row in session.execute(
+            select(key_column, model.attempts, model.total_score, max_column))}
+        stale += [(model.__tablename__, key) for key in sorted(expected.keys() | actual.keys())
+                  if expected.get(key) != actual.get(key)]
+    return stale
+
+
+def leaderboard(session, limit=LEADERBOARD_SIZE):
+    """
+    Users with the highest total score (reads `limit` rows of the
+    total_score index), with their User loaded.
+    """
+    return session.scalars(
+        select(UserStats).options(joinedload(UserStats.user))
+        .order_by(UserStats.total_score.desc(), UserStats.user_id).limit(limit)
+    ).all()
+
+
+def top_quizzes(session, limit=TOP_QUIZZES):
+    """
+    The most attempted quizzes with their attempt count, average and max.
+    """
+    return session.scalars(
+        select(QuizStats).order_by(QuizStats.attempts.desc(), QuizStats.quiz_id).limit(limit)
+    ).all()
+
+
+def totals(session):
+    """
+    (total attempts, quizzes attempted), from QuizStats: one row per quiz,
+    independent of the number of scores and users.
+    """
+    return tuple(session.execute(
+        select(func.coalesce(func.sum(QuizStats.attempts), 0), func.count(QuizStats.quiz_id))
+    ).one())
+
+
+def score_page(session, before=None, per_page=50):
+    """
+    The newest scores with id < before (keyset pagination: the cost depends
+    on per_page, not on how deep the page is), with their User loaded.
+    Returns (scores, next_before), next_before being None on the last page.
+    """
+    query = select(Score).options(joinedload(Score.user)).order_by(Score.id.desc()).limit(per_page + 1)
+    if before is not None:
+        query = query.where(Score.id < before)
+    scores = session.scalars(query).all()
+    if len(scores) > per_page:
+        return scores[:per_page], scores[per_page - 1].id
+    return scores, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the quiz score aggregates.")
+    parser.add_argument("--database", help="SQLAlchemy URI (default: the app's database)")
+    args = parser.parse_args(argv)
+
+    if args.database:
+        os.environ["QUIZ_DATABASE_URI"] = args.database
+
+    import logging
+    from app import app
+    from models import db
+
+    logging.getLogger().setLevel(logging.WARNING)
+    with app.app_context():
+        db.create_all()
+        rebuild_aggregates(db.session)
+        attempts, quizzes = totals(db.session)
+        print(f"📊 {attempts} attempts over {quizzes} quizzes")
+
+
+if __name__ == "__main__":
+    main()
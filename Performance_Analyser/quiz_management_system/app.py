@@ -1,13 +1,21 @@
 from flask import Flask, render_template, redirect, url_for, request, session, jsonify
 from sqlalchemy import func
+from sqlalchemy.orm import selectinload
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
 import logging
 import os
+import threading
 import flask_profiler
 
 from forms import LoginForm, RegistrationForm
-from models import db, User, Subject, Chapter, Quiz, Question, Score
+from models import db, enable_sqlite_foreign_keys, User, Subject, Chapter, Quiz, Question, Score
 from werkzeug.security import generate_password_hash, check_password_hash
+from aggregates import (record_attempt, rebuild_aggregates, affected_aggregates, refresh_aggregates,
+                        leaderboard, top_quizzes, totals, score_page)
+from cache import Cache, make_backend, snapshot, restore
+from grading import ScoreWriter, load_answer_key, grade
+import querystats
 from flask_login import LoginManager
 
 logging.basicConfig(level=logging.DEBUG)
@@ -16,7 +24,7 @@ app = Flask(__name__)
 login_manager = LoginManager()
 
 # existing config
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///database.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('QUIZ_DATABASE_URI', 'sqlite:///database.db')
 app.secret_key = 'your_secret_key'
 
 # flask_profiler config
@@ -24,7 +32,7 @@ app.config["flask_profiler"] = {
     "enabled": True,
     "storage": {
         "engine": "sqlite",
-        "FILE": "flask_profiler.sqlite"
+        "FILE": os.environ.get('QUIZ_PROFILER_FILE', 'flask_profiler.sqlite')
     },
     "basicAuth": {
         "enabled": False,
@@ -38,6 +46,27 @@ app.config["flask_profiler"] = {
 # Initialize extensions BEFORE routes
 flask_profiler.init_app(app)
 
+# flask_profiler's SQLite storage shares one cursor between threads, so
+# concurrent requests (threaded server, loadgen.py) must not insert at once.
+# Each measurement's SQL statistics (querystats.py) go into the same file,
+# keyed by the measurement's row id.
+_profiler_lock = threading.Lock()
+_profiler_storage = flask_profiler.flask_profiler.collection
+_profiler_insert = _profiler_storage.insert
+querystats.create_table(_profiler_storage.connection)
+
+
+def _locked_profiler_insert(measurement):
+    with _profiler_lock:
+        _profiler_insert(measurement)
+        queries = querystats.current()
+        if queries is not None:
+            querystats.save(_profiler_storage.connection, _profiler_storage.cursor.lastrowid,
+                            queries.summary())
+
+
+flask_profiler.flask_profiler.collection.insert = _locked_profiler_insert
+
 app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
     'pool_size': 5,
     'max_overflow': 10,
@@ -47,10 +76,90 @@ app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
 
 db.init_app(app)
 
+with app.app_context():
+    enable_sqlite_foreign_keys(db.engine)
+    querystats.install(db.engine)
+
+# How submit_quiz writes scores (see grading.py):
+#   sync   : in the request's own transaction (default)
+#   group  : through score_writer, waiting up to SCORE_WRITE_TIMEOUT for the
+#            batch to commit; a score still queued by then is written in the
+#            request instead
+#   behind : through score_writer, returning once the score is queued
+SCORE_WRITES = os.environ.get('QUIZ_SCORE_WRITES', 'sync')
+SCORE_WRITE_TIMEOUT = 10  # seconds
+if SCORE_WRITES not in ('sync', 'group', 'behind'):
+    raise ValueError(f"QUIZ_SCORE_WRITES must be sync, group or behind, not {SCORE_WRITES!r}")
+
+with app.app_context():
+    score_writer = ScoreWriter(db.engine)
+
+
+# Read-mostly rows (catalog and users) are served from `cache`; every
+# route that changes them invalidates the keys it touches. See cache.py
+# for the QUIZ_CACHE_* settings.
+cache = Cache(make_backend())
+
+SUBJECT_TREE = "subjects:tree"
+CHAPTER_LIST = "chapters:all"
+QUIZ_LIST = "quizzes:all"
+ANSWER_KEY = "answers:{}"
+
+
+def row_key(model, ident):
+    return f"{model.__tablename__}:{ident}"
+
+
+def cached_get(model, ident, exclude=()):
+    """
+    model's row with primary key ident, like Model.query.get, but from the
+    cache when possible. Columns in exclude are not cached and load from
+    the database on first access.
+    """
+    if ident is None:
+        return None
+    ident = int(ident)
+
+    def load():
+        obj = db.session.get(model, ident)
+        return snapshot(obj, exclude) if obj is not None else None
+
+    values = cache.get_or_load(row_key(model, ident), load)
+    return restore(db.session, model, values) if values is not None else None
+
+
+def answer_key(quiz_id):
+    """
+    The quiz's grading.AnswerKey (question ids and correct answers).
+    """
+    return cache.get_or_load(ANSWER_KEY.format(quiz_id), lambda: load_answer_key(db.session, quiz_id))
+
+
+def subject_tree():
+    """
+    Every subject with its chapters, as dicts (templates read them like
+    the ORM objects).
+    """
+    def load():
+        subjects = Subject.query.options(selectinload(Subject.chapters)).all()
+        return [dict(snapshot(subject), chapters=[snapshot(c) for c in subject.chapters])
+                for subject in subjects]
+
+    return cache.get_or_load(SUBJECT_TREE, load)
+
+
+def chapter_list():
+    return cache.get_or_load(CHAPTER_LIST, lambda: [snapshot(c) for c in Chapter.query.all()])
+
+
+def quiz_list():
+    return cache.get_or_load(QUIZ_LIST, lambda: [snapshot(q) for q in Quiz.query.all()])
+
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    # The password hash stays out of the cache; login reads it from the table.
+    return cached_get(User, user_id, exclude=('password',))
 
 
 login_manager.init_app(app)
@@ -105,6 +214,14 @@ def login():
     return render_template('login.html', form=form, error=None)
 
 
+def question_counts(column):
+    """
+    {column value: number of questions}, e.g. question_counts(Question.quiz_id).
+    One grouped query instead of loading every question to count in the template.
+    """
+    return dict(db.session.query(column, func.count(Question.id)).group_by(column).all())
+
+
 @app.route('/user_dashboard', methods=['GET'])
 @flask_profiler.profile()
 def user_dashboard():
@@ -112,15 +229,15 @@ def user_dashboard():
     if not user_id:
         return redirect(url_for('login'))
 
-    user = User.query.get(user_id)
+    user = load_user(user_id)
 
     attempted_quiz_ids = Score.query.filter_by(user_id=user_id).with_entities(Score.quiz_id).all()
     attempted_quiz_ids = [quiz_id[0] for quiz_id in attempted_quiz_ids]
 
     quizzes = Quiz.query.filter(Quiz.id.notin_(attempted_quiz_ids)).all()
-    questions = Question.query.all()
 
-    return render_template('user_dashboard.html', user=user, quizzes=quizzes, questions=questions)
+    return render_template('user_dashboard.html', user=user, quizzes=quizzes,
+                           question_counts=question_counts(Question.quiz_id))
 
 
 @app.route('/user_dashboard_scores', methods=['GET'])
@@ -131,7 +248,7 @@ def user_dashboard_scores():
         return redirect(url_for('login'))
 
     scores = Score.query.filter_by(user_id=user_id).all()
-    user = User.query.get(user_id)
+    user = load_user(user_id)
 
     return render_template('user_dashboard_scores.html', scores=scores, user=user)
 
@@ -140,9 +257,9 @@ def user_dashboard_scores():
 @flask_profiler.profile()
 def view():
     quiz_id = request.args.get('quiz_id')
-    quiz = Quiz.query.get(quiz_id)
-    chapter = Chapter.query.get(quiz.chapter_id)
-    subject = Subject.query.get(chapter.subject_id)
+    quiz = cached_get(Quiz, quiz_id)
+    chapter = cached_get(Chapter, quiz.chapter_id)
+    subject = cached_get(Subject, chapter.subject_id)
 
     user_id = session.get('user_id')
     total_score = Score.query.filter_by(quiz_id=quiz_id, user_id=user_id).first()
@@ -170,14 +287,30 @@ def submit_quiz(quiz_id):
     if not user_id:
         return redirect(url_for('login'))
 
-    total_score = 0
-    questions = Question.query.filter_by(quiz_id=quiz_id).all()
+    total_score = grade(answer_key(quiz_id), request.form)
+
+    if SCORE_WRITES == 'sync':
+        write_score(quiz_id, user_id, total_score)
+    else:
+        pending = score_writer.submit(quiz_id, user_id, total_score, datetime.now())
+        if SCORE_WRITES == 'group':
+            try:
+                pending.result(timeout=SCORE_WRITE_TIMEOUT)
+            except FutureTimeoutError:
+                # The writer is stalled. A score it has not taken yet is
+                # written here; one it is writing cannot be, without
+                # risking a duplicate.
+                if not pending.cancel():
+                    logging.error("Score writer stalled on a batch; quiz %s, user %s", quiz_id, user_id)
+                    return "Your answers were received but the score is still being saved. " \
+                           "Please check your scores shortly.", 503
+                logging.warning("Score writer timed out; writing the score in the request")
+                write_score(quiz_id, user_id, total_score)
 
-    for question in questions:
-        selected_answer = request.form.get(str(question.id))
-        if selected_answer and int(selected_answer) == question.correct_answer:
-            total_score += 1
+    return redirect(url_for('view', quiz_id=quiz_id))
 
+
+def write_score(quiz_id, user_id, total_score):
     score_entry = Score(
         quiz_id=quiz_id,
         user_id=user_id,
@@ -186,20 +319,19 @@ def submit_quiz(quiz_id):
     )
 
     db.session.add(score_entry)
+    record_attempt(db.session, quiz_id, user_id, total_score)
     db.session.commit()
 
-    return redirect(url_for('view', quiz_id=quiz_id))
-
 
 @app.route('/quiz_info/<int:quiz_id>', methods=['GET'])
 @flask_profiler.profile()
 def quiz_info(quiz_id):
-    quiz = Quiz.query.get(quiz_id)
+    quiz = cached_get(Quiz, quiz_id)
     if not quiz:
         return "Quiz not found", 404
 
-    subject = Subject.query.get(quiz.chapter_id)
-    chapter = Chapter.query.get(quiz.chapter_id)
+    subject = cached_get(Subject, quiz.chapter_id)
+    chapter = cached_get(Chapter, quiz.chapter_id)
 
     return render_template(
         'view.html',
@@ -214,47 +346,48 @@ def quiz_info(quiz_id):
 @app.route('/admin_dashboard', methods=['GET', 'POST'])
 @flask_profiler.profile()
 def admin_dashboard():
-    if not session.get('user_id') or User.query.get(session['user_id']).role != 'admin':
+    if not session.get('user_id') or load_user(session['user_id']).role != 'admin':
         return redirect(url_for('login'))
 
-    subjects = Subject.query.all()
-    chapters = Chapter.query.all()
-    questions = Question.query.all()
-    return render_template('admin_dashboard.html', subjects=subjects, chapters=chapters, questions=questions)
+    return render_template('admin_dashboard.html', subjects=subject_tree(),
+                           question_counts=question_counts(Question.chapter_id))
 
 
 @app.route('/admin_dashboard_quiz', methods=['GET', 'POST'])
 @flask_profiler.profile()
 def admin_dashboard_quiz():
-    if not session.get('user_id') or User.query.get(session['user_id']).role != 'admin':
+    if not session.get('user_id') or load_user(session['user_id']).role != 'admin':
         return redirect(url_for('login'))
 
     user_id = session.get('user_id')
-    user = User.query.get(user_id)
+    user = load_user(user_id)
 
-    quizes = Quiz.query.all()
-    questions = Question.query.all()
+    # Each quiz's questions in one extra query, not one filter pass per quiz.
+    quizes = Quiz.query.options(selectinload(Quiz.questions)).all()
 
-    return render_template('admin_dashboard_quiz.html', questions=questions, quizes=quizes, user=user)
+    return render_template('admin_dashboard_quiz.html', quizes=quizes, user=user)
 
 
 @app.route('/admin_dashboard_summary', methods=['GET', 'POST'])
 @flask_profiler.profile()
 def admin_dashboard_summary():
-    if not session.get('user_id') or User.query.get(session['user_id']).role != 'admin':
+    if not session.get('user_id') or load_user(session['user_id']).role != 'admin':
         return redirect(url_for('login'))
 
-    scores = Score.query.all()
-    quiz_attempts = db.session.query(
-        Score.quiz_id, func.count(Score.user_id)
-    ).group_by(Score.quiz_id).all()
-
-    users = {user.id: user for user in User.query.all()}
+    # Aggregates are maintained on submit and scores are read one page at a
+    # time, so the cost does not grow with the number of scores.
+    before = request.args.get('before', type=int)
+    scores, next_before = score_page(db.session, before=before)
+    total_attempts, quizzes_attempted = totals(db.session)
 
     return render_template('admin_dashboard_summary.html',
                            scores=scores,
-                           quiz_attempts=quiz_attempts,
-                           users=users)
+                           next_before=next_before,
+                           first_page=before is None,
+                           leaders=leaderboard(db.session),
+                           quiz_stats=top_quizzes(db.session),
+                           total_attempts=total_attempts,
+                           quizzes_attempted=quizzes_attempted)
 
 
 @app.route('/api/quizzes', methods=['POST'])
@@ -270,6 +403,7 @@ def api_add_quiz():
     try:
         db.session.add(new_quiz)
         db.session.commit()
+        cache.invalidate(QUIZ_LIST)
         return jsonify({'message': 'Quiz added successfully!'}), 201
     except Exception as e:
         db.session.rollback()
@@ -291,6 +425,7 @@ def api_add_question():
     try:
         db.session.add(new_question)
         db.session.commit()
+        cache.invalidate(ANSWER_KEY.format(new_question.quiz_id))
         return jsonify({'message': 'Question added successfully!'}), 201
     except Exception as e:
         db.session.rollback()
@@ -316,13 +451,13 @@ def add_quiz():
         try:
             db.session.add(new_quiz)
             db.session.commit()
+            cache.invalidate(QUIZ_LIST)
             return redirect(url_for('admin_dashboard_quiz'))
         except Exception as e:
             db.session.rollback()
-            return render_template('add_quiz.html', error=str(e), chapters=Chapter.query.all())
+            return render_template('add_quiz.html', error=str(e), chapters=chapter_list())
 
-    chapters = Chapter.query.all()
-    return render_template('add_quiz.html', chapters=chapters)
+    return render_template('add_quiz.html', chapters=chapter_list())
 
 
 @app.route('/delete_question/<int:question_id>', methods=['POST'])
@@ -330,8 +465,10 @@ def add_quiz():
 def delete_question(question_id):
     question_to_delete = Question.query.get(question_id)
     if question_to_delete:
+        quiz_id = question_to_delete.quiz_id
         db.session.delete(question_to_delete)
         db.session.commit()
+        cache.invalidate(ANSWER_KEY.format(quiz_id))
 
     return redirect(url_for('admin_dashboard_quiz'))
 
@@ -359,10 +496,10 @@ def add_question():
         )
         db.session.add(new_question)
         db.session.commit()
+        cache.invalidate(ANSWER_KEY.format(new_question.quiz_id))
         return redirect(url_for('add_question'))
 
-    quizzes = Quiz.query.all()
-    return render_template('add_question.html', quizzes=quizzes, quiz_id=quiz_id)
+    return render_template('add_question.html', quizzes=quiz_list(), quiz_id=quiz_id)
 
 
 @app.route('/manage_users', methods=['GET', 'POST'])
@@ -375,8 +512,14 @@ def manage_users():
 
         if action == 'delete':
             user_to_delete = User.query.get(user_id)
+            # Its scores go with it (ON DELETE CASCADE): recount the quizzes
+            # they were counted in.
+            affected = affected_aggregates(db.session, Score.user_id == user_to_delete.id)
             db.session.delete(user_to_delete)
+            db.session.flush()
+            refresh_aggregates(db.session, *affected)
             db.session.commit()
+            cache.invalidate(row_key(User, user_id))
 
     return render_template('manage_users.html', users=users)
 
@@ -391,6 +534,7 @@ def add_subject():
         )
         db.session.add(new_subject)
         db.session.commit()
+        cache.invalidate(SUBJECT_TREE)
         return redirect(url_for('admin_dashboard'))
 
     subjects = Subject.query.all()
@@ -412,6 +556,7 @@ def add_chapter():
         )
         db.session.add(new_chapter)
         db.session.commit()
+        cache.invalidate(SUBJECT_TREE, CHAPTER_LIST)
         return redirect(url_for('admin_dashboard'))
 
     return render_template('add_chapter.html', subject_id=subject_id)
@@ -422,11 +567,38 @@ def add_chapter():
 def delete_chapter(chapter_id):
     chapter_to_delete = Chapter.query.get(chapter_id)
     if chapter_to_delete:
+        # Its quizzes, their questions and scores go with it (ON DELETE
+        # CASCADE): recount the users those scores were counted for.
+        quiz_ids = [quiz.id for quiz in chapter_to_delete.quizzes]
+        quiz_keys = [key for quiz_id in quiz_ids
+                     for key in (row_key(Quiz, quiz_id), ANSWER_KEY.format(quiz_id))]
+        affected = affected_aggregates(db.session, Score.quiz_id.in_(quiz_ids))
         db.session.delete(chapter_to_delete)
+        db.session.flush()
+        refresh_aggregates(db.session, *affected)
         db.session.commit()
+        cache.invalidate(SUBJECT_TREE, CHAPTER_LIST, QUIZ_LIST,
+                         row_key(Chapter, chapter_id), *quiz_keys)
 
     return redirect(url_for('admin_dashboard'))
 
+
+@app.route('/cache_stats', methods=['GET'])
+def cache_stats():
+    """
+    Cache hits, misses and invalidations per key namespace (not profiled,
+    so polling it does not show up in the profiler's data).
+    """
+    return jsonify(cache.stats())
+
+# Non-admin users created by seed_default_data (also used by loadgen.py).
+SEED_USERS = [
+    {"username": "alice@example.com", "password": "alicepass", "full_name": "Alice Example"},
+    {"username": "bob@example.com",   "password": "bobpass",   "full_name": "Bob Example"},
+    {"username": "carol@example.com", "password": "carolpass", "full_name": "Carol Example"},
+]
+
+
 def seed_default_data():
     """
     Create default seed data (idempotent-ish):
@@ -443,13 +615,8 @@ def seed_default_data():
     s_logger = logging.getLogger('seed')
     try:
         # Users
-        users_data = [
-            {"username": "alice@example.com", "password": "alicepass", "full_name": "Alice Example"},
-            {"username": "bob@example.com",   "password": "bobpass",   "full_name": "Bob Example"},
-            {"username": "carol@example.com", "password": "carolpass", "full_name": "Carol Example"},
-        ]
         created_users = []
-        for u in users_data:
+        for u in SEED_USERS:
             existing = User.query.filter_by(username=u["username"]).first()
             if existing:
                 created_users.append(existing)
@@ -506,6 +673,7 @@ def seed_default_data():
                         db.session.add(question)
 
         db.session.commit()
+        cache.clear()
         s_logger.info("Subjects/chapters/quizzes/questions seeded.")
 
         # Scores
@@ -523,6 +691,7 @@ def seed_default_data():
                     )
                     db.session.add(sc)
                 db.session.commit()
+                rebuild_aggregates(db.session)
                 s_logger.info("Sample scores seeded.")
     except Exception:
         db.session.rollback()
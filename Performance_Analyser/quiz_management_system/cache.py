@@ -0,0 +1,276 @@
+"""
+Cache for read-mostly rows (subjects, chapters, quizzes, users).
+
+Two layers:
+  - request memo : flask.g, so a row asked for twice in one request is
+                   looked up once
+  - backend      : shared across requests, either
+                     memory : in-process LRU with a TTL and a size bound
+                     redis  : any Redis-protocol server (Redis, Valkey,
+                              KeyDB, ...) or fakeredis:// for an in-process
+                              stand-in, shared by every worker process
+                     none   : caching off (every lookup is a miss)
+
+Configured from the environment:
+
+    QUIZ_CACHE_BACKEND = memory | redis | none      (default memory)
+    QUIZ_CACHE_URL     = redis://localhost:6379/0   (redis backend)
+    QUIZ_CACHE_TTL     = seconds                    (default 300)
+    QUIZ_CACHE_SIZE    = entries                    (memory backend, default 10000)
+
+Values are plain column dicts (see snapshot/restore), never ORM objects,
+so they can be pickled and outlive the session that loaded them. Writers
+call Cache.invalidate with the keys they change.
+"""
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+DEFAULT_TTL = 300.0
+DEFAULT_SIZE = 10_000
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU: at most maxsize entries, each valid for
+    ttl seconds after it was set.
+    """
+
+    name = "memory"
+
+    def __init__(self, maxsize=DEFAULT_SIZE, ttl=DEFAULT_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires, value = entry
+            if expires < time.monotonic():
+                del self.entries[key]
+                self.expirations += 1
+                return _MISSING
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys):
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def info(self):
+        return {"backend": self.name, "size": len(self.entries), "maxsize": self.maxsize,
+                "ttl": self.ttl, "evictions": self.evictions, "expirations": self.expirations}
+
+
+class RedisCache:
+    """
+    Shared backend on a Redis-protocol server. Values are pickled; expiry
+    and eviction are left to the server (SET ... EX ttl).
+    """
+
+    name = "redis"
+
+    def __init__(self, client, ttl=DEFAULT_TTL, prefix="quiz:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return _MISSING if raw is None else pickle.loads(raw)
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=max(1, int(self.ttl)))
+
+    def delete(self, *keys):
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self):
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+    def info(self):
+        return {"backend": self.name, "ttl": self.ttl, "prefix": self.prefix}
+
+
+class NullCache:
+    name = "none"
+
+    def get(self, key):
+        return _MISSING
+
+    def set(self, key, value):
+        pass
+
+    def delete(self, *keys):
+        pass
+
+    def clear(self):
+        pass
+
+    def info(self):
+        return {"backend": self.name}
+
+
+def make_backend(kind=None, url=None, ttl=None, maxsize=None):
+    """
+    Build the backend named by kind (or QUIZ_CACHE_BACKEND).
+    """
+    kind = kind or os.environ.get("QUIZ_CACHE_BACKEND", "memory")
+    ttl = ttl if ttl is not None else float(os.environ.get("QUIZ_CACHE_TTL", DEFAULT_TTL))
+
+    if kind == "memory":
+        maxsize = maxsize or int(os.environ.get("QUIZ_CACHE_SIZE", DEFAULT_SIZE))
+        return LRUCache(maxsize=maxsize, ttl=ttl)
+    if kind == "redis":
+        url = url or os.environ.get("QUIZ_CACHE_URL", "redis://localhost:6379/0")
+        if url.startswith("fakeredis://"):
+            if fakeredis is None:
+                raise RuntimeError("fakeredis not installed")
+            return RedisCache(fakeredis.FakeStrictRedis(), ttl=ttl)
+        if redis is None:
+            raise RuntimeError("redis not installed")
+        return RedisCache(redis.Redis.from_url(url), ttl=ttl)
+    if kind == "none":
+        return NullCache()
+    raise ValueError(f"Unknown cache backend {kind!r}; expected memory, redis or none")
+
+
+class Cache:
+    """
+    Request memo in front of a backend, with hit/miss counters per key
+    namespace (the part of the key before the first ':').
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.lock = threading.Lock()
+        self.counters = {}
+
+    def _count(self, key, event):
+        namespace = key.split(":", 1)[0]
+        with self.lock:
+            counts = self.counters.setdefault(
+                namespace, {"request_hits": 0, "hits": 0, "misses": 0, "invalidations": 0}
+            )
+            counts[event] += 1
+
+    @staticmethod
+    def _memo():
+        from flask import g, has_request_context
+
+        if not has_request_context():
+            return None
+        if "cache_memo" not in g:
+            g.cache_memo = {}
+        return g.cache_memo
+
+    def get_or_load(self, key, loader):
+        """
+        The cached value for key, or loader()'s result, which is stored
+        unless it is None (a missing row may be created a moment later).
+        """
+        memo = self._memo()
+        if memo is not None and key in memo:
+            self._count(key, "request_hits")
+            return memo[key]
+
+        value = self.backend.get(key)
+        if value is _MISSING:
+            self._count(key, "misses")
+            value = loader()
+            if value is not None:
+                self.backend.set(key, value)
+        else:
+            self._count(key, "hits")
+
+        if memo is not None:
+            memo[key] = value
+        return value
+
+    def invalidate(self, *keys):
+        self.backend.delete(*keys)
+        memo = self._memo()
+        for key in keys:
+            self._count(key, "invalidations")
+            if memo is not None:
+                memo.pop(key, None)
+
+    def clear(self):
+        self.backend.clear()
+        memo = self._memo()
+        if memo is not None:
+            memo.clear()
+
+    def reset_stats(self):
+        with self.lock:
+            self.counters = {}
+
+    def stats(self):
+        """
+        Counters per namespace plus hit_rate (backend hits over backend
+        lookups) and the backend's own info.
+        """
+        with self.lock:
+            namespaces = {name: dict(counts) for name, counts in self.counters.items()}
+        for counts in namespaces.values():
+            lookups = counts["hits"] + counts["misses"]
+            counts["hit_rate"] = counts["hits"] / lookups if lookups else 0.0
+        return {"backend": self.backend.info(), "namespaces": namespaces}
+
+
+# ---------------- ORM rows <-> cached values ----------------
+
+def snapshot(obj, exclude=()):
+    """
+    The column values of an ORM object as a dict.
+    """
+    return {attr.key: getattr(obj, attr.key)
+            for attr in inspect(obj).mapper.column_attrs if attr.key not in exclude}
+
+
+def restore(session, model, values):
+    """
+    Turn a snapshot back into a persistent object in session without a
+    query (merge with load=False). Excluded columns load on first access.
+    """
+    obj = model(**values)
+    make_transient_to_detached(obj)
+    return session.merge(obj, load=False)
@@ -0,0 +1,313 @@
+"""
+Bulk synthetic data for the quiz database.
+
+seed_default_data creates a handful of rows one flush at a time, which is
+too small to show N+1 queries or full scans. This fills User, Subject,
+Chapter, Quiz, Question and Score to a chosen scale with batched Core
+inserts (executemany) and explicit primary keys, so a million scores take
+seconds rather than hours.
+
+    python datagen.py --scale medium
+    python datagen.py --scale large --database sqlite:////tmp/quiz_large.db
+    python datagen.py --users 50000 --scores 500000 --quizzes-per-chapter 8
+
+Distributions:
+  - user activity is heavy-tailed (lognormal weights): a few users take
+    many quizzes, most take a few
+  - quiz popularity follows a Zipf-like curve over a shuffled quiz order
+  - each user has an ability drawn from Beta(5, 3); a score is the number
+    of correct answers out of the quiz's questions at that ability
+  - quizzes are dated over the past year, attempts within 30 days after
+    the quiz date
+
+Synthetic users all share the password "password" (hashed once). The
+SEED_USERS from app.py are added too, with their own passwords, so
+loadgen.py can log in against a generated database.
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+from itertools import accumulate, chain
+
+
+SCALES = {
+    "small": {"users": 1_000, "subjects": 5, "chapters_per_subject": 5,
+              "quizzes_per_chapter": 4, "questions_per_quiz": 10, "scores": 10_000},
+    "medium": {"users": 20_000, "subjects": 10, "chapters_per_subject": 10,
+               "quizzes_per_chapter": 5, "questions_per_quiz": 10, "scores": 200_000},
+    "large": {"users": 100_000, "subjects": 20, "chapters_per_subject": 10,
+              "quizzes_per_chapter": 5, "questions_per_quiz": 10, "scores": 1_000_000},
+}
+
+BATCH_SIZE = 10_000
+SYNTHETIC_PASSWORD = "password"
+
+FIRST_NAMES = ("Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Meera", "Arjun", "Diya",
+               "James", "Maria", "Chen", "Fatima", "Lucas", "Sofia", "Noah", "Aisha")
+LAST_NAMES = ("Sharma", "Patel", "Iyer", "Reddy", "Gupta", "Singh", "Nair", "Khan",
+              "Smith", "Garcia", "Wang", "Ali", "Silva", "Rossi", "Brown", "Kim")
+QUALIFICATIONS = ("High School", "Diploma", "B.Sc", "B.Tech", "B.A", "M.Sc", "M.Tech", "MBA", "PhD")
+QUALIFICATION_WEIGHTS = (20, 8, 18, 22, 10, 8, 6, 5, 3)
+SUBJECT_NAMES = ("Mathematics", "Physics", "Chemistry", "Biology", "Computer Science",
+                 "History", "Geography", "Economics", "English", "Statistics")
+DURATIONS = ("10", "15", "20", "30", "45", "60")
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _next_id(model):
+    from models import db
+
+    return (db.session.query(db.func.max(model.id)).scalar() or 0) + 1
+
+
+def bulk_insert(model, rows, batch_size=BATCH_SIZE):
+    """
+    Insert an iterable of row dicts into model's table with one executemany
+    per batch. Returns the number of rows.
+    """
+    from models import db
+
+    table = model.__table__
+    connection = db.session.connection()
+    count = 0
+    for batch in _batches(rows, batch_size):
+        connection.execute(table.insert(), batch)
+        count += len(batch)
+    db.session.commit()
+    return count
+
+
+def _user_rows(first_id, count, rng, password_hash):
+    dob_start = date(1970, 1, 1).toordinal()
+    dob_end = date(2006, 12, 31).toordinal()
+    for user_id in range(first_id, first_id + count):
+        yield {
+            "id": user_id,
+            "username": f"user{user_id}@example.com",
+            "password": password_hash,
+            "full_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "qualification": rng.choices(QUALIFICATIONS, QUALIFICATION_WEIGHTS)[0],
+            "dob": date.fromordinal(rng.randint(dob_start, dob_end)),
+            "role": "user",
+        }
+
+
+def _question_rows(first_id, quizzes, questions_per_quiz, rng):
+    question_id = first_id
+    for quiz in quizzes:
+        for n in range(1, questions_per_quiz + 1):
+            yield {
+                "id": question_id,
+                "chapter_id": quiz["chapter_id"],
+                "quiz_id": quiz["id"],
+                "question_title": f"Q{n} for Quiz {quiz['id']}",
+                "question_statement": f"Synthetic question {n} of quiz {quiz['id']}?",
+                "option1": "Option 1",
+                "option2": "Option 2",
+                "option3": "Option 3",
+                "option4": "Option 4",
+                "correct_answer": rng.randint(1, 4),
+            }
+            question_id += 1
+
+
+def _score_rows(first_id, count, users, quizzes, questions_per_quiz, rng, now):
+    """
+    Scores with heavy-tailed user activity and Zipf-like quiz popularity.
+    users is a list of (user_id, ability); quizzes a list of quiz dicts.
+    """
+    user_weights = list(accumulate(rng.lognormvariate(0, 1) for _ in users))
+    popularity = list(range(len(quizzes)))
+    rng.shuffle(popularity)
+    quiz_weights = list(accumulate(1 / (rank + 1) ** 0.8 for rank in popularity))
+
+    score_id = first_id
+    remaining = count
+    while remaining:
+        k = min(remaining, BATCH_SIZE)
+        picked_users = rng.choices(users, cum_weights=user_weights, k=k)
+        picked_quizzes = rng.choices(quizzes, cum_weights=quiz_weights, k=k)
+        for (user_id, ability), quiz in zip(picked_users, picked_quizzes):
+            correct = sum(rng.random() < ability for _ in range(questions_per_quiz))
+            attempted = datetime.combine(quiz["date_of_quiz"], datetime.min.time()) + \
+                timedelta(seconds=rng.randint(0, 30 * 86400))
+            yield {
+                "id": score_id,
+                "quiz_id": quiz["id"],
+                "user_id": user_id,
+                "time_stamp_of_attempt": min(attempted, now),
+                "total_scored": correct,
+            }
+            score_id += 1
+        remaining -= k
+
+
+def generate(users=1_000, subjects=5, chapters_per_subject=5, quizzes_per_chapter=4,
+             questions_per_quiz=10, scores=10_000, seed=0, batch_size=BATCH_SIZE,
+             verbose=True):
+    """
+    Append synthetic rows to the app's database (call inside an app context).
+    New ids continue after the current maximum of each table, so an existing
+    database keeps its rows.
+
+    Returns {table: (rows inserted, seconds)}.
+    """
+    from werkzeug.security import generate_password_hash
+    from app import SEED_USERS
+    from aggregates import rebuild_aggregates
+    from models import db, User, Subject, Chapter, Quiz, Question, Score
+
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    report = {}
+
+    def timed(name, model, rows):
+        start = time.perf_counter()
+        count = bulk_insert(model, rows, batch_size)
+        report[name] = (count, time.perf_counter() - start)
+        if verbose:
+            print(f"   {name:<10}: {count:>9,} rows in {report[name][1]:.2f}s")
+
+    if verbose:
+        print("\n🧪 Generating synthetic quiz data")
+        print("-" * 40)
+
+    # Users: the seed users (if missing) plus synthetic ones sharing one hash.
+    first_user = _next_id(User)
+    existing = {u.username for u in User.query.with_entities(User.username)
+                .filter(User.username.in_([u["username"] for u in SEED_USERS]))}
+    # Same keys as _user_rows: both go in one executemany batch, whose
+    # INSERT is built from the first row's keys.
+    seed_rows = [
+        {"id": first_user + i, "username": u["username"],
+         "password": generate_password_hash(u["password"]),
+         "full_name": u["full_name"], "qualification": None, "dob": None, "role": "user"}
+        for i, u in enumerate(u for u in SEED_USERS if u["username"] not in existing)
+    ]
+    synthetic_first = first_user + len(seed_rows)
+    password_hash = generate_password_hash(SYNTHETIC_PASSWORD)
+    timed("users", User, chain(seed_rows, _user_rows(synthetic_first, users, rng, password_hash)))
+
+    # Catalog: subjects -> chapters -> quizzes -> questions.
+    subject_rows = []
+    first_subject = _next_id(Subject)
+    for i in range(subjects):
+        name = SUBJECT_NAMES[i % len(SUBJECT_NAMES)]
+        if i >= len(SUBJECT_NAMES):
+            name = f"{name} {i // len(SUBJECT_NAMES) + 1}"
+        subject_rows.append({"id": first_subject + i, "name": name,
+                             "description": f"Synthetic subject: {name}"})
+    timed("subjects", Subject, subject_rows)
+
+    chapter_rows = []
+    chapter_id = _next_id(Chapter)
+    for subject in subject_rows:
+        for n in range(1, chapters_per_subject + 1):
+            chapter_rows.append({"id": chapter_id, "name": f"{subject['name']} - Chapter {n}",
+                                 "description": f"Chapter {n} of {subject['name']}",
+                                 "subject_id": subject["id"]})
+            chapter_id += 1
+    timed("chapters", Chapter, chapter_rows)
+
+    quiz_rows = []
+    quiz_id = _next_id(Quiz)
+    first_day = now.date().toordinal() - 365
+    for chapter in chapter_rows:
+        for n in range(1, quizzes_per_chapter + 1):
+            quiz_rows.append({"id": quiz_id, "chapter_id": chapter["id"],
+                              "date_of_quiz": date.fromordinal(first_day + rng.randint(0, 365)),
+                              "time_duration": rng.choice(DURATIONS),
+                              "remarks": f"Synthetic quiz {n} for chapter {chapter['id']}"})
+            quiz_id += 1
+    timed("quizzes", Quiz, quiz_rows)
+
+    timed("questions", Question,
+          _question_rows(_next_id(Question), quiz_rows, questions_per_quiz, rng))
+
+    # Scores over every user (old and new) and the new quizzes.
+    user_ids = [row[0] for row in db.session.query(User.id).filter(User.role != "admin")]
+    abilities = [(user_id, rng.betavariate(5, 3)) for user_id in user_ids]
+    if abilities and quiz_rows:
+        timed("scores", Score, _score_rows(_next_id(Score), scores, abilities, quiz_rows,
+                                           questions_per_quiz, rng, now))
+
+    # Bulk rows bypass submit_quiz, which maintains the score aggregates.
+    start = time.perf_counter()
+    rebuild_aggregates(db.session)
+    report["aggregates"] = (0, time.perf_counter() - start)
+
+    if verbose:
+        total = sum(seconds for _, seconds in report.values())
+        print(f"🏁 Done in {total:.2f}s")
+        print("-" * 40)
+    return report
+
+
+def fast_sqlite_load(engine):
+    """
+    Relax durability on a SQLite engine for the duration of a bulk load:
+    no fsync and an in-memory rollback journal. Other backends are left alone.
+    """
+    from sqlalchemy import event
+
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.close()
+
+    engine.dispose()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fill the quiz database with synthetic data.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--database", help="SQLAlchemy URI (default: the app's database)")
+    parser.add_argument("--users", type=int)
+    parser.add_argument("--subjects", type=int)
+    parser.add_argument("--chapters-per-subject", type=int)
+    parser.add_argument("--quizzes-per-chapter", type=int)
+    parser.add_argument("--questions-per-quiz", type=int)
+    parser.add_argument("--scores", type=int)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.database:
+        os.environ["QUIZ_DATABASE_URI"] = args.database
+
+    import logging
+    from app import app
+    from models import db
+
+    logging.getLogger().setLevel(logging.WARNING)
+    options = dict(SCALES[args.scale])
+    for key in options:
+        value = getattr(args, key)
+        if value is not None:
+            options[key] = value
+
+    with app.app_context():
+        db.create_all()
+        fast_sqlite_load(db.engine)
+        generate(seed=args.seed, batch_size=args.batch_size, **options)
+
+
+if __name__ == "__main__":
+    main()
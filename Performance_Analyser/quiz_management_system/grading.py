@@ -0,0 +1,164 @@
+"""
+Quiz grading and batched score writes.
+
+  - answer keys : a quiz's (question ids, correct answers) as two tuples,
+                  small enough to cache (app.answer_key) instead of loading
+                  every Question object on each submit
+  - grade()     : compares a submitted form with a key in one C-level pass
+                  (map(operator.eq, ...)) rather than an attribute lookup
+                  and int() per question in Python
+  - ScoreWriter : a background thread that takes submitted scores from a
+                  queue and writes whatever has queued up as one
+                  transaction (Score rows plus the aggregates), so a burst
+                  of N submits costs a few commits instead of N
+
+A submit can wait for its batch to commit (group commit: same durability
+as writing in the request) or return as soon as the score is queued
+(write-behind: queued scores are lost if the process dies). app.py picks
+with QUIZ_SCORE_WRITES = sync | group | behind (default sync).
+"""
+import atexit
+import operator
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import Future
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from aggregates import record_attempts
+from models import Question, Score
+
+# Most scores one transaction writes.
+BATCH_SIZE = 256
+
+AnswerKey = namedtuple("AnswerKey", ["question_ids", "answers"])
+
+
+def load_answer_key(session, quiz_id):
+    """
+    The quiz's answer key, questions in id order (the order quiz.html
+    lists them).
+    """
+    rows = session.execute(
+        select(Question.id, Question.correct_answer)
+        .where(Question.quiz_id == quiz_id).order_by(Question.id)
+    ).all()
+    return AnswerKey(tuple(row[0] for row in rows), tuple(row[1] for row in rows))
+
+
+def _choice(value):
+    return int(value) if value else None
+
+
+def grade(key, form):
+    """
+    Number of questions in key answered correctly in form (question id ->
+    chosen option, as quiz.html posts it). Unanswered questions score 0.
+    """
+    selected = map(_choice, map(form.get, map(str, key.question_ids)))
+    return sum(map(operator.eq, key.answers, selected))
+
+
+class ScoreWriter:
+    """
+    Writes queued scores in batches from one background thread.
+
+    submit() returns a Future that resolves to None once the score is
+    committed, or to the exception that kept it from being written. A batch
+    that fails is retried one score at a time, so one bad row (a quiz
+    deleted meanwhile) does not fail the others. A Future cancelled before
+    its batch is taken (a caller that gave up waiting) is not written.
+    """
+
+    def __init__(self, engine, batch_size=BATCH_SIZE):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.batches = 0
+        self.written = 0
+        self.failed = 0
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="score-writer", daemon=True)
+                self.thread.start()
+                atexit.register(self.close)
+
+    def submit(self, quiz_id, user_id, score, time_stamp):
+        self.start()
+        pending = Future()
+        self.queue.put((pending, {"quiz_id": quiz_id, "user_id": user_id,
+                                  "time_stamp_of_attempt": time_stamp, "total_scored": score}))
+        return pending
+
+    def flush(self):
+        """
+        Block until every score submitted so far is written (or failed).
+        """
+        if self.thread is not None:
+            self.queue.join()
+
+    def close(self):
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread is not None:
+            self.queue.put(None)
+            thread.join()
+
+    def stats(self):
+        return {"batches": self.batches, "written": self.written, "failed": self.failed,
+                "mean_batch": self.written / self.batches if self.batches else 0.0,
+                "queued": self.queue.qsize()}
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            # Everything that queued up while the last batch was committing.
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            writing = [item for item in batch if item[0].set_running_or_notify_cancel()]
+            if writing:
+                self._write(writing)
+            for _ in range(len(batch) + stop):
+                self.queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch):
+        rows = [row for _, row in batch]
+        try:
+            with Session(self.engine) as session:
+                session.execute(Score.__table__.insert(), rows)
+                record_attempts(session, [(r["quiz_id"], r["user_id"], r["total_scored"]) for r in rows])
+                session.commit()
+        except Exception as e:
+            if len(batch) > 1:
+                for item in batch:
+                    self._write([item])
+                return
+            self.failed += 1
+            batch[0][0].set_exception(e)
+            return
+
+        self.batches += 1
+        self.written += len(batch)
+        for pending, _ in batch:
+            pending.set_result(None)
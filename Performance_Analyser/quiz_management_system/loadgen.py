@@ -0,0 +1,348 @@
+"""
+Load generator for the quiz app.
+
+Virtual users log in as seeded users and walk the quiz scenario
+
+    /login -> /user_dashboard -> /view?quiz_id=N -> /quiz/N -> /submit_quiz/N
+
+either in-process through the Flask test client or over HTTP against a
+running server, and per-endpoint throughput and latency percentiles are
+reported.
+
+    python loadgen.py                                  # in-process, fresh seeded DB
+    python loadgen.py --concurrency 16 --rate 40 --duration 30
+    python loadgen.py --url http://127.0.0.1:5000      # against `python app.py`
+
+With --rate, sessions arrive as a Poisson process at that many sessions per
+second (open model; latency includes no queueing, queue delay is reported
+apart). Without it, --concurrency users run sessions back to back (closed
+model).
+
+The app's cache hit rates (/cache_stats) are reported after the run.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from statistics import mean, quantiles
+
+
+_CSRF = re.compile(r'name="csrf_token" type="hidden" value="([^"]+)"')
+_QUIZ_LINK = re.compile(r'/quiz/(\d+)')
+_QUESTION = re.compile(r'<input type="radio" name="(\d+)" value="1">')
+
+
+def percentile(values, q):
+    if len(values) == 1:
+        return values[0]
+    return quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+# ---------------- CLIENTS ----------------
+# Both return (status_code, body text) and never follow redirects, so every
+# measured request is a single endpoint.
+
+class TestClient:
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def get(self, path):
+        response = self.client.get(path)
+        return response.status_code, response.get_data(as_text=True)
+
+    def post(self, path, data):
+        response = self.client.post(path, data=data)
+        return response.status_code, response.get_data(as_text=True)
+
+
+class HTTPClient:
+    def __init__(self, base_url, timeout=30):
+        import requests
+
+        self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        self.timeout = timeout
+
+    def get(self, path):
+        response = self.session.get(self.base_url + path, allow_redirects=False,
+                                    timeout=self.timeout)
+        return response.status_code, response.text
+
+    def post(self, path, data):
+        response = self.session.post(self.base_url + path, data=data,
+                                     allow_redirects=False, timeout=self.timeout)
+        return response.status_code, response.text
+
+
+# ---------------- SCENARIO ----------------
+
+class Recorder:
+    """
+    Thread-safe per-endpoint latencies and error counts (status >= 400 or
+    an exception).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+        self.queue_delays = []
+        self.failed_logins = 0
+
+    def request(self, endpoint, call, *args):
+        start = time.perf_counter()
+        try:
+            status, body = call(*args)
+        except Exception:
+            status, body = None, ""
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.latencies.setdefault(endpoint, []).append(elapsed)
+            if status is None or status >= 400:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+        return status, body
+
+
+def run_session(client, user, recorder, rng):
+    """
+    One user visit: log in, open the dashboard, view a quiz, take it and
+    submit random answers.
+    """
+    _, body = recorder.request("GET /login", client.get, "/login")
+    match = _CSRF.search(body)
+    form = {"username": user["username"], "password": user["password"]}
+    if match:
+        form["csrf_token"] = match.group(1)
+    status, _ = recorder.request("POST /login", client.post, "/login", form)
+    if status != 302:
+        # The form was re-rendered: bad credentials or CSRF token.
+        with recorder.lock:
+            recorder.failed_logins += 1
+        return
+
+    _, body = recorder.request("GET /user_dashboard", client.get, "/user_dashboard")
+    quiz_ids = sorted(set(_QUIZ_LINK.findall(body)))
+    if not quiz_ids:
+        # Every quiz attempted already: retake one of the seeded ones.
+        quiz_ids = [str(rng.randint(1, user.get("max_quiz_id", 1)))]
+    quiz_id = rng.choice(quiz_ids)
+
+    recorder.request("GET /view", client.get, f"/view?quiz_id={quiz_id}")
+    _, body = recorder.request("GET /quiz/<id>", client.get, f"/quiz/{quiz_id}")
+    answers = {qid: str(rng.randint(1, 4)) for qid in _QUESTION.findall(body)}
+    recorder.request("POST /submit_quiz/<id>", client.post, f"/submit_quiz/{quiz_id}", answers)
+
+
+def generate_load(make_client, users, concurrency=8, rate=None, duration=10.0,
+                  sessions=None, seed=0):
+    """
+    Drive run_session from `concurrency` worker threads.
+
+    - rate=None : closed model, every worker starts a new session as soon
+                  as the previous one ends
+    - rate=R    : open model, sessions arrive at R per second (exponential
+                  inter-arrival times) and wait for a free worker
+    Stops after `duration` seconds or `sessions` sessions, whichever first.
+    Returns the report dict (see summarize_load).
+    """
+    recorder = Recorder()
+    rng = random.Random(seed)
+    local = threading.local()
+    started = [0]
+    started_lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def next_session():
+        with started_lock:
+            if sessions is not None and started[0] >= sessions:
+                return None
+            index = started[0]
+            started[0] += 1
+        return index
+
+    def session(index, arrival=None):
+        if arrival is not None:
+            with recorder.lock:
+                recorder.queue_delays.append(time.perf_counter() - arrival)
+        if getattr(local, "client", None) is None:
+            local.client = make_client()
+        user_rng = random.Random(seed * 1_000_003 + index)
+        run_session(local.client, users[index % len(users)], recorder, user_rng)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        if rate is None:
+            def worker():
+                while time.perf_counter() < deadline:
+                    index = next_session()
+                    if index is None:
+                        return
+                    session(index)
+
+            for future in [pool.submit(worker) for _ in range(concurrency)]:
+                future.result()
+        else:
+            futures = []
+            next_arrival = time.perf_counter()
+            while next_arrival < deadline:
+                index = next_session()
+                if index is None:
+                    break
+                delay = next_arrival - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(pool.submit(session, index, next_arrival))
+                next_arrival += rng.expovariate(rate)
+            for future in futures:
+                future.result()
+    wall = time.perf_counter() - start
+
+    return summarize_load(recorder, wall, started[0], concurrency, rate)
+
+
+def summarize_load(recorder, wall, session_count, concurrency, rate):
+    endpoints = {}
+    all_latencies = []
+    for endpoint, values in recorder.latencies.items():
+        all_latencies.extend(values)
+        endpoints[endpoint] = {
+            "requests": len(values),
+            "errors": recorder.errors.get(endpoint, 0),
+            "requests_per_sec": len(values) / wall,
+            "mean": mean(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": max(values),
+        }
+
+    report = {
+        "sessions": session_count,
+        "concurrency": concurrency,
+        "arrival_rate": rate,
+        "wall": wall,
+        "requests": len(all_latencies),
+        "errors": sum(recorder.errors.values()),
+        "failed_logins": recorder.failed_logins,
+        "requests_per_sec": len(all_latencies) / wall if wall else 0.0,
+        "endpoints": endpoints,
+    }
+    if all_latencies:
+        report.update(p50=percentile(all_latencies, 50), p95=percentile(all_latencies, 95),
+                      p99=percentile(all_latencies, 99))
+    if recorder.queue_delays:
+        report["queue_delay_p95"] = percentile(recorder.queue_delays, 95)
+    return report
+
+
+def print_report(report):
+    print("\n📊 Load Test Summary")
+    print("-" * 40)
+    mode = f"rate {report['arrival_rate']}/s" if report["arrival_rate"] else "closed loop"
+    print(f"   {report['sessions']} sessions, concurrency {report['concurrency']}, {mode}, "
+          f"{report['wall']:.1f}s")
+    for endpoint, e in report["endpoints"].items():
+        print(f"   {endpoint:<24}: {e['requests_per_sec']:7.1f} req/s  "
+              f"p50 {e['p50'] * 1000:7.2f}ms  p95 {e['p95'] * 1000:7.2f}ms  "
+              f"p99 {e['p99'] * 1000:7.2f}ms  errors {e['errors']}")
+    print(f"🏁 Total: {report['requests_per_sec']:.1f} req/s, {report['errors']} errors, "
+          f"{report['failed_logins']} failed logins")
+    if "queue_delay_p95" in report:
+        print(f"⏳ Queue delay p95: {report['queue_delay_p95'] * 1000:.2f}ms")
+    if "cache" in report:
+        rates = "  ".join(f"{name} {c['hit_rate']:.0%}"
+                          for name, c in sorted(report["cache"]["namespaces"].items()))
+        print(f"💾 Cache ({report['cache']['backend']['backend']}) hit rate: {rates or 'no lookups'}")
+    print("-" * 40)
+
+
+def fetch_cache_stats(client):
+    """
+    The app's /cache_stats, or None if it has no cache or is unreachable.
+    """
+    try:
+        status, body = client.get("/cache_stats")
+    except Exception:
+        return None
+    return json.loads(body) if status == 200 else None
+
+
+# ---------------- SETUP ----------------
+
+def prepare_in_process(database=None):
+    """
+    Import the app against `database` (a SQLAlchemy URI) or, by default, a
+    fresh temporary SQLite file seeded with seed_default_data. The profiler
+    writes its measurements to the same temporary directory unless
+    QUIZ_PROFILER_FILE is set.
+
+    Returns (app, users).
+    """
+    work_dir = tempfile.mkdtemp(prefix="quiz_load_")
+    fresh = database is None
+    if fresh:
+        database = "sqlite:///" + os.path.join(work_dir, "load.db")
+    os.environ["QUIZ_DATABASE_URI"] = database
+    os.environ.setdefault("QUIZ_PROFILER_FILE", os.path.join(work_dir, "flask_profiler.sqlite"))
+
+    import logging
+    from app import app, seed_default_data, SEED_USERS
+    from models import db, Quiz
+
+    logging.getLogger().setLevel(logging.WARNING)
+    with app.app_context():
+        if fresh:
+            db.create_all()
+            seed_default_data()
+        max_quiz_id = db.session.query(db.func.max(Quiz.id)).scalar() or 1
+
+    return app, [dict(u, max_quiz_id=max_quiz_id) for u in SEED_USERS]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate load against the quiz app.")
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process test client)")
+    parser.add_argument("--database", help="SQLAlchemy URI for in-process runs "
+                                           "(default: fresh seeded temporary SQLite DB)")
+    parser.add_argument("--concurrency", "-c", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Session arrival rate per second (default: closed loop)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--sessions", type=int, default=None, help="Stop after this many sessions")
+    parser.add_argument("--max-quiz-id", type=int, default=27,
+                        help="Highest quiz id to retake on a remote server")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this file")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        # Importing app only for SEED_USERS; keep its profiler file out of the tree.
+        os.environ.setdefault("QUIZ_PROFILER_FILE", os.path.join(
+            tempfile.mkdtemp(prefix="quiz_load_"), "flask_profiler.sqlite"))
+        from app import SEED_USERS
+
+        users = [dict(u, max_quiz_id=args.max_quiz_id) for u in SEED_USERS]
+        make_client = lambda: HTTPClient(args.url)  # noqa: E731
+    else:
+        app, users = prepare_in_process(args.database)
+        make_client = lambda: TestClient(app)  # noqa: E731
+
+    report = generate_load(make_client, users, concurrency=args.concurrency, rate=args.rate,
+                           duration=args.duration, sessions=args.sessions, seed=args.seed)
+    cache = fetch_cache_stats(make_client())
+    if cache is not None:
+        report["cache"] = cache
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
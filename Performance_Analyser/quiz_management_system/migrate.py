@@ -0,0 +1,226 @@
+"""
+Bring an existing quiz database up to the schema in models.py: foreign
+keys and indexes. Safe to run more than once.
+
+    python migrate.py                         # the app's database (instance/database.db)
+    python migrate.py --dry-run               # only report what would change
+    python migrate.py --database sqlite:////path/to/database.db --orphans delete
+
+Indexes are created in place. SQLite cannot add a FOREIGN KEY to an
+existing table, so tables missing one are rebuilt: a new table is created
+under a temporary name, the rows are copied, the old table is dropped and
+the new one renamed (https://sqlite.org/lang_altertable.html#otheralter).
+Other backends get ALTER TABLE ... ADD CONSTRAINT.
+
+Rows whose reference points at a missing parent (a quiz whose chapter was
+deleted before foreign keys existed, ...) would violate the new
+constraints. --orphans null (default) clears the dangling reference and
+keeps the row; --orphans delete removes the row.
+
+A SQLite database file is copied to <file>.bak before it is changed.
+"""
+import argparse
+import os
+import re
+import shutil
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import AddConstraint, CreateTable
+
+
+def _fk_signature(columns, referred_table):
+    return (tuple(columns), referred_table)
+
+
+def plan_migration(connection, metadata):
+    """
+    Compare the live schema with metadata.
+
+    Returns {table name: {"foreign_keys": [ForeignKeyConstraint, ...],
+                          "indexes": [Index, ...]}} for tables that need work.
+    """
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    plan = {}
+
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        live_fks = {_fk_signature(fk["constrained_columns"], fk["referred_table"])
+                    for fk in inspector.get_foreign_keys(table.name)}
+        live_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+
+        missing_fks = [fk for fk in table.foreign_key_constraints
+                       if _fk_signature(fk.column_keys, fk.referred_table.name) not in live_fks]
+        missing_indexes = [index for index in table.indexes if index.name not in live_indexes]
+        if missing_fks or missing_indexes:
+            plan[table.name] = {"foreign_keys": missing_fks, "indexes": missing_indexes}
+
+    return plan
+
+
+def count_orphans(connection, table, constraint):
+    """
+    Rows of table whose (single-column) foreign key points at no parent row.
+    """
+    column = constraint.column_keys[0]
+    parent = constraint.referred_table
+    sql = (f'SELECT COUNT(*) FROM "{table.name}" WHERE "{column}" IS NOT NULL '
+           f'AND "{column}" NOT IN (SELECT "{constraint.elements[0].column.name}" '
+           f'FROM "{parent.name}")')
+    return connection.execute(text(sql)).scalar()
+
+
+def fix_orphans(connection, table, constraint, mode):
+    column = constraint.column_keys[0]
+    parent = constraint.referred_table
+    where = (f'"{column}" IS NOT NULL AND "{column}" NOT IN '
+             f'(SELECT "{constraint.elements[0].column.name}" FROM "{parent.name}")')
+    if mode == "delete":
+        sql = f'DELETE FROM "{table.name}" WHERE {where}'
+    else:
+        sql = f'UPDATE "{table.name}" SET "{column}" = NULL WHERE {where}'
+    return connection.execute(text(sql)).rowcount
+
+
+def _rebuild_sqlite_table(connection, table):
+    """
+    Recreate table from its model definition and copy its rows across.
+    Must run with foreign key enforcement off.
+    """
+    temp_name = f"_{table.name}_new"
+    ddl = str(CreateTable(table).compile(dialect=connection.dialect))
+    ddl = re.sub(r'^\s*CREATE TABLE ("?)' + re.escape(table.name) + r'\1',
+                 f'CREATE TABLE "{temp_name}"', ddl, count=1)
+
+    live_columns = {c["name"] for c in inspect(connection).get_columns(table.name)}
+    columns = ", ".join(f'"{c.name}"' for c in table.columns if c.name in live_columns)
+
+    for index in inspect(connection).get_indexes(table.name):
+        connection.execute(text(f'DROP INDEX "{index["name"]}"'))
+    connection.execute(text(ddl))
+    connection.execute(text(f'INSERT INTO "{temp_name}" ({columns}) '
+                            f'SELECT {columns} FROM "{table.name}"'))
+    connection.execute(text(f'DROP TABLE "{table.name}"'))
+    connection.execute(text(f'ALTER TABLE "{temp_name}" RENAME TO "{table.name}"'))
+
+
+def migrate(engine, metadata, orphans="null", dry_run=False, verbose=True):
+    """
+    Apply plan_migration's changes in one transaction. Returns the plan that
+    was (or, with dry_run, would be) applied.
+    """
+    sqlite = engine.dialect.name == "sqlite"
+
+    with engine.connect() as connection:
+        if sqlite:
+            # Off for the rebuild (dropping a parent table must not cascade);
+            # the pragma is ignored inside a transaction, so end that first.
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            connection.commit()
+        plan = plan_migration(connection, metadata)
+
+        if verbose:
+            print("\n🛠️  Schema migration" + (" (dry run)" if dry_run else ""))
+            print("-" * 40)
+            if not plan:
+                print("   Up to date.")
+
+        for table in metadata.sorted_tables:
+            if verbose and table.name in plan:
+                for fk in plan[table.name]["foreign_keys"]:
+                    print(f"   {table.name}.{fk.column_keys[0]} -> {fk.referred_table.name}: "
+                          f"add foreign key ({count_orphans(connection, table, fk)} orphaned rows)")
+                for index in plan[table.name]["indexes"]:
+                    print(f"   {table.name}: add index {index.name} "
+                          f"({', '.join(c.name for c in index.columns)})")
+
+        if plan and not dry_run:
+            if sqlite:
+                # pysqlite does not open a transaction for DDL on its own.
+                connection.commit()
+                connection.exec_driver_sql("BEGIN")
+            for table in metadata.sorted_tables:
+                if table.name not in plan:
+                    continue
+                work = plan[table.name]
+
+                for fk in work["foreign_keys"]:
+                    fixed = fix_orphans(connection, table, fk, orphans)
+                    if fixed and verbose:
+                        action = "deleted" if orphans == "delete" else "cleared"
+                        print(f"   {table.name}: {action} {fixed} orphaned rows")
+
+                if work["foreign_keys"] and sqlite:
+                    _rebuild_sqlite_table(connection, table)
+                    for index in table.indexes:
+                        index.create(connection, checkfirst=True)
+                    continue
+
+                for fk in work["foreign_keys"]:
+                    connection.execute(AddConstraint(fk))
+                for index in work["indexes"]:
+                    index.create(connection)
+
+            if sqlite:
+                problems = connection.exec_driver_sql("PRAGMA foreign_key_check").fetchall()
+                if problems:
+                    raise RuntimeError(f"foreign_key_check failed after migration: {problems[:10]}")
+            connection.commit()
+
+        if sqlite:
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+            connection.commit()
+
+    if verbose:
+        print("-" * 40)
+    return plan
+
+
+def _sqlite_file(engine):
+    if engine.dialect.name != "sqlite":
+        return None
+    path = engine.url.database
+    if not path or path == ":memory:":
+        return None
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Add foreign keys and indexes to a quiz database.")
+    parser.add_argument("--database", help="SQLAlchemy URI (default: the app's database)")
+    parser.add_argument("--orphans", choices=("null", "delete"), default="null",
+                        help="What to do with rows referencing missing parents")
+    parser.add_argument("--dry-run", action="store_true", help="Report the changes only")
+    parser.add_argument("--no-backup", action="store_true",
+                        help="Do not copy a SQLite database file before migrating")
+    args = parser.parse_args(argv)
+
+    if args.database:
+        os.environ["QUIZ_DATABASE_URI"] = args.database
+
+    import logging
+    from app import app
+    from aggregates import rebuild_aggregates
+    from models import db
+
+    logging.getLogger().setLevel(logging.WARNING)
+    with app.app_context():
+        engine = db.engine
+        path = _sqlite_file(engine)
+        if path and not args.dry_run and not args.no_backup and os.path.exists(path):
+            with engine.connect() as connection:
+                pending = plan_migration(connection, db.metadata)
+            if pending:
+                shutil.copy2(path, path + ".bak")
+                print(f"💾 Backup: {path}.bak")
+        migrate(engine, db.metadata, orphans=args.orphans, dry_run=args.dry_run)
+        # Tables added since the database was created, and the score
+        # aggregates, which older databases do not have.
+        if not args.dry_run:
+            db.create_all()
+            rebuild_aggregates(db.session)
+
+
+if __name__ == "__main__":
+    main()
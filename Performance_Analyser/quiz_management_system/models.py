@@ -1,7 +1,36 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 
 db = SQLAlchemy()
 
+
+def enable_sqlite_foreign_keys(engine):
+    """
+    SQLite only enforces FOREIGN KEY constraints (and ON DELETE CASCADE)
+    when every connection turns them on.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _foreign_keys(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+# Relationships:
+#   - collections (subject.chapters, quiz.questions, user.scores, ...) are
+#     lazy="select": loaded only when touched; list views should ask for
+#     them with selectinload() instead of touching them per row
+#   - parents (score.user, chapter.subject, ...) are lazy="select" too; they
+#     are often already in the session's identity map, which answers them
+#     without a query. Listings that show a parent on every row ask for it
+#     with joinedload() (aggregates.score_page, aggregates.leaderboard), so
+#     queries that only need the row's own columns do not pay for a join
+# Deletes cascade in the database (ON DELETE CASCADE + passive_deletes),
+# so deleting a chapter does not load its quizzes, questions and scores.
+
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(150), unique=True, nullable=False)
@@ -9,30 +38,49 @@ class User(db.Model):
     full_name = db.Column(db.String(150), nullable=False)
     qualification = db.Column(db.String(150))
     dob = db.Column(db.Date)
-    role = db.Column(db.String(50), default='user') 
-    
+    role = db.Column(db.String(50), default='user')
+
+    scores = db.relationship('Score', back_populates='user', lazy='select',
+                             cascade='all, delete-orphan', passive_deletes=True)
+
 class Subject(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(150), nullable=False)
     description = db.Column(db.String(500))
 
+    chapters = db.relationship('Chapter', back_populates='subject', lazy='select',
+                               order_by='Chapter.id',
+                               cascade='all, delete-orphan', passive_deletes=True)
+
 class Chapter(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(150), nullable=False)
     description = db.Column(db.String(500))
-    subject_id = db.Column(db.Integer)
+    subject_id = db.Column(db.Integer, db.ForeignKey('subject.id', ondelete='CASCADE'), index=True)
+
+    subject = db.relationship('Subject', back_populates='chapters', lazy='select')
+    quizzes = db.relationship('Quiz', back_populates='chapter', lazy='select',
+                              order_by='Quiz.id',
+                              cascade='all, delete-orphan', passive_deletes=True)
 
 class Quiz(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    chapter_id = db.Column(db.Integer)
+    chapter_id = db.Column(db.Integer, db.ForeignKey('chapter.id', ondelete='CASCADE'), index=True)
     date_of_quiz = db.Column(db.Date)
     time_duration = db.Column(db.String(10))
-    remarks = db.Column(db.String(500), nullable=True) 
+    remarks = db.Column(db.String(500), nullable=True)
+
+    chapter = db.relationship('Chapter', back_populates='quizzes', lazy='select')
+    questions = db.relationship('Question', back_populates='quiz', lazy='select',
+                                order_by='Question.id',
+                                cascade='all, delete-orphan', passive_deletes=True)
+    scores = db.relationship('Score', back_populates='quiz', lazy='select',
+                             cascade='all, delete-orphan', passive_deletes=True)
 
 class Question(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    chapter_id = db.Column(db.Integer)
-    quiz_id = db.Column(db.Integer)
+    chapter_id = db.Column(db.Integer, db.ForeignKey('chapter.id', ondelete='CASCADE'), index=True)
+    quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id', ondelete='CASCADE'), index=True)
     question_title = db.Column(db.String(100), nullable=False)
     question_statement = db.Column(db.String(500))
     option1 = db.Column(db.String(150))
@@ -41,9 +89,51 @@ class Question(db.Model):
     option4 = db.Column(db.String(150))
     correct_answer = db.Column(db.Integer, nullable=False)
 
+    quiz = db.relationship('Quiz', back_populates='questions', lazy='select')
+
 class Score(db.Model):
+    # (user_id, quiz_id) serves "scores of this user" and "did this user
+    # attempt this quiz"; quiz_id alone serves per-quiz counts.
+    __table_args__ = (
+        db.Index('ix_score_user_id_quiz_id', 'user_id', 'quiz_id'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    quiz_id = db.Column(db.Integer)
-    user_id = db.Column(db.Integer)
+    quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id', ondelete='CASCADE'), index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'))
     time_stamp_of_attempt = db.Column(db.DateTime)
-    total_scored = db.Column(db.Integer)
\ No newline at end of file
+    total_scored = db.Column(db.Integer)
+
+    quiz = db.relationship('Quiz', back_populates='scores', lazy='select')
+    user = db.relationship('User', back_populates='scores', lazy='select')
+
+# Aggregates kept up to date on every submit (see aggregates.py), so the
+# admin summary reads a few rows instead of every score.
+
+class QuizStats(db.Model):
+    __table_args__ = (
+        db.Index('ix_quiz_stats_attempts', 'attempts'),
+    )
+
+    quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id', ondelete='CASCADE'), primary_key=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    total_score = db.Column(db.Integer, nullable=False, default=0)
+    max_score = db.Column(db.Integer, nullable=False, default=0)
+
+    quiz = db.relationship('Quiz', lazy='select')
+
+    @property
+    def average_score(self):
+        return self.total_score / self.attempts if self.attempts else 0.0
+
+class UserStats(db.Model):
+    __table_args__ = (
+        db.Index('ix_user_stats_total_score', 'total_score'),
+    )
+
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    total_score = db.Column(db.Integer, nullable=False, default=0)
+    best_score = db.Column(db.Integer, nullable=False, default=0)
+
+    user = db.relationship('User', lazy='select')
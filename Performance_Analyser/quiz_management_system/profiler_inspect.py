@@ -9,6 +9,7 @@ from flask import Flask, render_template_string
 import sqlite3
 import os
 import math
+import json
 from collections import defaultdict
 
 # ---------------- CONFIG ----------------
@@ -111,8 +112,68 @@ def calculate_thresholds(avg_vals, max_vals):
         "top_n": 5,
     }
 
+# ---------------- QUERY STATS ----------------
+# Written by the quiz app (querystats.py): one query_stats row per
+# measurement with its statement count, DB time, repeated statement shapes
+# (N+1 suspects) and slowest statements.
+def load_query_stats(cur, table):
+    tables = [r[0] for r in cur.execute(
+        "SELECT name FROM sqlite_master WHERE type='table'"
+    ).fetchall()]
+    if "query_stats" not in tables:
+        return None
+
+    rows = cur.execute(f"""
+        SELECT m.method, m.name, m.elapsed, q.queries, q.db_time, q.duplicates, q.slowest
+        FROM query_stats q JOIN {table} m ON m.ID = q.measurement_id
+    """).fetchall()
+
+    per_endpoint = defaultdict(lambda: {"requests": 0, "queries": 0, "max_queries": 0,
+                                        "db_time": 0.0, "elapsed": 0.0})
+    repeated = defaultdict(lambda: {"requests": 0, "max_count": 0, "time": 0.0})
+    slowest = []
+
+    for r in rows:
+        key = (r["method"], r["name"])
+        e = per_endpoint[key]
+        e["requests"] += 1
+        e["queries"] += r["queries"]
+        e["max_queries"] = max(e["max_queries"], r["queries"])
+        e["db_time"] += r["db_time"]
+        e["elapsed"] += parse_float(r["elapsed"]) or 0.0
+
+        for d in json.loads(r["duplicates"] or "[]"):
+            rep = repeated[key + (d["statement"],)]
+            rep["requests"] += 1
+            rep["max_count"] = max(rep["max_count"], d["count"])
+            rep["time"] += d["time"]
+
+        for st in json.loads(r["slowest"] or "[]"):
+            slowest.append({"method": r["method"], "path": r["name"], **st})
+
+    endpoints = []
+    for (method, path), e in per_endpoint.items():
+        endpoints.append({
+            "method": method,
+            "path": path,
+            "requests": e["requests"],
+            "avg_queries": e["queries"] / e["requests"],
+            "max_queries": e["max_queries"],
+            "avg_db_time": e["db_time"] / e["requests"],
+            "db_share": e["db_time"] / e["elapsed"] if e["elapsed"] else None,
+        })
+
+    n_plus_one = [{"method": method, "path": path, "statement": statement, **v}
+                  for (method, path, statement), v in repeated.items()]
+
+    return {
+        "endpoints": sorted(endpoints, key=lambda e: e["avg_db_time"], reverse=True),
+        "n_plus_one": sorted(n_plus_one, key=lambda n: (n["max_count"], n["requests"]), reverse=True),
+        "slowest": sorted(slowest, key=lambda s: s["time"], reverse=True)[:10],
+    }
+
 # ---------------- BOTTLENECK LOGIC ----------------
-def identify_bottlenecks(endpoints, endpoints_by_avg, thresholds):
+def identify_bottlenecks(endpoints, endpoints_by_avg, thresholds, query_stats=None):
     bottlenecks = []
     seen = set()
 
@@ -134,6 +195,12 @@ def identify_bottlenecks(endpoints, endpoints_by_avg, thresholds):
         if e["max"] is not None and e["max"] >= thresholds["peak_threshold"]:
             add(e, "high_peak_latency")
 
+    if query_stats:
+        suspects = {(n["method"], n["path"]) for n in query_stats["n_plus_one"]}
+        for e in endpoints:
+            if (e["method"], e["path"]) in suspects:
+                add(e, "n_plus_one_queries")
+
     for e in endpoints_by_avg[:thresholds["top_n"]]:
         add(e, "candidate_slow_endpoint")
 
@@ -165,7 +232,8 @@ def load_profiler_data(db_path):
     max_vals = [e["max"] for e in endpoints if e["max"] is not None]
 
     thresholds = calculate_thresholds(avg_vals, max_vals)
-    bottlenecks = identify_bottlenecks(endpoints, by_avg, thresholds)
+    query_stats = load_query_stats(cur, table)
+    bottlenecks = identify_bottlenecks(endpoints, by_avg, thresholds, query_stats)
 
     conn.close()
 
@@ -177,6 +245,7 @@ def load_profiler_data(db_path):
         "endpoints_by_avg": by_avg,
         "endpoints_by_max": by_max,
         "bottlenecks": bottlenecks,
+        "query_stats": query_stats,
         "sample_rows": samples,
     }
 
@@ -214,7 +283,7 @@ Mean avg latency: {{ "%.4f"|format(data.overall_mean) }} s
 </thead>
 <tbody>
 {% for b in data.bottlenecks %}
-<tr class="{% if 'candidate' in b.reason %}table-warning{% else %}table-danger{% endif %}">
+<tr class="{% if 'candidate' in b.reason or 'queries' in b.reason %}table-warning{% else %}table-danger{% endif %}">
 <td>{{ b.method }}</td>
 <td>{{ b.path }}</td>
 <td>{{ b.count }}</td>
@@ -260,6 +329,66 @@ Mean avg latency: {{ "%.4f"|format(data.overall_mean) }} s
   </div>
 </div>
 
+{% if data.query_stats %}
+<h4>Database per Endpoint</h4>
+<table class="table table-sm table-striped">
+<thead>
+<tr><th>Method</th><th>Endpoint</th><th>Requests</th><th>Avg queries</th><th>Max queries</th><th>Avg DB (ms)</th><th>DB share</th></tr>
+</thead>
+<tbody>
+{% for e in data.query_stats.endpoints %}
+<tr>
+<td>{{ e.method }}</td>
+<td>{{ e.path }}</td>
+<td>{{ e.requests }}</td>
+<td>{{ "%.1f"|format(e.avg_queries) }}</td>
+<td>{{ e.max_queries }}</td>
+<td>{{ "%.2f"|format(e.avg_db_time * 1000) }}</td>
+<td>{{ "%.0f%%"|format(e.db_share * 100) if e.db_share is not none else "N/A" }}</td>
+</tr>
+{% endfor %}
+</tbody>
+</table>
+
+<h5>Repeated Statements (N+1 suspects)</h5>
+{% if data.query_stats.n_plus_one %}
+<table class="table table-sm">
+<thead>
+<tr><th>Method</th><th>Endpoint</th><th>Requests</th><th>Max per request</th><th>Total (ms)</th><th>Statement</th></tr>
+</thead>
+<tbody>
+{% for n in data.query_stats.n_plus_one[:20] %}
+<tr class="table-warning">
+<td>{{ n.method }}</td>
+<td>{{ n.path }}</td>
+<td>{{ n.requests }}</td>
+<td>{{ n.max_count }}</td>
+<td>{{ "%.2f"|format(n.time * 1000) }}</td>
+<td><code>{{ n.statement }}</code></td>
+</tr>
+{% endfor %}
+</tbody>
+</table>
+{% else %}
+<p class="text-muted">No statement ran repeatedly within a request.</p>
+{% endif %}
+
+<h5>Slowest Statements</h5>
+<table class="table table-sm">
+<thead><tr><th>Method</th><th>Endpoint</th><th>Time (ms)</th><th>Statement</th></tr></thead>
+<tbody>
+{% for st in data.query_stats.slowest %}
+<tr>
+<td>{{ st.method }}</td>
+<td>{{ st.path }}</td>
+<td>{{ "%.2f"|format(st.time * 1000) }}</td>
+<td><code>{{ st.statement }}</code></td>
+</tr>
+{% endfor %}
+</tbody>
+</table>
+{% endif %}
+
 {% endif %}
 </div>
 </body>
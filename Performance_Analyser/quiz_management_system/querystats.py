@@ -0,0 +1,142 @@
+"""
+Per-request SQL statistics from SQLAlchemy cursor events.
+
+For every request, install() records on the engine's before/after cursor
+events:
+  - the number of statements and the time spent in them
+  - statement shapes (SQL with literals and IN lists folded to ?) run
+    N_PLUS_ONE_THRESHOLD times or more: one query per row of something
+    the request already had (the N+1 pattern)
+  - the SLOWEST_KEPT slowest statements
+
+app.py saves each request's summary() in the flask_profiler SQLite file
+(query_stats table, one row per measurement) and profiler_inspect.py
+reports it next to the endpoint timings. Statements outside a request
+(scripts, grading.ScoreWriter's thread) are not recorded.
+"""
+import json
+import re
+import time
+
+from flask import g, has_request_context
+from sqlalchemy import event
+
+N_PLUS_ONE_THRESHOLD = 3
+SLOWEST_KEPT = 5
+STATEMENT_CHARS = 500
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+def statement_shape(statement):
+    """
+    statement with whitespace collapsed and literals and IN (...) lists
+    replaced by ?, so the same query with other values has the same shape.
+    """
+    shape = _SPACES.sub(" ", statement).strip()
+    shape = _LITERALS.sub("?", shape)
+    return _IN_LIST.sub("(?)", shape)
+
+
+class RequestQueries:
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.shapes = {}
+        self.slowest = []
+
+    def record(self, statement, elapsed):
+        self.count += 1
+        self.total_time += elapsed
+
+        shape = statement_shape(statement)
+        entry = self.shapes.get(shape)
+        if entry is None:
+            self.shapes[shape] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+
+        if len(self.slowest) < SLOWEST_KEPT or elapsed > self.slowest[-1][0]:
+            self.slowest.append((elapsed, shape))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_KEPT:]
+
+    def summary(self):
+        duplicates = sorted(
+            ({"statement": shape[:STATEMENT_CHARS], "count": count, "time": total}
+             for shape, (count, total) in self.shapes.items() if count >= N_PLUS_ONE_THRESHOLD),
+            key=lambda d: d["count"], reverse=True,
+        )
+        return {
+            "queries": self.count,
+            "db_time": self.total_time,
+            "duplicates": duplicates,
+            "slowest": [{"statement": shape[:STATEMENT_CHARS], "time": elapsed}
+                        for elapsed, shape in self.slowest],
+        }
+
+
+def current():
+    """
+    The RequestQueries of the request being handled, or None outside one.
+    """
+    if not has_request_context():
+        return None
+    if "request_queries" not in g:
+        g.request_queries = RequestQueries()
+    return g.request_queries
+
+
+def install(engine):
+    """
+    Record the statements engine runs during requests.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        queries = current()
+        if queries is not None:
+            queries.record(statement, elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(exception_context):
+        # after_cursor_execute does not run for a failed statement.
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+
+# ---------------- STORAGE ----------------
+# One row per flask_profiler measurement, in the profiler's own SQLite file.
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS query_stats (
+    measurement_id INTEGER PRIMARY KEY,
+    queries INTEGER,
+    db_time REAL,
+    duplicates TEXT,
+    slowest TEXT
+)
+"""
+
+
+def create_table(connection):
+    connection.execute(CREATE_TABLE)
+    connection.commit()
+
+
+def save(connection, measurement_id, summary):
+    connection.execute(
+        "INSERT OR REPLACE INTO query_stats VALUES (?, ?, ?, ?, ?)",
+        (measurement_id, summary["queries"], summary["db_time"],
+         json.dumps(summary["duplicates"]), json.dumps(summary["slowest"])),
+    )
+    connection.commit()
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Tests import Bench_Marker.* and, through Bench_Marker.core.quiz_app, the
+# quiz app's modules; run them from anywhere.
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
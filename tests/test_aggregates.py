@@ -0,0 +1,117 @@
+import random
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from Bench_Marker.core.quiz_app import quiz_module
+
+models = quiz_module("models")
+aggregates = quiz_module("aggregates")
+Score, QuizStats, UserStats = models.Score, models.QuizStats, models.UserStats
+
+USERS = 6
+CHAPTERS = 2
+QUIZZES_PER_CHAPTER = 3
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'quiz.db'}")
+    models.enable_sqlite_foreign_keys(engine)
+    models.db.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(models.User(id=i, username=f"user{i}", password="x", full_name=f"User {i}")
+                        for i in range(1, USERS + 1))
+        session.add(models.Subject(id=1, name="Subject"))
+        for chapter_id in range(1, CHAPTERS + 1):
+            session.add(models.Chapter(id=chapter_id, name=f"Chapter {chapter_id}", subject_id=1))
+            session.add_all(models.Quiz(id=(chapter_id - 1) * QUIZZES_PER_CHAPTER + n, chapter_id=chapter_id)
+                            for n in range(1, QUIZZES_PER_CHAPTER + 1))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def _submit(session, attempts):
+    """
+    Add Score rows for (quiz_id, user_id, score) attempts, the first half
+    one at a time (record_attempt) and the rest as one batch
+    (record_attempts), as submit_quiz and grading.ScoreWriter do.
+    """
+    half = len(attempts) // 2
+    for quiz_id, user_id, score in attempts[:half]:
+        session.add(Score(quiz_id=quiz_id, user_id=user_id, total_scored=score,
+                          time_stamp_of_attempt=datetime.now()))
+        aggregates.record_attempt(session, quiz_id, user_id, score)
+        session.commit()
+    session.add_all(Score(quiz_id=quiz_id, user_id=user_id, total_scored=score,
+                          time_stamp_of_attempt=datetime.now())
+                    for quiz_id, user_id, score in attempts[half:])
+    aggregates.record_attempts(session, attempts[half:])
+    session.commit()
+
+
+def _attempts(seed, count=60):
+    rng = random.Random(seed)
+    return [(rng.randint(1, CHAPTERS * QUIZZES_PER_CHAPTER), rng.randint(1, USERS), rng.randint(0, 10))
+            for _ in range(count)]
+
+
+def _expected(session, score_key):
+    return {row[0]: tuple(row[1:]) for row in session.execute(
+        select(score_key, func.count(Score.id), func.sum(Score.total_scored), func.max(Score.total_scored))
+        .group_by(score_key)
+    )}
+
+
+def _actual(session, model, key_column, max_column):
+    return {row[0]: tuple(row[1:]) for row in session.execute(
+        select(key_column, model.attempts, model.total_score, max_column)
+    )}
+
+
+def assert_consistent(session):
+    assert _actual(session, QuizStats, QuizStats.quiz_id, QuizStats.max_score) == _expected(session, Score.quiz_id)
+    assert _actual(session, UserStats, UserStats.user_id, UserStats.best_score) == _expected(session, Score.user_id)
+    assert aggregates.stale_aggregates(session) == []
+
+
+def _delete(session, target, where):
+    affected = aggregates.affected_aggregates(session, where)
+    session.delete(target)
+    session.flush()
+    aggregates.refresh_aggregates(session, *affected)
+    session.commit()
+
+
+def test_submits_keep_aggregates_consistent(session):
+    _submit(session, _attempts(seed=0))
+    assert_consistent(session)
+
+
+def test_deleting_a_user_then_a_chapter_recomputes_aggregates(session):
+    _submit(session, _attempts(seed=1))
+
+    user_id = session.scalars(select(Score.user_id).limit(1)).one()
+    _delete(session, session.get(models.User, user_id), Score.user_id == user_id)
+    assert session.scalar(select(func.count()).where(Score.user_id == user_id)) == 0
+    assert_consistent(session)
+
+    chapter_quizzes = select(models.Quiz.id).where(models.Quiz.chapter_id == 1)
+    _delete(session, session.get(models.Chapter, 1), Score.quiz_id.in_(chapter_quizzes))
+    assert session.scalar(select(func.count(QuizStats.quiz_id)).where(
+        QuizStats.quiz_id <= QUIZZES_PER_CHAPTER)) == 0
+    assert_consistent(session)
+
+
+def test_stale_aggregates_reports_a_delete_without_refresh(session):
+    _submit(session, _attempts(seed=2))
+    user_id = session.scalars(select(Score.user_id).limit(1)).one()
+    session.delete(session.get(models.User, user_id))
+    session.commit()
+    assert any(table == QuizStats.__tablename__ for table, _ in aggregates.stale_aggregates(session))
+
+    aggregates.rebuild_aggregates(session)
+    assert_consistent(session)
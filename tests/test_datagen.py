@@ -0,0 +1,17 @@
+import sqlite3
+
+from Bench_Marker.core.quiz_app import build_quiz_database
+
+
+def test_every_user_gets_qualification_and_dob(tmp_path):
+    path = build_quiz_database(str(tmp_path / "quiz.db"), "small", seed=0,
+                               users=50, subjects=1, chapters_per_subject=1,
+                               quizzes_per_chapter=1, questions_per_quiz=2, scores=20)
+    conn = sqlite3.connect(path)
+    users, dobs, qualifications = conn.execute(
+        "SELECT count(*), count(dob), count(qualification) FROM user WHERE id > ?",
+        (conn.execute("SELECT max(id) FROM user").fetchone()[0] - 50,)
+    ).fetchone()
+    conn.close()
+    assert users == 50
+    assert dobs == qualifications == 50
@@ -0,0 +1,84 @@
+import json
+import random
+
+import pytest
+
+from Bench_Marker.core import history
+
+
+def _result(task, timestamp, commit, medians, host="bench-host", seed=0):
+    """
+    A benchmark_methods() result dict with 20 timings per method around
+    the given medians.
+    """
+    rng = random.Random(seed)
+    results = []
+    for method, centre in medians.items():
+        timings = [centre * (1 + rng.uniform(-0.01, 0.01)) for _ in range(20)]
+        results.append({"method": method, "median_time": centre, "timings": timings})
+    return {"task": task, "timestamp": timestamp, "git_commit": commit,
+            "host": host, "results": results}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "history.sqlite")
+
+
+def test_compare_reports_deltas_between_two_runs(db_path):
+    base = history.record_run(
+        _result("sort", "2026-01-01T00:00:00", "aaaa111", {"fast": 1.0, "slow": 2.0, "same": 1.0}),
+        db_path=db_path)
+    cand = history.record_run(
+        _result("sort", "2026-01-02T00:00:00", "bbbb222", {"fast": 0.5, "slow": 3.0, "same": 1.0}, seed=1),
+        db_path=db_path)
+
+    report = history.compare("sort", db_path=db_path)
+    assert (report["baseline_run"], report["candidate_run"]) == (base, cand)
+
+    rows = {row["method"]: row for row in report["methods"]}
+    assert rows["fast"]["status"] == "improvement"
+    assert rows["fast"]["change"] == pytest.approx(-0.5, abs=0.02)
+    assert rows["slow"]["status"] == "regression"
+    assert rows["slow"]["change"] == pytest.approx(0.5, abs=0.02)
+    assert rows["same"]["status"] == "unchanged"
+    assert report["regressions"] == ["slow"]
+
+
+def test_runs_resolve_by_id_commit_and_host(db_path):
+    first = history.record_run(_result("sort", "2026-01-01T00:00:00", "1234567", {"m": 1.0}),
+                               db_path=db_path)
+    second = history.record_run(_result("sort", "2026-01-02T00:00:00", "abcdef0", {"m": 1.0},
+                                        host="other-host"), db_path=db_path)
+
+    conn = history.connect(db_path)
+    try:
+        assert history._resolve_run(conn, "sort", f"#{first}") == first
+        assert history._resolve_run(conn, "sort", f"#{second}") == second
+        # Digits without "#" are a commit prefix, not a run id.
+        assert history._resolve_run(conn, "sort", "1234") == first
+        assert history._resolve_run(conn, "sort", "latest") == second
+        assert history._resolve_run(conn, "sort", "latest", host="bench-host") == first
+        with pytest.raises(LookupError):
+            history._resolve_run(conn, "sort", f"#{second}", host="bench-host")
+        with pytest.raises(LookupError):
+            history._resolve_run(conn, "other_task", f"#{first}")
+    finally:
+        conn.close()
+
+
+def test_reimporting_the_same_run_is_skipped(tmp_path, db_path):
+    results_dir = tmp_path / "results"
+    (results_dir / "sort").mkdir(parents=True)
+    run = _result("sort", "2026-01-01T00:00:00", "aaaa111", {"m": 1.0})
+    (results_dir / "sort" / "run1.json").write_text(json.dumps(run))
+    # The same run saved twice under another name is still one run.
+    (results_dir / "sort" / "run1_copy.json").write_text(json.dumps(run))
+
+    assert history.import_json_results(str(results_dir), db_path=db_path) == 1
+    assert history.import_json_results(str(results_dir), db_path=db_path) == 0
+
+    # Same task and timestamp from another host is a different run.
+    (results_dir / "sort" / "run2.json").write_text(json.dumps(dict(run, host="other-host")))
+    assert history.import_json_results(str(results_dir), db_path=db_path) == 1
+    assert len(history.list_runs("sort", db_path=db_path)) == 2
@@ -0,0 +1,60 @@
+import io
+import json
+
+import pytest
+
+from Bench_Marker.tasks.json_stream_task import iter_json_array
+
+CHUNK_SIZES = list(range(1, 101))
+
+VALID = [
+    "[]",
+    " [ ] ",
+    "[\n]",
+    "[1]",
+    "[1, 2 ,3]",
+    "[3.5, -0.25e3, true, false, null]",
+    '["a,]", "]", ",", "[1,]"]',
+    '[{"a": [1, 2], "b": "x,]"}, [[]], {}]',
+    ' [\n 1\n ,\n {"k": "v"}\n ] ',
+]
+
+INVALID = [
+    "[1,]",
+    "[1, ]",
+    "[1,\n]",
+    "[,1]",
+    "[,]",
+    "[1,,2]",
+    "[1 2]",
+    '["a" "b"]',
+    "[1",
+    "[1,",
+    "[",
+]
+
+# Valid JSON, but not an array.
+NOT_ARRAYS = ["{}", "1", '"[1]"']
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("text", VALID)
+def test_matches_json_loads(text, chunk_size):
+    assert list(iter_json_array(io.StringIO(text), chunk_size)) == json.loads(text)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("text", INVALID)
+def test_rejects_what_json_loads_rejects(text, chunk_size):
+    with pytest.raises(ValueError):
+        json.loads(text)
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(text), chunk_size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+@pytest.mark.parametrize("text", NOT_ARRAYS)
+def test_rejects_other_top_level_values(text, chunk_size):
+    json.loads(text)
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(text), chunk_size))
@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+from Bench_Marker.core.stats import (
+    bootstrap_ci,
+    mann_whitney_u,
+    percentile,
+    pick_winner,
+    remove_outliers,
+    summarize,
+)
+
+
+def _samples(centre, n, seed, spread=0.01):
+    rng = random.Random(seed)
+    return [centre * (1 + rng.uniform(-spread, spread)) for _ in range(n)]
+
+
+# ---------------- OUTLIER TRIMMING ----------------
+
+def test_remove_outliers_drops_values_outside_the_fences():
+    values = [1.0, 1.1, 1.0, 0.9, 1.05, 0.95, 50.0]
+    kept, removed = remove_outliers(values)
+    assert removed == 1
+    assert 50.0 not in kept
+    assert sorted(kept) == sorted(values[:-1])
+
+
+def test_remove_outliers_keeps_identical_samples():
+    kept, removed = remove_outliers([2.0] * 10)
+    assert kept == [2.0] * 10
+    assert removed == 0
+
+
+@pytest.mark.parametrize("values", [[], [5.0], [1.0, 100.0], [1.0, 1.0, 1000.0]])
+def test_remove_outliers_returns_tiny_samples_as_is(values):
+    kept, removed = remove_outliers(values)
+    assert kept == values
+    assert removed == 0
+
+
+# ---------------- BOOTSTRAP CI ----------------
+
+def test_bootstrap_ci_is_reproducible_with_a_seed():
+    values = _samples(1.0, 30, seed=1, spread=0.2)
+    assert bootstrap_ci(values, seed=7) == bootstrap_ci(values, seed=7)
+
+
+def test_bootstrap_ci_brackets_the_median():
+    values = _samples(1.0, 30, seed=2, spread=0.2)
+    low, high = bootstrap_ci(values, seed=3)
+    assert low <= sorted(values)[15] <= high
+    assert low < high
+
+
+def test_bootstrap_ci_of_identical_samples_is_a_point():
+    assert bootstrap_ci([3.0] * 8, seed=0) == (3.0, 3.0)
+
+
+@pytest.mark.parametrize("values", [[4.0], [1.0, 2.0], [1.0, 2.0, 9.0]])
+def test_bootstrap_ci_on_tiny_samples_stays_within_the_data(values):
+    low, high = bootstrap_ci(values, seed=0)
+    assert min(values) <= low <= high <= max(values)
+
+
+def test_summarize_single_sample():
+    summary = summarize([0.5], seed=0)
+    assert summary["median_ci"] == [0.5, 0.5]
+    assert summary["stddev"] == 0.0
+    assert summary["p99"] == percentile([0.5], 99) == 0.5
+
+
+# ---------------- MANN-WHITNEY / WINNER ----------------
+
+def test_mann_whitney_identical_samples_is_not_significant():
+    _, p = mann_whitney_u([1.0] * 10, [1.0] * 10)
+    assert p == 1.0
+
+
+def test_mann_whitney_separated_samples_is_significant():
+    _, p = mann_whitney_u(_samples(1.0, 20, seed=4), _samples(2.0, 20, seed=5))
+    assert p < 0.001
+
+
+def test_mann_whitney_requires_samples():
+    with pytest.raises(ValueError):
+        mann_whitney_u([], [1.0])
+
+
+def test_pick_winner_identical_samples_has_no_winner():
+    same = _samples(1.0, 15, seed=6)
+    winner, p_values = pick_winner({"a": same, "b": list(same)})
+    assert winner is None
+    assert p_values["b"] > 0.05
+
+
+def test_pick_winner_clearly_separated_pair():
+    winner, p_values = pick_winner({"slow": _samples(2.0, 15, seed=7),
+                                    "fast": _samples(1.0, 15, seed=8)})
+    assert winner == "fast"
+    assert p_values["slow"] < 0.05
+
+
+def test_pick_winner_needs_to_beat_every_other_method():
+    winner, _ = pick_winner({"fast": _samples(1.0, 15, seed=9),
+                             "also_fast": _samples(1.0, 15, seed=10),
+                             "slow": _samples(2.0, 15, seed=11)})
+    assert winner is None
+
+
+def test_pick_winner_tiny_samples_are_not_significant():
+    winner, _ = pick_winner({"a": [1.0, 1.1], "b": [2.0, 2.1]})
+    assert winner is None
+
+
+def test_pick_winner_single_method():
+    assert pick_winner({"only": [1.0]}) == ("only", {})
+    assert pick_winner({}) == (None, {})